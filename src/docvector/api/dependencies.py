@@ -1,10 +1,13 @@
 """FastAPI dependencies."""
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
+from arq import ArqRedis
 from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from docvector.cache import QueryCache, RedisCache
+from docvector.core import settings
 from docvector.db import get_db_session
 from docvector.services import SearchService, SourceService
 
@@ -20,6 +23,29 @@ async def get_search_service(request: Request) -> SearchService:
     return request.app.state.search_service
 
 
+async def get_query_cache(request: Request) -> QueryCache:
+    """Get search query cache dependency (shared instance from app state)."""
+    query_cache = getattr(request.app.state, "query_cache", None)
+    if query_cache is None:
+        # App started without the lifespan (e.g. in tests); create it on first use
+        query_cache = QueryCache(
+            max_size=settings.search_cache_max_size,
+            default_ttl=settings.search_cache_ttl,
+        )
+        request.app.state.query_cache = query_cache
+    return query_cache
+
+
+async def get_redis_cache(request: Request) -> RedisCache:
+    """Get Redis cache dependency (initialized at startup)."""
+    return request.app.state.redis_cache
+
+
+async def get_ingest_queue(request: Request) -> Optional[ArqRedis]:
+    """Get ingestion job queue dependency (None if Redis was unavailable)."""
+    return getattr(request.app.state, "ingest_queue", None)
+
+
 async def get_source_service(
     session: AsyncSession = get_session,
 ) -> SourceService:
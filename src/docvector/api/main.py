@@ -1,18 +1,19 @@
 """Main FastAPI application."""
 
+import asyncio
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from docvector.core import DocVectorException, get_logger, settings, setup_logging
-from docvector.db import close_db
+from docvector.db import close_db, init_db, warm_pool
+from docvector.embeddings import close_local_embedders
+from docvector.utils.http_client import close_http_client
 
-# Setup logging
-setup_logging()
 logger = get_logger(__name__)
 
 
@@ -24,25 +25,75 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     Handles startup and shutdown events.
     """
     # Startup
+    setup_logging()
     logger.info(
         "Starting DocVector API",
         version=settings.app_version,
         environment=settings.environment,
     )
 
+    # Create the engine up front, then open pooled connections before the
+    # first request needs them
+    init_db()
+    if settings.db_pool_prewarm:
+        try:
+            await warm_pool()
+        except Exception as e:
+            logger.warning("Database pool pre-warm failed", error=str(e))
+
+    # Connect Redis once so cache ops skip per-call initialization
+    from docvector.cache import RedisCache
+
+    redis_cache = RedisCache()
+    await redis_cache.initialize()
+    app.state.redis_cache = redis_cache
+
     # Initialize and cache search service at startup
     from docvector.services import SearchService
 
-    search_service = SearchService()
+    search_service = SearchService(redis_cache=redis_cache)
     await search_service.initialize()
     app.state.search_service = search_service
     logger.info("Search service initialized and cached")
 
+    # In-process cache for repeated search queries
+    from docvector.cache import QueryCache
+
+    app.state.query_cache = QueryCache(
+        max_size=settings.search_cache_max_size,
+        default_ttl=settings.search_cache_ttl,
+        redis_cache=redis_cache,
+    )
+
+    # Job queue for source ingestion, only when an arq worker is deployed;
+    # otherwise ingestion and PoW challenge purging run in-process
+    app.state.ingest_queue = None
+    maintenance_task = None
+    if settings.ingest_use_worker:
+        from arq import create_pool
+        from arq.connections import RedisSettings
+
+        try:
+            app.state.ingest_queue = await create_pool(RedisSettings.from_dsn(settings.redis_url))
+        except Exception as e:
+            logger.warning("Ingestion queue unavailable, using in-process tasks", error=str(e))
+    else:
+        from docvector.workers import purge_pow_challenges_periodically
+
+        maintenance_task = asyncio.create_task(purge_pow_challenges_periodically())
+
     yield
 
     # Shutdown
     logger.info("Shutting down DocVector API")
+    if maintenance_task is not None:
+        maintenance_task.cancel()
     await search_service.close()
+    await redis_cache.close()
+    if app.state.ingest_queue is not None:
+        await app.state.ingest_queue.aclose()
+    await close_local_embedders()
+    await close_http_client()
     await close_db()
 
 
@@ -55,10 +106,12 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    # Serialize every response with orjson unless a route overrides it
+    default_response_class=ORJSONResponse,
 )
 
 # Import routers after app creation
-from .routes import ingestion, issues, libraries, qa, search, sources  # noqa: E402
+from .routes import health, ingestion, issues, libraries, qa, search, sources  # noqa: E402
 
 # Add middleware
 app.add_middleware(
@@ -86,7 +139,7 @@ async def docvector_exception_handler(request, exc: DocVectorException):
         error_message=exc.message,
         details=exc.details,
     )
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=400 if exc.code == "VALIDATION_ERROR" else 500,
         content=exc.to_dict(),
     )
@@ -96,7 +149,7 @@ async def docvector_exception_handler(request, exc: DocVectorException):
 async def general_exception_handler(request, exc: Exception):
     """Handle general exceptions."""
     logger.exception("Unhandled exception", error=str(exc))
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "success": False,
@@ -121,36 +174,8 @@ async def root():
     }
 
 
-# Health check endpoint
-@app.get("/health")
-@app.get("/api/v1/health")
-async def health_check():
-    """
-    Health check endpoint.
-
-    Returns system health status and dependency checks.
-    """
-    from datetime import datetime
-
-    # TODO: Add actual dependency health checks
-    # - PostgreSQL connection test
-    # - Redis connection test
-    # - Qdrant connection test
-
-    return {
-        "status": "healthy",
-        "version": settings.app_version,
-        "environment": settings.environment,
-        "timestamp": datetime.utcnow().isoformat(),
-        "dependencies": {
-            "postgres": {"status": "unknown"},
-            "redis": {"status": "unknown"},
-            "qdrant": {"status": "unknown"},
-        },
-    }
-
-
 # Include routers
+app.include_router(health.router, tags=["health"])
 app.include_router(search.router, prefix="/api/v1", tags=["search"])
 app.include_router(sources.router, prefix="/api/v1/sources", tags=["sources"])
 app.include_router(ingestion.router, prefix="/api/v1", tags=["ingestion"])
@@ -3,15 +3,28 @@
 from datetime import datetime
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from docvector.api.schemas import HealthResponse
 from docvector.core import settings
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
+# Static part of the health payload, built once; only the timestamp changes per call
+_HEALTH_TEMPLATE = {
+    "status": "healthy",
+    "version": settings.app_version,
+    "environment": settings.environment,
+    "dependencies": {
+        "postgres": {"status": "unknown"},
+        "redis": {"status": "unknown"},
+        "qdrant": {"status": "unknown"},
+    },
+}
 
-@router.get("/health", response_model=HealthResponse)
-@router.get("/api/v1/health", response_model=HealthResponse)
+
+@router.get("/health", responses={200: {"model": HealthResponse}})
+@router.get("/api/v1/health", responses={200: {"model": HealthResponse}})
 async def health_check():
     """
     Health check endpoint.
@@ -23,14 +36,4 @@ async def health_check():
     # - Redis connection test
     # - Qdrant connection test
 
-    return HealthResponse(
-        status="healthy",
-        version=settings.app_version,
-        environment=settings.environment,
-        timestamp=datetime.utcnow(),
-        dependencies={
-            "postgres": {"status": "unknown"},
-            "redis": {"status": "unknown"},
-            "qdrant": {"status": "unknown"},
-        },
-    )
+    return ORJSONResponse({**_HEALTH_TEMPLATE, "timestamp": datetime.utcnow().isoformat()})
@@ -1,13 +1,19 @@
 """Ingestion API routes."""
 
+from typing import Optional
+
+from arq import ArqRedis
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from docvector.api.dependencies import get_session
+from docvector.api.dependencies import get_ingest_queue, get_query_cache, get_session
 from docvector.api.schemas import IngestionResponse, IngestSourceRequest, IngestUrlRequest
+from docvector.cache import QueryCache
 from docvector.core import DocVectorException, get_logger
+from docvector.db import get_db_session
 from docvector.db.repositories import SourceRepository
 from docvector.services import IngestionService
+from docvector.workers import run_source_ingestion
 
 logger = get_logger(__name__)
 
@@ -19,11 +25,14 @@ async def ingest_source(
     request: IngestSourceRequest,
     background_tasks: BackgroundTasks,
     session: AsyncSession = Depends(get_session),
+    query_cache: QueryCache = Depends(get_query_cache),
+    ingest_queue: Optional[ArqRedis] = Depends(get_ingest_queue),
 ):
     """
     Ingest all documents from a source.
 
-    This endpoint triggers ingestion in the background and returns immediately.
+    This endpoint starts ingestion in the background (on the arq worker when
+    ingest_use_worker is enabled) and returns immediately.
     The source will be crawled and all discovered documents will be indexed.
     """
     try:
@@ -34,27 +43,41 @@ async def ingest_source(
         if not source:
             raise HTTPException(status_code=404, detail="Source not found")
 
-        # Trigger ingestion in background
-        async def run_ingestion():
-            try:
-                ingestion_service = IngestionService(session)
-                await ingestion_service.ingest_source(
-                    source=source,
-                    access_level=request.access_level,
-                )
-                await ingestion_service.close()
-            except Exception as e:
-                logger.error(
-                    "Background ingestion failed",
-                    source_id=str(source.id),
-                    error=str(e),
-                )
-
-        background_tasks.add_task(run_ingestion)
+        source_id = source.id
+        source_name = source.name
+
+        if ingest_queue is not None:
+            # Hand off to the arq worker so ingestion never runs on the API event loop
+            await ingest_queue.enqueue_job(
+                "ingest_source_job",
+                source_id=str(source_id),
+                access_level=request.access_level,
+                batch_size=request.batch_size,
+            )
+        else:
+            # Fallback: run in-process with its own session. The closure only
+            # captures plain values, never the request session or its ORM objects.
+            async def run_ingestion():
+                try:
+                    await run_source_ingestion(
+                        source_id=source_id,
+                        access_level=request.access_level,
+                        batch_size=request.batch_size,
+                    )
+                    # New chunks change search results; drop stale cached queries
+                    await query_cache.invalidate()
+                except Exception as e:
+                    logger.error(
+                        "Background ingestion failed",
+                        source_id=str(source_id),
+                        error=str(e),
+                    )
+
+            background_tasks.add_task(run_ingestion)
 
         return IngestionResponse(
             success=True,
-            message=f"Ingestion started for source: {source.name}",
+            message=f"Ingestion started for source: {source_name}",
         )
 
     except HTTPException:
@@ -69,7 +92,7 @@ async def ingest_source(
 @router.post("/ingest/url", response_model=IngestionResponse, status_code=201)
 async def ingest_url(
     request: IngestUrlRequest,
-    session: AsyncSession = Depends(get_session),
+    query_cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Ingest a single URL.
@@ -82,21 +105,27 @@ async def ingest_url(
     - Index a private internal doc: access_level="private"
     """
     try:
-        # Get source
-        source_repo = SourceRepository(session)
-        source = await source_repo.get_by_id(request.source_id)
+        # Use a dedicated session so the pool slot is released as soon as
+        # ingestion finishes rather than when the response is sent
+        async with get_db_session() as session:
+            source_repo = SourceRepository(session)
+            source = await source_repo.get_by_id(request.source_id)
 
-        if not source:
-            raise HTTPException(status_code=404, detail="Source not found")
+            if not source:
+                raise HTTPException(status_code=404, detail="Source not found")
 
-        # Ingest URL
-        ingestion_service = IngestionService(session)
-        document = await ingestion_service.ingest_url(
-            source=source,
-            url=str(request.url),
-            access_level=request.access_level,
-        )
-        await ingestion_service.close()
+            # Ingest URL
+            ingestion_service = IngestionService(session)
+            try:
+                document = await ingestion_service.ingest_url(
+                    source=source,
+                    url=str(request.url),
+                    access_level=request.access_level,
+                )
+            finally:
+                await ingestion_service.close()
+
+        await query_cache.invalidate()
 
         return IngestionResponse(
             success=True,
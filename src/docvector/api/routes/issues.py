@@ -1,6 +1,6 @@
 """Issue API routes - Issues and Solutions."""
 
-from typing import Optional
+from typing import Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -70,8 +70,8 @@ async def list_issues(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     library_id: Optional[UUID] = None,
-    status: Optional[str] = Query(None, pattern="^(open|confirmed|resolved|closed|duplicate)$"),
-    severity: Optional[str] = Query(None, pattern="^(critical|major|minor|trivial)$"),
+    status: Optional[Literal["open", "confirmed", "resolved", "closed", "duplicate"]] = None,
+    severity: Optional[Literal["critical", "major", "minor", "trivial"]] = None,
     author_id: Optional[str] = None,
     session: AsyncSession = Depends(get_session),
 ):
@@ -103,8 +103,8 @@ async def search_issues(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     library_id: Optional[UUID] = None,
-    status: Optional[str] = Query(None, pattern="^(open|confirmed|resolved|closed|duplicate)$"),
-    severity: Optional[str] = Query(None, pattern="^(critical|major|minor|trivial)$"),
+    status: Optional[Literal["open", "confirmed", "resolved", "closed", "duplicate"]] = None,
+    severity: Optional[Literal["critical", "major", "minor", "trivial"]] = None,
     session: AsyncSession = Depends(get_session),
 ):
     """Search issues by text."""
@@ -1,6 +1,6 @@
 """Q&A API routes - Questions, Answers, Tags, Votes."""
 
-from typing import List, Optional
+from typing import List, Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
@@ -119,7 +119,7 @@ async def list_questions(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
     library_id: Optional[UUID] = None,
-    status: Optional[str] = Query(None, pattern="^(open|answered|closed)$"),
+    status: Optional[Literal["open", "answered", "closed"]] = None,
     author_id: Optional[str] = None,
     session: AsyncSession = Depends(get_session),
 ):
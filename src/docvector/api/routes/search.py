@@ -1,60 +1,196 @@
 """Search API routes."""
 
+from typing import AsyncIterator, Dict, List, Optional, Union
+
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from pydantic import TypeAdapter
 
-from docvector.api.dependencies import get_search_service
-from docvector.api.schemas import SearchRequest, SearchResponse, SearchResultSchema
-from docvector.core import get_logger
+from docvector.api.dependencies import get_query_cache, get_search_service
+from docvector.api.schemas import (
+    BatchSearchRequest,
+    BatchSearchResponse,
+    ColumnarSearchResponse,
+    SearchRequest,
+    SearchResponse,
+    SearchResultSchema,
+)
+from docvector.cache import QueryCache
+from docvector.core import get_logger, settings
 from docvector.services import SearchService
 
 logger = get_logger(__name__)
 
 router = APIRouter()
 
+_RESULTS_ADAPTER = TypeAdapter(List[SearchResultSchema])
+_RESULT_FIELDS = tuple(SearchResultSchema.model_fields)
+
+
+def _build_filters(request: SearchRequest) -> Optional[Dict]:
+    """Merge explicit filters with the request's shortcut filter fields."""
+    filters = {
+        **(request.filters or {}),
+        **{
+            key: value
+            for key, value in (
+                ("access_level", request.access_level),
+                ("topics", request.topic),
+                ("library_id", request.library_id),
+                ("version", request.version),
+            )
+            if value
+        },
+    }
+    return filters or None
+
+
+def _search_params(request: SearchRequest) -> Dict:
+    """SearchService.search keyword arguments for a request."""
+    return {
+        "query": request.query,
+        "limit": request.limit,
+        "search_type": request.search_type,
+        "filters": _build_filters(request),
+        "score_threshold": request.score_threshold,
+        "use_reranking": request.use_reranking,
+        "max_tokens": request.max_tokens,
+    }
+
+
+def _validate_results(raw_results: List[Dict]) -> List[Dict]:
+    """
+    Validate results in one pass and keep plain dicts, so cache hits can be
+    returned without rebuilding models.
+    """
+    return _RESULTS_ADAPTER.dump_python(_RESULTS_ADAPTER.validate_python(raw_results))
+
 
-@router.post("/search", response_model=SearchResponse)
+def _render(request: SearchRequest, results: List[Dict]) -> Dict:
+    """Build the response body for one query (row- or column-oriented)."""
+    if request.columnar:
+        return {
+            "success": True,
+            "query": request.query,
+            "columns": {f: [r[f] for r in results] for f in _RESULT_FIELDS},
+            "total": len(results),
+            "search_type": request.search_type,
+        }
+
+    return {
+        "success": True,
+        "query": request.query,
+        "results": results,
+        "total": len(results),
+        "search_type": request.search_type,
+    }
+
+
+async def _stream_results(request: SearchRequest, results: List[Dict]) -> AsyncIterator[bytes]:
+    """
+    Yield a row-oriented search response piece by piece.
+
+    Each result is serialized on its own, so large bodies are written to the
+    socket as they are encoded instead of being built as one buffer.
+    """
+    yield b'{"success":true,"query":' + orjson.dumps(request.query) + b',"results":['
+    for i, result in enumerate(results):
+        yield (b"," if i else b"") + orjson.dumps(result)
+    yield (
+        b'],"total":'
+        + orjson.dumps(len(results))
+        + b',"search_type":'
+        + orjson.dumps(request.search_type)
+        + b"}"
+    )
+
+
+@router.post("/search", response_model=Union[SearchResponse, ColumnarSearchResponse])
 async def search(
     request: SearchRequest,
     search_service: SearchService = Depends(get_search_service),
+    query_cache: QueryCache = Depends(get_query_cache),
 ):
     """
     Search for documents.
 
     Performs vector similarity search or hybrid search across indexed documents.
+    Repeated queries are served from an in-process cache (see X-Cache header).
+    With ``columnar=true`` results are returned as ``{field: [values...]}``,
+    which avoids repeating every key per row. Large row-oriented responses
+    are streamed one result at a time.
     """
     try:
-        # Build filters
-        filters = request.filters or {}
-        if request.access_level:
-            filters["access_level"] = request.access_level
-        if request.topic:
-            filters["topics"] = request.topic
-        if request.library_id:
-            filters["library_id"] = request.library_id
-        if request.version:
-            filters["version"] = request.version
-
-        results = await search_service.search(
-            query=request.query,
-            limit=request.limit,
-            search_type=request.search_type,
-            filters=filters if filters else None,
-            score_threshold=request.score_threshold,
-            use_reranking=request.use_reranking,
-            max_tokens=request.max_tokens,
-        )
+        params = _search_params(request)
+        cache_key = QueryCache.make_key(**params)
 
-        # Convert to schema
-        result_schemas = [SearchResultSchema(**r) for r in results]
+        results = None
+        if settings.search_cache_ttl > 0:
+            results = await query_cache.get(cache_key)
 
-        return SearchResponse(
-            success=True,
-            query=request.query,
-            results=result_schemas,
-            total=len(result_schemas),
-            search_type=request.search_type,
-        )
+        if results is not None:
+            cache_status = "HIT"
+        else:
+            cache_status = "MISS"
+            results = _validate_results(await search_service.search(**params))
+            if settings.search_cache_ttl > 0:
+                await query_cache.set(cache_key, results)
+
+        headers = {"X-Cache": cache_status}
+
+        if not request.columnar and len(results) >= settings.search_stream_min_results:
+            return StreamingResponse(
+                _stream_results(request, results),
+                media_type="application/json",
+                headers=headers,
+            )
+
+        # Results are already validated; skip response_model re-validation
+        return ORJSONResponse(_render(request, results), headers=headers)
 
     except Exception as e:
         logger.error("Search failed", error=str(e), query=request.query)
         raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/search/batch", response_model=BatchSearchResponse)
+async def search_batch(
+    request: BatchSearchRequest,
+    search_service: SearchService = Depends(get_search_service),
+    query_cache: QueryCache = Depends(get_query_cache),
+):
+    """
+    Run several searches in one request.
+
+    Cached queries are answered from the query cache; the rest are embedded
+    together and sent to the vector database as a single batch.
+    """
+    try:
+        params = [_search_params(q) for q in request.queries]
+        cache_keys = [QueryCache.make_key(**p) for p in params]
+
+        results: List[Optional[List[Dict]]] = [None] * len(params)
+        if settings.search_cache_ttl > 0:
+            for i, key in enumerate(cache_keys):
+                results[i] = await query_cache.get(key)
+
+        misses = [i for i, r in enumerate(results) if r is None]
+        if misses:
+            batch_results = await search_service.search_batch([params[i] for i in misses])
+            for i, raw_results in zip(misses, batch_results):
+                results[i] = _validate_results(raw_results)
+                if settings.search_cache_ttl > 0:
+                    await query_cache.set(cache_keys[i], results[i])
+
+        return ORJSONResponse(
+            {
+                "success": True,
+                "results": [_render(q, r) for q, r in zip(request.queries, results)],
+            },
+            headers={"X-Cache-Hits": str(len(params) - len(misses))},
+        )
+
+    except Exception as e:
+        logger.error("Batch search failed", error=str(e), queries=len(request.queries))
+        raise HTTPException(status_code=500, detail=str(e)) from e
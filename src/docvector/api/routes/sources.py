@@ -4,16 +4,21 @@ from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from docvector.api.dependencies import get_session
+from docvector.api.dependencies import get_query_cache, get_session
 from docvector.api.schemas import SourceCreate, SourceResponse, SourceUpdate
+from docvector.cache import QueryCache
 from docvector.core import DocVectorException, get_logger
 from docvector.services import SourceService
 
 logger = get_logger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Columns needed for SourceResponse, fetched directly for list endpoints
+_SOURCE_RESPONSE_COLUMNS = list(SourceResponse.model_fields)
 
 
 @router.post("", response_model=SourceResponse, status_code=201)
@@ -49,9 +54,15 @@ async def list_sources(
     """List all documentation sources."""
     try:
         service = SourceService(session)
-        sources = await service.list_sources(limit=limit, offset=offset)
+        rows = await service.list_source_rows(
+            columns=_SOURCE_RESPONSE_COLUMNS,
+            limit=limit,
+            offset=offset,
+        )
 
-        return [SourceResponse.model_validate(s) for s in sources]
+        # Rows come straight from the table with the response's columns;
+        # orjson serializes UUID/datetime natively, so skip model validation
+        return ORJSONResponse(rows)
 
     except Exception as e:
         logger.error("Failed to list sources", error=str(e))
@@ -107,6 +118,7 @@ async def update_source(
 async def delete_source(
     source_id: UUID,
     session: AsyncSession = Depends(get_session),
+    query_cache: QueryCache = Depends(get_query_cache),
 ):
     """Delete a documentation source."""
     try:
@@ -116,6 +128,9 @@ async def delete_source(
         if not success:
             raise HTTPException(status_code=404, detail="Source not found")
 
+        # Cached search results may still contain the deleted documents
+        await query_cache.invalidate()
+
     except DocVectorException as e:
         raise HTTPException(status_code=404, detail=e.to_dict()) from e
     except HTTPException:
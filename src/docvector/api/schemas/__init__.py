@@ -41,13 +41,23 @@ from .qa import (
     VoteCreate,
     VoteResponse,
 )
-from .search import SearchRequest, SearchResponse, SearchResultSchema
+from .search import (
+    BatchSearchRequest,
+    BatchSearchResponse,
+    ColumnarSearchResponse,
+    SearchRequest,
+    SearchResponse,
+    SearchResultSchema,
+)
 from .source import SourceCreate, SourceResponse, SourceUpdate
 
 __all__ = [
     # Search
     "SearchRequest",
     "SearchResponse",
+    "ColumnarSearchResponse",
+    "BatchSearchRequest",
+    "BatchSearchResponse",
     "SearchResultSchema",
     # Source
     "SourceCreate",
@@ -1,6 +1,6 @@
 """Ingestion API schemas."""
 
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field, HttpUrl
@@ -10,10 +10,15 @@ class IngestSourceRequest(BaseModel):
     """Request to ingest entire source."""
 
     source_id: UUID = Field(..., description="Source ID to ingest")
-    access_level: str = Field(
+    access_level: Literal["public", "private"] = Field(
         "private",
         description="Access level: 'public' or 'private'",
-        pattern="^(public|private)$",
+    )
+    batch_size: Optional[int] = Field(
+        None,
+        description="Chunks to embed per provider call (defaults to server setting)",
+        ge=1,
+        le=1024,
     )
 
 
@@ -22,10 +27,9 @@ class IngestUrlRequest(BaseModel):
 
     source_id: UUID = Field(..., description="Source ID this URL belongs to")
     url: HttpUrl = Field(..., description="URL to ingest")
-    access_level: str = Field(
+    access_level: Literal["public", "private"] = Field(
         "private",
         description="Access level: 'public' or 'private'",
-        pattern="^(public|private)$",
     )
 
 
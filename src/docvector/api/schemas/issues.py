@@ -1,7 +1,7 @@
 """Issue API schemas - Issues and Solutions."""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -32,16 +32,14 @@ class IssueCreate(BaseModel):
 
     # Author
     author_id: str = Field(..., min_length=1, max_length=255, description="Author identifier")
-    author_type: str = Field(
+    author_type: Literal["agent", "user"] = Field(
         "agent",
-        pattern="^(agent|user)$",
         description="Author type: agent or user",
     )
 
     # Classification
-    severity: Optional[str] = Field(
+    severity: Optional[Literal["critical", "major", "minor", "trivial"]] = Field(
         None,
-        pattern="^(critical|major|minor|trivial)$",
         description="Issue severity",
     )
     tags: Optional[List[str]] = Field(None, description="Tag names to associate")
@@ -63,14 +61,8 @@ class IssueUpdate(BaseModel):
     code_snippet: Optional[str] = None
     error_message: Optional[str] = None
     environment: Optional[Dict] = None
-    status: Optional[str] = Field(
-        None,
-        pattern="^(open|confirmed|resolved|closed|duplicate)$",
-    )
-    severity: Optional[str] = Field(
-        None,
-        pattern="^(critical|major|minor|trivial)$",
-    )
+    status: Optional[Literal["open", "confirmed", "resolved", "closed", "duplicate"]] = None
+    severity: Optional[Literal["critical", "major", "minor", "trivial"]] = None
     tags: Optional[List[str]] = None
 
 
@@ -143,9 +135,8 @@ class SolutionCreate(BaseModel):
     description: str = Field(..., min_length=10, description="Solution description (markdown supported)")
     code_snippet: Optional[str] = Field(None, description="Code that fixes the issue")
     author_id: str = Field(..., min_length=1, max_length=255, description="Author identifier")
-    author_type: str = Field(
+    author_type: Literal["agent", "user"] = Field(
         "agent",
-        pattern="^(agent|user)$",
         description="Author type: agent or user",
     )
     metadata: Optional[Dict] = Field(default_factory=dict, description="Additional metadata")
@@ -208,9 +199,8 @@ class IssueSearchRequest(BaseModel):
     """Search issues request."""
 
     query: str = Field(..., min_length=1, description="Search query")
-    search_type: str = Field(
+    search_type: Literal["all", "issues", "solutions"] = Field(
         "all",
-        pattern="^(all|issues|solutions)$",
         description="What to search: all, issues, solutions",
     )
     library_id: Optional[UUID] = Field(None, description="Filter by library")
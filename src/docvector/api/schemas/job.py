@@ -1,7 +1,7 @@
 """Job API schemas."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -10,10 +10,9 @@ from pydantic import BaseModel, Field
 class JobCreate(BaseModel):
     """Request to create a new job."""
 
-    type: str = Field(
+    type: Literal["crawl_source", "crawl_url", "reindex"] = Field(
         ...,
         description="Job type: 'crawl_source', 'crawl_url', or 'reindex'",
-        pattern="^(crawl_source|crawl_url|reindex)$",
     )
     source_id: Optional[UUID] = Field(None, description="Source ID for the job")
     config: Dict[str, Any] = Field(
@@ -72,10 +71,9 @@ class CrawlSourceRequest(BaseModel):
     """Request to create a crawl source job."""
 
     source_id: UUID = Field(..., description="Source ID to crawl")
-    access_level: str = Field(
+    access_level: Literal["public", "private"] = Field(
         "private",
         description="Access level: 'public' or 'private'",
-        pattern="^(public|private)$",
     )
     priority: int = Field(0, ge=-10, le=10, description="Job priority")
     max_depth: Optional[int] = Field(None, ge=1, le=10, description="Maximum crawl depth")
@@ -87,9 +85,8 @@ class CrawlUrlRequest(BaseModel):
 
     source_id: UUID = Field(..., description="Source ID this URL belongs to")
     url: str = Field(..., description="URL to crawl")
-    access_level: str = Field(
+    access_level: Literal["public", "private"] = Field(
         "private",
         description="Access level: 'public' or 'private'",
-        pattern="^(public|private)$",
     )
     priority: int = Field(0, ge=-10, le=10, description="Job priority")
@@ -1,7 +1,7 @@
 """Q&A API schemas - Questions, Answers, Tags."""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -47,9 +47,8 @@ class QuestionCreate(BaseModel):
     library_id: Optional[UUID] = Field(None, description="Associated library ID")
     library_version: Optional[str] = Field(None, max_length=50, description="Library version")
     author_id: str = Field(..., min_length=1, max_length=255, description="Author identifier")
-    author_type: str = Field(
+    author_type: Literal["agent", "user"] = Field(
         "agent",
-        pattern="^(agent|user)$",
         description="Author type: agent or user",
     )
     tags: Optional[List[str]] = Field(None, description="Tag names to associate")
@@ -61,7 +60,7 @@ class QuestionUpdate(BaseModel):
 
     title: Optional[str] = Field(None, min_length=10, max_length=500)
     body: Optional[str] = Field(None, min_length=20)
-    status: Optional[str] = Field(None, pattern="^(open|answered|closed)$")
+    status: Optional[Literal["open", "answered", "closed"]] = None
     tags: Optional[List[str]] = None
 
 
@@ -109,9 +108,8 @@ class AnswerCreate(BaseModel):
     question_id: UUID = Field(..., description="Question ID to answer")
     body: str = Field(..., min_length=10, description="Answer body (markdown supported)")
     author_id: str = Field(..., min_length=1, max_length=255, description="Author identifier")
-    author_type: str = Field(
+    author_type: Literal["agent", "user"] = Field(
         "agent",
-        pattern="^(agent|user)$",
         description="Author type: agent or user",
     )
     metadata: Optional[Dict] = Field(default_factory=dict, description="Additional metadata")
@@ -158,16 +156,14 @@ class AnswerListResponse(BaseModel):
 class VoteCreate(BaseModel):
     """Create vote request."""
 
-    target_type: str = Field(
+    target_type: Literal["question", "answer", "issue", "solution"] = Field(
         ...,
-        pattern="^(question|answer|issue|solution)$",
         description="What to vote on",
     )
     target_id: UUID = Field(..., description="ID of the item to vote on")
     voter_id: str = Field(..., min_length=1, max_length=255, description="Voter identifier")
-    voter_type: str = Field(
+    voter_type: Literal["agent", "user"] = Field(
         "agent",
-        pattern="^(agent|user)$",
         description="Voter type: agent or user",
     )
     value: int = Field(..., ge=-1, le=1, description="Vote value: 1 (upvote) or -1 (downvote)")
@@ -195,9 +191,8 @@ class QASearchRequest(BaseModel):
     """Search Q&A content request."""
 
     query: str = Field(..., min_length=1, description="Search query")
-    search_type: str = Field(
+    search_type: Literal["all", "questions", "answers"] = Field(
         "all",
-        pattern="^(all|questions|answers)$",
         description="What to search: all, questions, answers",
     )
     library_id: Optional[UUID] = Field(None, description="Filter by library")
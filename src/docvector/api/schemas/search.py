@@ -1,6 +1,6 @@
 """Search API schemas."""
 
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -10,15 +10,13 @@ class SearchRequest(BaseModel):
 
     query: str = Field(..., description="Search query text", min_length=1)
     limit: int = Field(10, description="Maximum number of results", ge=1, le=100)
-    search_type: str = Field(
+    search_type: Literal["vector", "hybrid"] = Field(
         "hybrid",
         description="Search type: 'vector', 'hybrid'",
-        pattern="^(vector|hybrid)$",
     )
-    access_level: Optional[str] = Field(
+    access_level: Optional[Literal["public", "private"]] = Field(
         None,
         description="Filter by access level: 'public', 'private', or None for all",
-        pattern="^(public|private)$",
     )
     filters: Optional[Dict] = Field(None, description="Optional filters")
     score_threshold: Optional[float] = Field(
@@ -39,6 +37,10 @@ class SearchRequest(BaseModel):
     version: Optional[str] = Field(
         None, description="Filter by library version (Context7-style version filtering)"
     )
+    columnar: bool = Field(
+        False,
+        description="Return results column-wise ({field: [values...]}) instead of a list of objects",
+    )
 
 
 class SearchResultSchema(BaseModel):
@@ -68,3 +70,28 @@ class SearchResponse(BaseModel):
     results: List[SearchResultSchema]
     total: int
     search_type: str
+
+
+class ColumnarSearchResponse(BaseModel):
+    """Search response with results laid out column-wise (one list per field)."""
+
+    success: bool = True
+    query: str
+    columns: Dict[str, List]
+    total: int
+    search_type: str
+
+
+class BatchSearchRequest(BaseModel):
+    """Several search requests executed together."""
+
+    queries: List[SearchRequest] = Field(
+        ..., description="Searches to run", min_length=1, max_length=50
+    )
+
+
+class BatchSearchResponse(BaseModel):
+    """Batch search response (one entry per query, in request order)."""
+
+    success: bool = True
+    results: List[Union[SearchResponse, ColumnarSearchResponse]]
@@ -1,7 +1,7 @@
 """Source API schemas."""
 
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, Literal, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -11,10 +11,9 @@ class SourceCreate(BaseModel):
     """Create source request."""
 
     name: str = Field(..., description="Source name", min_length=1, max_length=255)
-    type: str = Field(
+    type: Literal["web", "git", "file", "api"] = Field(
         ...,
         description="Source type: web, git, file, api",
-        pattern="^(web|git|file|api)$",
     )
     config: Dict = Field(..., description="Source configuration")
     sync_frequency: Optional[str] = Field(
@@ -28,7 +27,7 @@ class SourceUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     config: Optional[Dict] = None
     sync_frequency: Optional[str] = None
-    status: Optional[str] = Field(None, pattern="^(active|inactive|error)$")
+    status: Optional[Literal["active", "inactive", "error"]] = None
 
 
 class SourceResponse(BaseModel):
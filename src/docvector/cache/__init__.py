@@ -1,5 +1,6 @@
 """Caching layer."""
 
+from .query_cache import SEARCH_CACHE_VERSION_KEY, QueryCache
 from .redis_cache import RedisCache
 
-__all__ = ["RedisCache"]
+__all__ = ["QueryCache", "RedisCache", "SEARCH_CACHE_VERSION_KEY"]
@@ -0,0 +1,144 @@
+"""In-process LRU + TTL cache for search results."""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from docvector.core import get_logger
+
+from .redis_cache import RedisCache
+
+logger = get_logger(__name__)
+
+# Redis counter bumped on every full invalidation; entries cached under an
+# older generation are stale in every process that shares the Redis
+SEARCH_CACHE_VERSION_KEY = "search_cache_version"
+
+
+@dataclass
+class QueryCache:
+    """
+    Async-safe LRU cache with per-entry expiry.
+
+    Sits in front of the search backend so repeated queries are answered
+    from memory instead of re-running embedding + ANN search. With a
+    redis_cache, full invalidations are shared through a generation counter
+    in Redis, so ingestion in another process or the worker also drops
+    this process's entries.
+    """
+
+    max_size: int = 1024
+    default_ttl: float = 300.0
+    redis_cache: Optional[RedisCache] = field(default=None, repr=False)
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+    _entries: "OrderedDict[Hashable, Tuple[float, int, Any]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    @staticmethod
+    def make_key(
+        query: str,
+        limit: int,
+        search_type: str,
+        filters: Optional[Dict],
+        score_threshold: Optional[float],
+        use_reranking: bool,
+        max_tokens: Optional[int],
+    ) -> Tuple:
+        """
+        Build a hashable cache key from search parameters.
+
+        Filters may contain nested lists/dicts, so they are serialized with
+        sorted keys rather than wrapped in a frozenset.
+        """
+        filters_key = json.dumps(filters, sort_keys=True, default=str) if filters else None
+        return (
+            query,
+            limit,
+            search_type,
+            filters_key,
+            score_threshold,
+            use_reranking,
+            max_tokens,
+        )
+
+    async def _generation(self) -> int:
+        """Current shared cache generation (always 0 without Redis)."""
+        if self.redis_cache is None:
+            return 0
+        return await self.redis_cache.get(SEARCH_CACHE_VERSION_KEY) or 0
+
+    async def get(self, key: Hashable) -> Optional[Any]:
+        """Get a cached value, or None if missing, expired or invalidated."""
+        generation = await self._generation()
+
+        async with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            expires_at, entry_generation, value = entry
+            if expires_at < time.monotonic() or entry_generation != generation:
+                del self._entries[key]
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    async def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+        generation = await self._generation()
+
+        async with self._lock:
+            self._entries[key] = (expires_at, generation, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    async def invalidate(self, key: Optional[Hashable] = None) -> int:
+        """
+        Invalidate cached entries.
+
+        Clearing the whole cache also bumps the shared generation, which
+        invalidates every other process's entries on their next lookup.
+
+        Args:
+            key: Key to drop, or None to clear the whole cache
+
+        Returns:
+            Number of entries removed
+        """
+        async with self._lock:
+            if key is not None:
+                return 1 if self._entries.pop(key, None) is not None else 0
+
+            count = len(self._entries)
+            self._entries.clear()
+
+        if self.redis_cache is not None:
+            await self.redis_cache.incr(SEARCH_CACHE_VERSION_KEY)
+
+        if count:
+            logger.debug("Query cache cleared", entries=count)
+        return count
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
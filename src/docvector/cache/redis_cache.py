@@ -1,14 +1,32 @@
 """Redis caching implementation."""
 
-import json
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
+import orjson
 import redis.asyncio as redis
 
 from docvector.core import get_logger, settings
 
 logger = get_logger(__name__)
 
+# numpy arrays (e.g. embeddings) and naive datetimes serialize without conversion;
+# non-str dict keys are stringified like stdlib json does
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS
+
+# SCAN + UNLINK server-side so matching keys never round-trip through the client
+_CLEAR_PATTERN_SCRIPT = """
+local count = 0
+local cursor = '0'
+repeat
+    local result = redis.call('SCAN', cursor, 'MATCH', KEYS[1], 'COUNT', 1000)
+    cursor = result[1]
+    if #result[2] > 0 then
+        count = count + redis.call('UNLINK', unpack(result[2]))
+    end
+until cursor == '0'
+return count
+"""
+
 
 class RedisCache:
     """Redis cache wrapper."""
@@ -30,32 +48,41 @@ class RedisCache:
         self.redis_url = redis_url or settings.redis_url
         self.default_ttl = default_ttl
         self.prefix = prefix
-        self.client: Optional[redis.Redis] = None
+        self._client: Optional[redis.Redis] = None
+        self._clear_script = None
+
+    @property
+    def client(self) -> redis.Redis:
+        """Redis client (requires initialize() to have been awaited)."""
+        if self._client is None:
+            raise RuntimeError("RedisCache not initialized")
+        return self._client
 
     async def initialize(self) -> None:
         """Initialize Redis connection."""
-        if self.client is not None:
+        if self._client is not None:
             return
 
-        self.client = await redis.from_url(
+        self._client = await redis.from_url(
             self.redis_url,
             encoding="utf-8",
-            decode_responses=True,
             max_connections=settings.redis_max_connections,
         )
+        self._clear_script = self._client.register_script(_CLEAR_PATTERN_SCRIPT)
 
         logger.info("Redis cache initialized")
 
     async def get(self, key: str) -> Optional[Any]:
         """Get value from cache."""
-        await self.initialize()
+        if self._client is None:
+            await self.initialize()
 
         full_key = self._make_key(key)
 
         try:
             value = await self.client.get(full_key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
         except Exception as e:
             logger.warning("Cache get error", key=key, error=str(e))
 
@@ -68,7 +95,8 @@ class RedisCache:
         ttl: Optional[int] = None,
     ) -> bool:
         """Set value in cache."""
-        await self.initialize()
+        if self._client is None:
+            await self.initialize()
 
         full_key = self._make_key(key)
         ttl = ttl or self.default_ttl
@@ -77,16 +105,116 @@ class RedisCache:
             await self.client.setex(
                 full_key,
                 ttl,
-                json.dumps(value),
+                self._serialize(value),
             )
             return True
         except Exception as e:
             logger.warning("Cache set error", key=key, error=str(e))
             return False
 
+    async def get_bytes(self, key: str) -> Optional[bytes]:
+        """Get a raw bytes value from cache (no JSON decoding)."""
+        if self._client is None:
+            await self.initialize()
+
+        try:
+            return await self.client.get(self._make_key(key))
+        except Exception as e:
+            logger.warning("Cache get error", key=key, error=str(e))
+            return None
+
+    async def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Set a raw bytes value in cache (no JSON encoding)."""
+        if self._client is None:
+            await self.initialize()
+
+        try:
+            await self.client.setex(self._make_key(key), ttl or self.default_ttl, value)
+            return True
+        except Exception as e:
+            logger.warning("Cache set error", key=key, error=str(e))
+            return False
+
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Get multiple values from cache in a single round-trip.
+
+        Args:
+            keys: Cache keys to look up
+
+        Returns:
+            Values in the same order as keys (None for misses)
+        """
+        if self._client is None:
+            await self.initialize()
+
+        if not keys:
+            return []
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.get(self._make_key(key))
+                raw = await pipe.execute()
+
+            return [orjson.loads(value) if value else None for value in raw]
+        except Exception as e:
+            logger.warning("Cache mget error", count=len(keys), error=str(e))
+            return [None] * len(keys)
+
+    async def mset(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """
+        Set multiple values in cache in a single round-trip.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time-to-live in seconds applied to every key
+
+        Returns:
+            True if all values were written
+        """
+        if self._client is None:
+            await self.initialize()
+
+        if not items:
+            return True
+
+        ttl = ttl or self.default_ttl
+
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.setex(self._make_key(key), ttl, self._serialize(value))
+                await pipe.execute()
+            return True
+        except Exception as e:
+            logger.warning("Cache mset error", count=len(items), error=str(e))
+            return False
+
+    async def incr(self, key: str) -> Optional[int]:
+        """Atomically increment an integer key (starting from 0 if missing)."""
+        if self._client is None:
+            await self.initialize()
+
+        try:
+            return await self.client.incr(self._make_key(key))
+        except Exception as e:
+            logger.warning("Cache incr error", key=key, error=str(e))
+            return None
+
     async def delete(self, key: str) -> bool:
         """Delete key from cache."""
-        await self.initialize()
+        if self._client is None:
+            await self.initialize()
 
         full_key = self._make_key(key)
 
@@ -99,7 +227,8 @@ class RedisCache:
 
     async def exists(self, key: str) -> bool:
         """Check if key exists in cache."""
-        await self.initialize()
+        if self._client is None:
+            await self.initialize()
 
         full_key = self._make_key(key)
 
@@ -111,30 +240,30 @@ class RedisCache:
 
     async def clear_pattern(self, pattern: str) -> int:
         """Clear all keys matching pattern."""
-        await self.initialize()
+        if self._client is None:
+            await self.initialize()
 
         full_pattern = self._make_key(pattern)
 
         try:
-            keys = []
-            async for key in self.client.scan_iter(match=full_pattern):
-                keys.append(key)
-
-            if keys:
-                return await self.client.delete(*keys)
-
-            return 0
+            return await self._clear_script(keys=[full_pattern])
         except Exception as e:
             logger.warning("Cache clear error", pattern=pattern, error=str(e))
             return 0
 
     async def close(self) -> None:
         """Close Redis connection."""
-        if self.client:
-            await self.client.close()
-            self.client = None
+        if self._client is not None:
+            await self._client.close()
+            self._client = None
+            self._clear_script = None
             logger.info("Redis cache closed")
 
     def _make_key(self, key: str) -> str:
         """Create full cache key with prefix."""
         return f"{self.prefix}{key}"
+
+    @staticmethod
+    def _serialize(value: Any) -> bytes:
+        """Serialize a value to JSON bytes."""
+        return orjson.dumps(value, option=_ORJSON_OPTIONS)
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from pydantic import Field
@@ -28,15 +29,17 @@ class DocVectorException(Exception):
         self.code = code
         self.message = message or "An error occurred"
         self.details = details or {}
-        super().__init__(self.message)
-
-    def to_dict(self) -> dict:
-        """Convert exception to dictionary format."""
-        return {
+        # Serialized once; error handlers may call to_dict() several times
+        self._dict = {
             "error": self.code or "UNKNOWN_ERROR",
             "message": self.message,
             "details": self.details,
         }
+        super().__init__(self.message)
+
+    def to_dict(self) -> dict:
+        """Convert exception to dictionary format."""
+        return self._dict
 
 
 class Settings(BaseSettings):
@@ -48,6 +51,7 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        frozen=True,  # Read-only after load, so derived values can be cached
     )
 
     # Application
@@ -61,13 +65,22 @@ class Settings(BaseSettings):
     api_port: int = Field(default=8000)
     api_reload: bool = Field(default=True)
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
         """Check if running in production."""
         return self.environment == "production"
 
     # Database
     database_url: str = Field(default="postgresql+asyncpg://localhost/docvector")
+    db_pool_size: int = Field(default=20)  # Persistent connections (pre-warmed at startup)
+    db_max_overflow: int = Field(default=10)
+    db_pool_timeout: int = Field(default=30)  # Seconds to wait for a free connection
+    db_pool_recycle: int = Field(default=1800)  # Seconds before a connection is replaced
+    db_pool_pre_ping: bool = Field(default=False)  # Ping on every checkout (pool_recycle covers stale connections)
+    db_pool_prewarm: bool = Field(default=True)
+    db_pgbouncer_mode: bool = Field(default=False)  # Disable prepared statement caches (pgbouncer transaction pooling)
+    db_statement_cache_size: int = Field(default=1024)  # asyncpg prepared statements kept per connection
+    db_disable_jit: bool = Field(default=True)  # JIT compile time outweighs gains on short OLTP queries
 
     # Redis
     redis_url: str = Field(default="redis://localhost:6379/0")
@@ -81,19 +94,40 @@ class Settings(BaseSettings):
     qdrant_collection: str = Field(default="documents")
     qdrant_url: Optional[str] = Field(default=None)  # Cloud URL (e.g., https://xxx.cloud.qdrant.io:6333)
     qdrant_api_key: Optional[str] = Field(default=None)  # Cloud API key
+    qdrant_binary_quantization: bool = Field(default=False)  # 1-bit vectors in RAM; loses recall below ~1024 dims
+    qdrant_on_disk_vectors: bool = Field(default=True)  # With quantization, keep full-precision vectors on disk for rescoring
+    qdrant_hnsw_ef_construct: int = Field(default=200)
+    qdrant_search_oversampling: float = Field(default=2.0)  # Candidates fetched per result before rescoring
 
     # Embeddings
     embedding_provider: str = Field(default="local")  # "local" or "openai"
     embedding_model: str = Field(default="sentence-transformers/all-MiniLM-L6-v2")
     embedding_device: str = Field(default="cpu")  # "cpu" or "cuda"
     embedding_batch_size: int = Field(default=32)
+    embedding_autotune: bool = Field(default=False)  # Time a few batch sizes at model load and keep the fastest
+    embedding_backend: str = Field(default="torch")  # "torch", "onnx" or "openvino" (needs the matching extra)
+    embedding_model_file: Optional[str] = Field(default=None)  # ONNX/OpenVINO file, e.g. "onnx/model_qint8_avx512.onnx"
+    embedding_precision: str = Field(default="float16")  # "float16" or "float32" local embedder output
+    embedding_workers: int = Field(default=1)  # Local encode processes for bulk batches (multiple GPUs always fan out)
+    embedding_multi_process_min_texts: int = Field(default=1024)  # Smaller batches stay on one device
     embedding_cache_enabled: bool = Field(default=True)
+    embedding_local_cache_size: int = Field(default=10_000)  # Embeddings kept in the per-process LRU in front of Redis
+    embedding_ingest_batch_size: int = Field(default=16)  # Chunks per embed + upsert during ingestion
     openai_api_key: Optional[str] = Field(default=None)
+    openai_embedding_concurrency: int = Field(default=8)  # Embedding API batches in flight at once
+
+    # Outbound HTTP (shared keep-alive pool for embedding/LLM APIs)
+    http_max_connections: int = Field(default=100)
+    http_max_keepalive_connections: int = Field(default=50)
 
     # Search
     search_min_score: float = Field(default=0.1)  # Semantic similarity threshold (lowered for MiniLM-L6-v2)
     search_vector_weight: float = Field(default=0.7)  # Weight for vector similarity
     search_keyword_weight: float = Field(default=0.3)  # Weight for keyword matching
+    search_cache_ttl: int = Field(default=300)  # Seconds to keep in-process search results (0 disables)
+    search_cache_max_size: int = Field(default=1024)  # Max cached queries (LRU eviction)
+    search_stream_min_results: int = Field(default=25)  # Stream /search bodies with at least this many results
+    query_embedding_cache_ttl: int = Field(default=86400 * 7)  # Seconds to keep cached query vectors in Redis
 
     # Chunking
     chunk_size: int = Field(default=1000)
@@ -107,6 +141,16 @@ class Settings(BaseSettings):
     crawler_user_agent: str = Field(
         default="DocVector/0.1.0 (https://github.com/docvector/docvector)"
     )
+    crawler_max_connections: int = Field(default=0)  # Total socket cap (0 = 4x concurrent requests)
+    crawler_max_connections_per_host: int = Field(default=0)  # Per-host cap (0 = concurrent requests)
+    crawler_dns_cache_ttl: int = Field(default=300)  # Seconds to cache DNS lookups
+    crawler_keepalive_timeout: float = Field(default=75.0)  # Seconds idle connections stay pooled
+    crawler_max_response_bytes: int = Field(default=20 * 1024 * 1024)  # Larger bodies are rejected (0 = no limit)
+
+    # Ingestion worker (arq)
+    ingest_use_worker: bool = Field(default=False)  # Queue /ingest/source jobs for the arq worker (must be running)
+    ingest_worker_max_jobs: int = Field(default=2)  # Concurrent ingestion jobs per worker
+    ingest_job_timeout: int = Field(default=3600)  # Seconds before a job is aborted
 
     # MCP Server Mode
     # - local: All data stored locally, no cloud connectivity (air-gapped)
@@ -116,6 +160,38 @@ class Settings(BaseSettings):
     cloud_api_url: Optional[str] = Field(default=None)  # DocVector Cloud API URL
     cloud_api_key: Optional[str] = Field(default=None)  # DocVector Cloud API key
 
+
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """
+    Get the process-wide settings instance.
+
+    The environment and .env file are parsed once; later calls return the
+    same object.
+    """
+    return Settings()
+
+
+# Global settings instance
+settings = get_settings()
+
+
+class BillingSettings(BaseSettings):
+    """
+    Billing settings, loaded on first use.
+
+    Kept out of Settings so processes that never bill (workers, MCP server)
+    don't parse these fields at startup.
+    """
+
+    model_config = SettingsConfigDict(
+        env_prefix="DOCVECTOR_",
+        env_file=".env",
+        env_file_encoding="utf-8",
+        case_sensitive=False,
+        extra="ignore",
+    )
+
     # Paddle Billing
     # Paddle is a merchant of record that handles global payments, tax, and compliance
     paddle_environment: str = Field(default="sandbox")  # "sandbox" or "production"
@@ -132,25 +208,43 @@ class Settings(BaseSettings):
     paddle_price_enterprise_yearly: Optional[str] = Field(default=None)
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_billing_settings() -> BillingSettings:
+    """Get the process-wide billing settings instance."""
+    return BillingSettings()
+
+
+_logging_configured = False
+
+# Resolved once so setup doesn't repeat the name -> level lookup
+LOG_LEVEL: int = getattr(logging, settings.log_level.upper(), logging.INFO)
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 
 def setup_logging(level: Optional[str] = None) -> None:
     """
     Setup logging configuration.
 
+    Called by the application entry point, never at import time. Repeated
+    calls are no-ops so handlers are only installed once.
+
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
     """
-    log_level = level or settings.log_level
+    global _logging_configured
+
+    if _logging_configured:
+        return
+
+    log_level = getattr(logging, level.upper()) if level else LOG_LEVEL
 
     # Configure root logger
     logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        level=log_level,
+        format=LOG_FORMAT,
         handlers=[logging.StreamHandler(sys.stdout)],
     )
+    _logging_configured = True
 
 
 class StructuredLogger:
@@ -181,35 +275,48 @@ class StructuredLogger:
             return f"{msg} | {context}"
         return msg
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 - mirrors logging.Logger
+        """Check whether a message at this level would be emitted."""
+        return self._logger.isEnabledFor(level)
+
     def debug(self, msg: str, **kwargs) -> None:
         """Log debug message with structured data."""
-        self._logger.debug(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(self._format_message(msg, **kwargs))
 
     def info(self, msg: str, **kwargs) -> None:
         """Log info message with structured data."""
-        self._logger.info(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(self._format_message(msg, **kwargs))
 
     def warning(self, msg: str, **kwargs) -> None:
         """Log warning message with structured data."""
-        self._logger.warning(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(self._format_message(msg, **kwargs))
 
     def error(self, msg: str, **kwargs) -> None:
         """Log error message with structured data."""
-        self._logger.error(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.error(self._format_message(msg, **kwargs))
 
     def critical(self, msg: str, **kwargs) -> None:
         """Log critical message with structured data."""
-        self._logger.critical(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.CRITICAL):
+            self._logger.critical(self._format_message(msg, **kwargs))
 
     def exception(self, msg: str, **kwargs) -> None:
         """Log exception message with structured data."""
-        self._logger.exception(self._format_message(msg, **kwargs))
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.exception(self._format_message(msg, **kwargs))
 
 
+@lru_cache(maxsize=None)
 def get_logger(name: str) -> StructuredLogger:
     """
     Get a structured logger instance.
 
+    Instances are cached per name, so repeated calls return the same wrapper.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -1,39 +1,109 @@
 """Database connection and session management."""
 
+import asyncio
+import threading
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Optional
+from typing import Any, AsyncGenerator, Dict, Optional
 
-from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from docvector.core import get_logger, settings
 
 logger = get_logger(__name__)
 
-# Global engine instance
+# Global engine instance and its session factory
 _engine: Optional[AsyncEngine] = None
+_session_factory: Optional[async_sessionmaker] = None
+_engine_lock = threading.Lock()
 
 
 def get_engine() -> AsyncEngine:
     """
     Get or create the database engine.
 
+    The hot path is a plain global read; creation is double-checked under
+    a lock so concurrent first callers can't build two engines (and two
+    pools).
+
     Returns:
         AsyncEngine instance
     """
-    global _engine
+    engine = _engine
+    if engine is not None:
+        return engine
+
+    with _engine_lock:
+        if _engine is None:
+            _create_engine()
+        return _engine
+
+
+def _connect_args() -> Dict[str, Any]:
+    """Driver connect_args for the configured database URL."""
+    # The options below are asyncpg's; other drivers (aiosqlite in dev and
+    # tests) reject them as unknown keyword arguments
+    if make_url(settings.database_url).get_dialect().driver != "asyncpg":
+        return {}
+
+    if settings.db_pgbouncer_mode:
+        # pgbouncer may hand each transaction a different server connection,
+        # so statements prepared on one connection can't be reused (and it
+        # rejects unknown startup parameters such as jit)
+        return {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+
+    # Repeated repository queries reuse prepared statements instead of
+    # being parsed and planned on every call
+    connect_args: Dict[str, Any] = {
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+    if settings.db_disable_jit:
+        connect_args["server_settings"] = {"jit": "off"}
+    return connect_args
+
+
+def _create_engine() -> None:
+    """Create the engine and session factory (caller holds _engine_lock)."""
+    global _engine, _session_factory
+
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.environment == "development",
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+        pool_use_lifo=True,  # Reuse the most recently returned (warm) connection
+        connect_args=_connect_args(),
+    )
+    _session_factory = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+    )
+    _engine = engine
+    logger.info("Database engine created", url=settings.database_url)
+
+
+def init_db() -> AsyncEngine:
+    """
+    Create the engine and session factory eagerly.
 
-    if _engine is None:
-        _engine = create_async_engine(
-            settings.database_url,
-            echo=settings.environment == "development",
-            pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
-        )
-        logger.info("Database engine created", url=settings.database_url)
+    Called at application startup so request handlers only ever take the
+    fast path in get_engine()/get_session().
 
-    return _engine
+    Returns:
+        AsyncEngine instance
+    """
+    return get_engine()
 
 
 @asynccontextmanager
@@ -44,15 +114,10 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     Yields:
         AsyncSession instance
     """
-    engine = get_engine()
+    if _session_factory is None:
+        get_engine()
 
-    async_session = sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session() as session:
+    async with _session_factory() as session:
         try:
             yield session
         except Exception:
@@ -62,13 +127,36 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+async def warm_pool(size: Optional[int] = None) -> None:
+    """
+    Open pooled connections ahead of traffic.
+
+    Connections are checked out concurrently so the pool actually grows to
+    ``size`` instead of reusing a single connection; they are then returned
+    to the pool, so early requests skip connect/auth latency.
+
+    Args:
+        size: Number of connections to open (defaults to db_pool_size)
+    """
+    engine = get_engine()
+    size = size or settings.db_pool_size
+
+    async def _ping() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(size)))
+    logger.info("Database pool pre-warmed", connections=size)
+
+
 async def close_db() -> None:
     """Close the database connection."""
-    global _engine
+    global _engine, _session_factory
 
     if _engine is not None:
         await _engine.dispose()
         _engine = None
+        _session_factory = None
         logger.info("Database connection closed")
 
 
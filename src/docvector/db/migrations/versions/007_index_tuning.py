@@ -0,0 +1,79 @@
+"""Composite and partial indexes for hot lookups.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16
+
+- chunks(document_id, index) replaces chunks(document_id) so per-document
+  chunk reads come back already ordered
+- embedding_id / url indexes skip NULL rows
+- document and job status indexes only cover non-terminal statuses
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "007"
+down_revision = "006"
+branch_labels = None
+depends_on = None
+
+ACTIVE_STATUSES = "status IN ('pending', 'processing', 'failed')"
+
+
+def upgrade() -> None:
+    # Chunks: composite (document_id, index) covers document_id lookups too
+    op.drop_index("idx_chunks_document_id", table_name="chunks")
+    op.create_index("idx_chunks_document_id_index", "chunks", ["document_id", "index"])
+
+    op.drop_index("idx_chunks_embedding_id", table_name="chunks")
+    op.create_index(
+        "idx_chunks_embedding_id",
+        "chunks",
+        ["embedding_id"],
+        postgresql_where=sa.text("embedding_id IS NOT NULL"),
+    )
+
+    # Documents
+    op.drop_index("idx_documents_url", table_name="documents")
+    op.create_index(
+        "idx_documents_url",
+        "documents",
+        ["url"],
+        postgresql_where=sa.text("url IS NOT NULL"),
+    )
+
+    op.drop_index("idx_documents_status", table_name="documents")
+    op.create_index(
+        "idx_documents_status",
+        "documents",
+        ["status"],
+        postgresql_where=sa.text(ACTIVE_STATUSES),
+    )
+
+    # Jobs
+    op.drop_index("idx_jobs_status", table_name="jobs")
+    op.create_index(
+        "idx_jobs_status",
+        "jobs",
+        ["status"],
+        postgresql_where=sa.text(ACTIVE_STATUSES),
+    )
+
+
+def downgrade() -> None:
+    """Restore the full single-column indexes."""
+    op.drop_index("idx_jobs_status", table_name="jobs")
+    op.create_index("idx_jobs_status", "jobs", ["status"])
+
+    op.drop_index("idx_documents_status", table_name="documents")
+    op.create_index("idx_documents_status", "documents", ["status"])
+
+    op.drop_index("idx_documents_url", table_name="documents")
+    op.create_index("idx_documents_url", "documents", ["url"])
+
+    op.drop_index("idx_chunks_embedding_id", table_name="chunks")
+    op.create_index("idx_chunks_embedding_id", "chunks", ["embedding_id"])
+
+    op.drop_index("idx_chunks_document_id_index", table_name="chunks")
+    op.create_index("idx_chunks_document_id", "chunks", ["document_id"])
@@ -0,0 +1,37 @@
+"""Store documents.content_hash as a raw 32-byte digest.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16
+
+The hex text column is converted in place (same SHA256, half the size);
+idx_documents_content_hash is rebuilt by the type change.
+"""
+
+from alembic import op
+
+revision = "008"
+down_revision = "007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE documents "
+        "ALTER COLUMN content_hash TYPE BYTEA USING decode(content_hash, 'hex')"
+    )
+    op.create_check_constraint(
+        "ck_documents_content_hash_length",
+        "documents",
+        "octet_length(content_hash) = 32",
+    )
+
+
+def downgrade() -> None:
+    """Convert content_hash back to hex text."""
+    op.drop_constraint("ck_documents_content_hash_length", "documents", type_="check")
+    op.execute(
+        "ALTER TABLE documents "
+        "ALTER COLUMN content_hash TYPE VARCHAR(64) USING encode(content_hash, 'hex')"
+    )
@@ -0,0 +1,40 @@
+"""BRIN indexes on append-ordered timestamp columns.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16
+
+Rows are inserted roughly in time order, so block-range indexes serve
+time-window scans (e.g. jobs completed in the last hour) at a tiny
+fraction of a btree's size. They don't help ORDER BY ... LIMIT; those
+still use btree indexes.
+"""
+
+from alembic import op
+
+revision = "009"
+down_revision = "008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "CREATE INDEX idx_documents_created_at_brin ON documents "
+        "USING BRIN (created_at) WITH (pages_per_range = 32)"
+    )
+    op.execute(
+        "CREATE INDEX idx_jobs_completed_at_brin ON jobs "
+        "USING BRIN (completed_at) WITH (pages_per_range = 32)"
+    )
+    op.execute(
+        "CREATE INDEX idx_chunks_embedded_at_brin ON chunks "
+        "USING BRIN (embedded_at) WITH (pages_per_range = 32)"
+    )
+
+
+def downgrade() -> None:
+    """Drop BRIN indexes."""
+    op.drop_index("idx_chunks_embedded_at_brin", table_name="chunks")
+    op.drop_index("idx_jobs_completed_at_brin", table_name="jobs")
+    op.drop_index("idx_documents_created_at_brin", table_name="documents")
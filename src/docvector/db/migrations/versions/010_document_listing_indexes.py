@@ -0,0 +1,43 @@
+"""Indexes for document work-queue and per-source listings.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16
+
+- documents(created_at) for pending/processing rows only, matching
+  list_by_status draining the queue oldest first
+- documents(source_id, created_at DESC) replaces documents(source_id), so
+  list_by_source pages come straight off the index
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "010"
+down_revision = "009"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_documents_pending",
+        "documents",
+        ["created_at"],
+        postgresql_where=sa.text("status IN ('pending', 'processing')"),
+    )
+
+    op.drop_index("idx_documents_source_id", table_name="documents")
+    op.create_index(
+        "idx_documents_source_created_at",
+        "documents",
+        ["source_id", sa.text("created_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column source index."""
+    op.drop_index("idx_documents_source_created_at", table_name="documents")
+    op.create_index("idx_documents_source_id", "documents", ["source_id"])
+
+    op.drop_index("idx_documents_pending", table_name="documents")
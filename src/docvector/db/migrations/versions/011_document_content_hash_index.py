@@ -0,0 +1,32 @@
+"""Composite index for per-source content hash lookups.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16
+
+Dedup checks always filter on both source_id and content_hash, so
+documents(source_id, content_hash) replaces the single-column
+content_hash index and makes each check a single index probe.
+"""
+
+from alembic import op
+
+revision = "011"
+down_revision = "010"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_documents_content_hash", table_name="documents")
+    op.create_index(
+        "idx_documents_source_content_hash",
+        "documents",
+        ["source_id", "content_hash"],
+    )
+
+
+def downgrade() -> None:
+    """Restore the single-column content hash index."""
+    op.drop_index("idx_documents_source_content_hash", table_name="documents")
+    op.create_index("idx_documents_content_hash", "documents", ["content_hash"])
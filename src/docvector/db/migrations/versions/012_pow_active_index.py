@@ -0,0 +1,35 @@
+"""Partial index for active proof-of-work challenges.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16
+
+Challenge lookups only care about unused challenges, so the full agent_id
+index is replaced by a partial (agent_id, expires_at) index over unused
+rows. Expired rows are purged periodically by the worker.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "012"
+down_revision = "011"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Migration 004 only created this index when it created the table
+    op.execute("DROP INDEX IF EXISTS idx_pow_challenges_agent")
+    op.create_index(
+        "idx_pow_challenges_active",
+        "pow_challenges",
+        ["agent_id", "expires_at"],
+        postgresql_where=sa.text("used = false"),
+    )
+
+
+def downgrade() -> None:
+    """Restore the full agent_id index."""
+    op.drop_index("idx_pow_challenges_active", table_name="pow_challenges")
+    op.create_index("idx_pow_challenges_agent", "pow_challenges", ["agent_id"])
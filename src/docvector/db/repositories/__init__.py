@@ -3,6 +3,7 @@
 from .chunk_repo import ChunkRepository
 from .document_repo import DocumentRepository
 from .issue_repo import IssueRepository, SolutionRepository
+from .pow_repo import ProofOfWorkRepository
 from .qa_repo import AnswerRepository, CommentRepository, QuestionRepository, TagRepository, VoteRepository
 from .source_repo import SourceRepository
 
@@ -19,4 +20,6 @@ __all__ = [
     # Issues
     "IssueRepository",
     "SolutionRepository",
+    # Anti-spam
+    "ProofOfWorkRepository",
 ]
@@ -1,12 +1,34 @@
 """Chunk repository."""
 
-from typing import List, Optional
+import json
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import String, cast, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.models import Chunk
+from docvector.utils import uuid7
+
+# Below this many rows a batched INSERT is as fast as COPY
+COPY_THRESHOLD = 100
+
+# Listings larger than this are fetched in streamed batches
+STREAM_THRESHOLD = 500
+
+# Columns written by COPY; the rest fall back to server defaults
+_COPY_COLUMNS = [
+    "id",
+    "document_id",
+    "index",
+    "content",
+    "content_length",
+    "start_char",
+    "end_char",
+    "metadata",
+    "embedding_model",
+    "embedded_at",
+]
 
 
 class ChunkRepository:
@@ -20,19 +42,91 @@ class ChunkRepository:
         """Create a new chunk."""
         self.session.add(chunk)
         await self.session.flush()
-        await self.session.refresh(chunk)
         return chunk
 
     async def create_many(self, chunks: List[Chunk]) -> List[Chunk]:
-        """Create multiple chunks."""
+        """
+        Create multiple chunks.
+
+        With eager_defaults the flush is a single batched INSERT ... RETURNING.
+        On backends without multi-row RETURNING, server defaults are loaded
+        for all chunks with one SELECT ... IN instead of a refresh per row.
+        """
         self.session.add_all(chunks)
         await self.session.flush()
 
+        conn = await self.session.connection()
+        if chunks and not conn.dialect.insert_executemany_returning:
+            await self.session.execute(
+                select(Chunk)
+                .where(Chunk.id.in_([chunk.id for chunk in chunks]))
+                .execution_options(populate_existing=True)
+            )
+
+        return chunks
+
+    async def copy_many(self, chunks: List[Chunk]) -> List[Chunk]:
+        """
+        Bulk insert chunks with PostgreSQL COPY.
+
+        Streams all rows in one COPY instead of one INSERT per chunk. IDs are
+        assigned client-side; the returned chunks are not attached to the
+        session. Falls back to create_many() for batches smaller than
+        COPY_THRESHOLD and on other databases.
+        """
+        if not chunks:
+            return []
+
+        if len(chunks) < COPY_THRESHOLD:
+            return await self.create_many(chunks)
+
+        conn = await self.session.connection()
+        if conn.dialect.name != "postgresql":
+            return await self.create_many(chunks)
+
+        # Parent documents must exist before COPY checks the foreign key
+        await self.session.flush()
+
+        records = []
         for chunk in chunks:
-            await self.session.refresh(chunk)
+            if chunk.id is None:
+                chunk.id = uuid7()
+            records.append(
+                (
+                    chunk.id,
+                    chunk.document_id,
+                    chunk.index,
+                    chunk.content,
+                    chunk.content_length,
+                    chunk.start_char,
+                    chunk.end_char,
+                    json.dumps(chunk.metadata_ or {}, default=str),
+                    chunk.embedding_model,
+                    chunk.embedded_at,
+                )
+            )
+
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            Chunk.__tablename__,
+            records=records,
+            columns=_COPY_COLUMNS,
+        )
 
         return chunks
 
+    async def mark_embedded(self, chunk_ids: List[UUID]) -> None:
+        """Set embedding_id (the vector point ID, i.e. the chunk ID) for chunks."""
+        if not chunk_ids:
+            return
+
+        await self.session.execute(
+            update(Chunk)
+            .where(Chunk.id.in_(chunk_ids))
+            .values(embedding_id=cast(Chunk.id, String))
+            .execution_options(synchronize_session=False)
+        )
+
     async def get_by_id(self, chunk_id: UUID) -> Optional[Chunk]:
         """Get chunk by ID."""
         result = await self.session.execute(select(Chunk).where(Chunk.id == chunk_id))
@@ -45,37 +139,90 @@ class ChunkRepository:
         offset: int = 0,
     ) -> List[Chunk]:
         """List chunks for a document."""
-        result = await self.session.execute(
+        query = (
             select(Chunk)
             .where(Chunk.document_id == document_id)
             .order_by(Chunk.index.asc())
             .limit(limit)
             .offset(offset)
         )
+
+        if limit > STREAM_THRESHOLD:
+            result = await self.session.stream_scalars(query.execution_options(yield_per=200))
+            return [chunk async for chunk in result]
+
+        result = await self.session.execute(query)
         return list(result.scalars().all())
 
+    async def iter_by_document(
+        self,
+        document_id: UUID,
+        batch_size: int = 200,
+    ) -> AsyncIterator[Chunk]:
+        """
+        Iterate over all chunks for a document in index order.
+
+        Rows are fetched from a server-side cursor in batches of batch_size,
+        so memory stays flat regardless of document size.
+        """
+        result = await self.session.stream_scalars(
+            select(Chunk)
+            .where(Chunk.document_id == document_id)
+            .order_by(Chunk.index.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for chunk in result:
+            yield chunk
+
     async def update(self, chunk: Chunk) -> Chunk:
         """Update chunk."""
         await self.session.flush()
-        await self.session.refresh(chunk)
         return chunk
 
     async def delete(self, chunk_id: UUID) -> bool:
         """Delete chunk."""
-        chunk = await self.get_by_id(chunk_id)
-        if chunk:
-            await self.session.delete(chunk)
-            await self.session.flush()
-            return True
-        return False
-
-    async def delete_by_document(self, document_id: UUID) -> int:
-        """Delete all chunks for a document."""
-        result = await self.session.execute(select(Chunk).where(Chunk.document_id == document_id))
-        chunks = result.scalars().all()
-
-        for chunk in chunks:
-            await self.session.delete(chunk)
+        result = await self.session.execute(
+            delete(Chunk).where(Chunk.id == chunk_id).returning(Chunk.id)
+        )
+        return result.scalar_one_or_none() is not None
 
-        await self.session.flush()
-        return len(chunks)
+    async def delete_by_document(
+        self,
+        document_id: UUID,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Delete all chunks for a document.
+
+        Without batch_size this is a single DELETE in the caller's
+        transaction. With batch_size, chunks are deleted and committed
+        batch_size rows at a time, which bounds lock time on very large
+        documents and lets an interrupted delete be resumed.
+        """
+        if batch_size is None:
+            result = await self.session.execute(
+                delete(Chunk)
+                .where(Chunk.document_id == document_id)
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount or 0
+
+        total = 0
+        while True:
+            batch = (
+                select(Chunk.id)
+                .where(Chunk.document_id == document_id)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                delete(Chunk)
+                .where(Chunk.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+
+            deleted = result.rowcount or 0
+            total += deleted
+            if deleted < batch_size:
+                return total
@@ -1,14 +1,21 @@
 """Document repository."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Union
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.models import Document
 
 
+def _as_digest(content_hash: Union[bytes, str]) -> bytes:
+    """Normalize a content hash to the raw digest stored in the column."""
+    if isinstance(content_hash, str):
+        return bytes.fromhex(content_hash)
+    return content_hash
+
+
 class DocumentRepository:
     """Repository for Document model."""
 
@@ -20,7 +27,6 @@ class DocumentRepository:
         """Create a new document."""
         self.session.add(document)
         await self.session.flush()
-        await self.session.refresh(document)
         return document
 
     async def get_by_id(self, document_id: UUID) -> Optional[Document]:
@@ -41,17 +47,40 @@ class DocumentRepository:
     async def get_by_content_hash(
         self,
         source_id: UUID,
-        content_hash: str,
+        content_hash: Union[bytes, str],
     ) -> Optional[Document]:
-        """Get document by content hash."""
+        """Get document by content hash (raw digest or hex string)."""
         result = await self.session.execute(
             select(Document).where(
                 Document.source_id == source_id,
-                Document.content_hash == content_hash,
+                Document.content_hash == _as_digest(content_hash),
             )
         )
         return result.scalar_one_or_none()
 
+    async def exists_by_content_hash(
+        self,
+        source_id: UUID,
+        content_hash: Union[bytes, str],
+    ) -> bool:
+        """
+        Check whether a document with this content hash exists.
+
+        Accepts the raw digest or its hex string.
+
+        Selects a constant rather than the row, so the lookup is answered
+        from the (source_id, content_hash) index without hydrating a Document.
+        """
+        result = await self.session.execute(
+            select(literal(1))
+            .where(
+                Document.source_id == source_id,
+                Document.content_hash == _as_digest(content_hash),
+            )
+            .limit(1)
+        )
+        return result.scalar() is not None
+
     async def list_by_source(
         self,
         source_id: UUID,
@@ -68,6 +97,25 @@ class DocumentRepository:
         )
         return list(result.scalars().all())
 
+    async def iter_by_source(
+        self,
+        source_id: UUID,
+        batch_size: int = 200,
+    ) -> AsyncIterator[Document]:
+        """
+        Iterate over all documents for a source, newest first.
+
+        Rows are fetched from a server-side cursor in batches of batch_size.
+        """
+        result = await self.session.stream_scalars(
+            select(Document)
+            .where(Document.source_id == source_id)
+            .order_by(Document.created_at.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        async for document in result:
+            yield document
+
     async def list_by_status(
         self,
         status: str,
@@ -92,25 +140,53 @@ class DocumentRepository:
     async def update(self, document: Document) -> Document:
         """Update document."""
         await self.session.flush()
-        await self.session.refresh(document)
         return document
 
     async def delete(self, document_id: UUID) -> bool:
         """Delete document."""
-        document = await self.get_by_id(document_id)
-        if document:
-            await self.session.delete(document)
-            await self.session.flush()
-            return True
-        return False
-
-    async def delete_by_source(self, source_id: UUID) -> int:
-        """Delete all documents for a source."""
-        result = await self.session.execute(select(Document).where(Document.source_id == source_id))
-        documents = result.scalars().all()
+        result = await self.session.execute(
+            delete(Document).where(Document.id == document_id).returning(Document.id)
+        )
+        return result.scalar_one_or_none() is not None
 
-        for doc in documents:
-            await self.session.delete(doc)
+    async def delete_by_source(
+        self,
+        source_id: UUID,
+        batch_size: Optional[int] = None,
+    ) -> int:
+        """
+        Delete all documents for a source.
+
+        Chunks are removed by the ON DELETE CASCADE foreign key. Without
+        batch_size this is a single DELETE in the caller's transaction. With
+        batch_size, documents are deleted and committed batch_size rows at a
+        time, which bounds lock time on very large sources and lets an
+        interrupted delete be resumed.
+        """
+        if batch_size is None:
+            result = await self.session.execute(
+                delete(Document)
+                .where(Document.source_id == source_id)
+                .execution_options(synchronize_session=False)
+            )
+            return result.rowcount or 0
+
+        total = 0
+        while True:
+            batch = (
+                select(Document.id)
+                .where(Document.source_id == source_id)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                delete(Document)
+                .where(Document.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
 
-        await self.session.flush()
-        return len(documents)
+            deleted = result.rowcount or 0
+            total += deleted
+            if deleted < batch_size:
+                return total
@@ -20,7 +20,6 @@ class IssueRepository:
         """Create a new issue."""
         self.session.add(issue)
         await self.session.flush()
-        await self.session.refresh(issue)
         return issue
 
     async def get_by_id(self, issue_id: UUID) -> Optional[Issue]:
@@ -88,7 +87,6 @@ class IssueRepository:
     async def update(self, issue: Issue) -> Issue:
         """Update issue."""
         await self.session.flush()
-        await self.session.refresh(issue)
         return issue
 
     async def delete(self, issue_id: UUID) -> bool:
@@ -182,7 +180,6 @@ class SolutionRepository:
         """Create a new solution."""
         self.session.add(solution)
         await self.session.flush()
-        await self.session.refresh(solution)
         return solution
 
     async def get_by_id(self, solution_id: UUID) -> Optional[Solution]:
@@ -223,7 +220,6 @@ class SolutionRepository:
     async def update(self, solution: Solution) -> Solution:
         """Update solution."""
         await self.session.flush()
-        await self.session.refresh(solution)
         return solution
 
     async def delete(self, solution_id: UUID) -> bool:
@@ -0,0 +1,78 @@
+"""Proof-of-work challenge repository."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from docvector.models import ProofOfWorkChallenge
+
+
+class ProofOfWorkRepository:
+    """Repository for ProofOfWorkChallenge model."""
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository."""
+        self.session = session
+
+    async def claim_challenge(self, challenge: str) -> bool:
+        """
+        Atomically mark an unused, unexpired challenge as used.
+
+        Verify the solution with ProofOfWork.verify before calling this;
+        hashing needs no session. The single UPDATE ... RETURNING both
+        checks and consumes the challenge, so a replayed solution loses
+        the race instead of passing a SELECT-then-UPDATE window.
+
+        Returns:
+            True if this call claimed the challenge, False if it was unknown,
+            expired or already used
+        """
+        result = await self.session.execute(
+            update(ProofOfWorkChallenge)
+            .where(
+                ProofOfWorkChallenge.challenge == challenge,
+                ProofOfWorkChallenge.used.is_(False),
+                ProofOfWorkChallenge.expires_at > func.now(),
+            )
+            .values(used=True, used_at=func.now())
+            .returning(ProofOfWorkChallenge.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() is not None
+
+    async def purge_expired(
+        self,
+        older_than: timedelta = timedelta(days=1),
+        batch_size: int = 1000,
+    ) -> int:
+        """
+        Delete challenges that expired more than older_than ago.
+
+        Expired challenges are never read again. Rows are deleted and
+        committed batch_size at a time so the purge never holds long locks.
+
+        Returns:
+            Number of challenges deleted
+        """
+        cutoff = datetime.now(timezone.utc) - older_than
+
+        total = 0
+        while True:
+            batch = (
+                select(ProofOfWorkChallenge.id)
+                .where(ProofOfWorkChallenge.expires_at < cutoff)
+                .limit(batch_size)
+                .scalar_subquery()
+            )
+            result = await self.session.execute(
+                delete(ProofOfWorkChallenge)
+                .where(ProofOfWorkChallenge.id.in_(batch))
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+
+            deleted = result.rowcount or 0
+            total += deleted
+            if deleted < batch_size:
+                return total
@@ -20,7 +20,6 @@ class TagRepository:
         """Create a new tag."""
         self.session.add(tag)
         await self.session.flush()
-        await self.session.refresh(tag)
         return tag
 
     async def get_by_id(self, tag_id: UUID) -> Optional[Tag]:
@@ -83,7 +82,6 @@ class QuestionRepository:
         """Create a new question."""
         self.session.add(question)
         await self.session.flush()
-        await self.session.refresh(question)
         return question
 
     async def get_by_id(self, question_id: UUID) -> Optional[Question]:
@@ -147,7 +145,6 @@ class QuestionRepository:
     async def update(self, question: Question) -> Question:
         """Update question."""
         await self.session.flush()
-        await self.session.refresh(question)
         return question
 
     async def delete(self, question_id: UUID) -> bool:
@@ -225,7 +222,6 @@ class AnswerRepository:
         """Create a new answer."""
         self.session.add(answer)
         await self.session.flush()
-        await self.session.refresh(answer)
         return answer
 
     async def get_by_id(self, answer_id: UUID) -> Optional[Answer]:
@@ -259,7 +255,6 @@ class AnswerRepository:
     async def update(self, answer: Answer) -> Answer:
         """Update answer."""
         await self.session.flush()
-        await self.session.refresh(answer)
         return answer
 
     async def delete(self, answer_id: UUID) -> bool:
@@ -296,7 +291,6 @@ class VoteRepository:
         """Create a new vote."""
         self.session.add(vote)
         await self.session.flush()
-        await self.session.refresh(vote)
         return vote
 
     async def get_by_voter_and_target(
@@ -325,7 +319,6 @@ class VoteRepository:
         if existing:
             existing.value = vote.value
             await self.session.flush()
-            await self.session.refresh(existing)
             return existing
         return await self.create(vote)
 
@@ -376,7 +369,6 @@ class CommentRepository:
         """Create a new comment."""
         self.session.add(comment)
         await self.session.flush()
-        await self.session.refresh(comment)
         return comment
 
     async def get_by_id(self, comment_id: UUID) -> Optional[Comment]:
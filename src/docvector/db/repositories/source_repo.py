@@ -1,9 +1,9 @@
 """Source repository."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.models import Source
@@ -20,7 +20,6 @@ class SourceRepository:
         """Create a new source."""
         self.session.add(source)
         await self.session.flush()
-        await self.session.refresh(source)
         return source
 
     async def get_by_id(self, source_id: UUID) -> Optional[Source]:
@@ -44,6 +43,25 @@ class SourceRepository:
         )
         return list(result.scalars().all())
 
+    async def list_all_rows(
+        self,
+        columns: List[str],
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict]:
+        """
+        List sources as plain dicts containing only the given columns.
+
+        Skips ORM identity-map and object construction for read-only listings.
+        """
+        result = await self.session.execute(
+            select(*(getattr(Source, column) for column in columns))
+            .order_by(Source.created_at.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return [dict(row) for row in result.mappings().all()]
+
     async def list_active(self) -> List[Source]:
         """List active sources."""
         result = await self.session.execute(
@@ -54,14 +72,11 @@ class SourceRepository:
     async def update(self, source: Source) -> Source:
         """Update source."""
         await self.session.flush()
-        await self.session.refresh(source)
         return source
 
     async def delete(self, source_id: UUID) -> bool:
         """Delete source."""
-        source = await self.get_by_id(source_id)
-        if source:
-            await self.session.delete(source)
-            await self.session.flush()
-            return True
-        return False
+        result = await self.session.execute(
+            delete(Source).where(Source.id == source_id).returning(Source.id)
+        )
+        return result.scalar_one_or_none() is not None
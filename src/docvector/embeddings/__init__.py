@@ -2,7 +2,14 @@
 
 from .base import BaseEmbedder
 from .cache import EmbeddingCache
-from .local_embedder import LocalEmbedder
+from .local_embedder import LocalEmbedder, close_local_embedders, get_local_embedder
 from .openai_embedder import OpenAIEmbedder
 
-__all__ = ["BaseEmbedder", "LocalEmbedder", "OpenAIEmbedder", "EmbeddingCache"]
+__all__ = [
+    "BaseEmbedder",
+    "LocalEmbedder",
+    "OpenAIEmbedder",
+    "EmbeddingCache",
+    "get_local_embedder",
+    "close_local_embedders",
+]
@@ -0,0 +1,30 @@
+"""Vectorized in-place L2 normalization for embedding batches."""
+
+import numpy as np
+
+# Rows with a smaller norm are left as-is instead of dividing by ~0
+_EPS = 1e-12
+
+
+def l2_normalize_(embeddings: np.ndarray) -> np.ndarray:
+    """
+    Scale each row of a 2-D array to unit length, in place.
+
+    Row norms come from a single einsum pass (accumulated in float32 so
+    float16 input cannot overflow), followed by one reciprocal and one
+    broadcast multiply. No per-row temporaries are allocated.
+
+    Args:
+        embeddings: Array of shape (n, dim), float16 or float32
+
+    Returns:
+        The same array, normalized
+    """
+    if embeddings.size == 0:
+        return embeddings
+
+    norms = np.sqrt(np.einsum("ij,ij->i", embeddings, embeddings, dtype=np.float32))
+    np.maximum(norms, _EPS, out=norms)
+    np.reciprocal(norms, out=norms)
+    embeddings *= norms[:, None].astype(embeddings.dtype, copy=False)
+    return embeddings
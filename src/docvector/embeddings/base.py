@@ -3,12 +3,14 @@
 from abc import ABC, abstractmethod
 from typing import List
 
+import numpy as np
+
 
 class BaseEmbedder(ABC):
     """Abstract base class for embedding generators."""
 
     @abstractmethod
-    async def embed(self, texts: List[str]) -> List[List[float]]:
+    async def embed(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings for a list of texts.
 
@@ -16,12 +18,12 @@ class BaseEmbedder(ABC):
             texts: List of text strings to embed
 
         Returns:
-            List of embedding vectors
+            Array of shape (len(texts), dimension), one row per text
         """
         pass
 
     @abstractmethod
-    async def embed_query(self, text: str) -> List[float]:
+    async def embed_query(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single query text.
 
@@ -29,7 +31,7 @@ class BaseEmbedder(ABC):
             text: Query text to embed
 
         Returns:
-            Embedding vector
+            1-D embedding vector
         """
         pass
 
@@ -1,9 +1,11 @@
 """Embedding cache using Redis."""
 
 import hashlib
-import json
-from typing import Dict, List, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import redis.asyncio as redis
 
 from docvector.core import get_logger, settings
@@ -11,14 +13,64 @@ from docvector.core import get_logger, settings
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=10_000)
+def _cache_key(prefix: str, model: str, text: str) -> str:
+    """
+    Build a cache key from model + text.
+
+    Memoized because the same texts recur across get_many/set_many and
+    retries; blake2b is also cheaper than SHA-256 on long chunks.
+    """
+    digest = hashlib.blake2b(f"{model}:{text}".encode(), digest_size=32).hexdigest()
+    return f"{prefix}{digest}"
+
+
+class _LocalEmbeddingLRU:
+    """
+    In-process LRU of float32 embedding payloads.
+
+    Synchronous and lock-free: no operation awaits, so it is safe on the
+    event loop. Entries are the 4-byte-per-dimension bytes stored in Redis
+    and are decoded on read. Embeddings never change for a (model, text)
+    key, so there is no TTL.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a payload, or None if not cached."""
+        payload = self._entries.get(key)
+        if payload is not None:
+            self._entries.move_to_end(key)
+        return payload
+
+    def set(self, key: str, payload: bytes) -> None:
+        """Store a payload, evicting the least recently used if full."""
+        self._entries[key] = payload
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+# Shared by every EmbeddingCache in the process, so entries outlive the
+# ingestion job that created them
+_local_embeddings = _LocalEmbeddingLRU(max_size=settings.embedding_local_cache_size)
+
+
 class EmbeddingCache:
-    """Cache embeddings in Redis to avoid regenerating."""
+    """Cache embeddings in Redis (fronted by an in-process LRU) to avoid regenerating."""
 
     def __init__(
         self,
         redis_url: Optional[str] = None,
         ttl: int = 86400 * 7,  # 7 days default
-        prefix: str = "embed:",
+        prefix: str = "embed:v2:",  # v2: raw float32 bytes (v1 was JSON)
     ):
         """
         Initialize embedding cache.
@@ -41,7 +93,7 @@ class EmbeddingCache:
         self.client = await redis.from_url(
             self.redis_url,
             encoding="utf-8",
-            decode_responses=False,  # We'll handle JSON serialization
+            decode_responses=False,  # Values are raw float32 bytes
             max_connections=settings.redis_max_connections,
         )
 
@@ -58,14 +110,19 @@ class EmbeddingCache:
         Returns:
             Cached embedding or None if not found
         """
-        await self.initialize()
-
         cache_key = self._make_key(text, model)
 
+        payload = _local_embeddings.get(cache_key)
+        if payload is not None:
+            return self._deserialize(payload)
+
+        await self.initialize()
+
         try:
             cached = await self.client.get(cache_key)
             if cached:
-                embedding = json.loads(cached)
+                embedding = self._deserialize(cached)
+                _local_embeddings.set(cache_key, cached)
                 logger.debug("Cache hit", key=cache_key[:50])
                 return embedding
         except Exception as e:
@@ -90,12 +147,14 @@ class EmbeddingCache:
         await self.initialize()
 
         cache_key = self._make_key(text, model)
+        payload = self._serialize(embedding)
+        _local_embeddings.set(cache_key, payload)
 
         try:
             await self.client.setex(
                 cache_key,
                 self.ttl,
-                json.dumps(embedding),
+                payload,
             )
             logger.debug("Cached embedding", key=cache_key[:50])
         except Exception as e:
@@ -116,31 +175,38 @@ class EmbeddingCache:
         Returns:
             Dict mapping texts to their cached embeddings
         """
-        await self.initialize()
-
         if not texts:
             return {}
 
-        # Build cache keys
-        keys = [self._make_key(text, model) for text in texts]
+        # Serve what we can from the in-process LRU; only ask Redis for the rest
+        cached: Dict[str, List[float]] = {}
+        missing: List[Tuple[str, str]] = []
+        for text in texts:
+            key = self._make_key(text, model)
+            payload = _local_embeddings.get(key)
+            if payload is not None:
+                cached[text] = self._deserialize(payload)
+            else:
+                missing.append((text, key))
+
+        if not missing:
+            return cached
 
-        try:
-            # Use pipeline for efficiency
-            pipe = self.client.pipeline()
-            for key in keys:
-                pipe.get(key)
+        await self.initialize()
 
-            results = await pipe.execute()
+        try:
+            # Single MGET: one command and one reply frame for the whole batch
+            results = await self.client.mget([key for _, key in missing])
 
-            # Build result dict
-            cached = {}
-            for text, result in zip(texts, results):
+            for (text, key), result in zip(missing, results):
                 if result:
                     try:
-                        embedding = json.loads(result)
-                        cached[text] = embedding
+                        embedding = self._deserialize(result)
                     except Exception as e:
                         logger.warning("Failed to deserialize cached embedding", error=str(e))
+                        continue
+                    cached[text] = embedding
+                    _local_embeddings.set(key, result)
 
             if cached:
                 logger.debug("Cache hits", count=len(cached), total=len(texts))
@@ -149,13 +215,13 @@ class EmbeddingCache:
 
         except Exception as e:
             logger.warning("Cache get_many error", error=str(e))
-            return {}
+            return cached
 
     async def set_many(
         self,
         texts: List[str],
         model: str,
-        embeddings: List[List[float]],
+        embeddings: Union[np.ndarray, List[List[float]]],
     ) -> None:
         """
         Cache multiple embeddings.
@@ -167,7 +233,7 @@ class EmbeddingCache:
         """
         await self.initialize()
 
-        if not texts or not embeddings:
+        if not texts or len(embeddings) == 0:
             return
 
         if len(texts) != len(embeddings):
@@ -175,14 +241,19 @@ class EmbeddingCache:
             return
 
         try:
-            # Use pipeline for efficiency
-            pipe = self.client.pipeline()
+            # Pipeline SET ... EX ... NX: keeps per-key TTLs (which MSET can't)
+            # and skips rewriting entries that are already cached
+            pipe = self.client.pipeline(transaction=False)
             for text, embedding in zip(texts, embeddings):
                 cache_key = self._make_key(text, model)
-                pipe.setex(
+                payload = self._serialize(embedding)
+                # The packed copy, not the caller's row, so the batch isn't pinned
+                _local_embeddings.set(cache_key, payload)
+                pipe.set(
                     cache_key,
-                    self.ttl,
-                    json.dumps(embedding),
+                    payload,
+                    ex=self.ttl,
+                    nx=True,
                 )
 
             await pipe.execute()
@@ -198,11 +269,21 @@ class EmbeddingCache:
             self.client = None
             logger.info("Embedding cache closed")
 
+    @staticmethod
+    def _serialize(embedding: List[float]) -> bytes:
+        """Pack an embedding as float32 bytes (4 bytes per dimension)."""
+        return np.asarray(embedding, dtype=np.float32).tobytes()
+
+    @staticmethod
+    def _deserialize(data: bytes) -> List[float]:
+        """Unpack float32 bytes into an embedding."""
+        return np.frombuffer(data, dtype=np.float32).tolist()
+
     def _make_key(self, text: str, model: str) -> str:
         """
         Create cache key from text and model.
 
-        Uses hash of text + model to create a stable key.
+        Uses a hash of text + model to create a stable key.
 
         Args:
             text: Text content
@@ -211,8 +292,4 @@ class EmbeddingCache:
         Returns:
             Cache key
         """
-        # Create hash from text + model
-        content = f"{model}:{text}"
-        hash_value = hashlib.sha256(content.encode()).hexdigest()
-
-        return f"{self.prefix}{hash_value}"
+        return _cache_key(self.prefix, model, text)
@@ -1,17 +1,37 @@
 """Local embedding generation using sentence-transformers."""
 
 import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from sentence_transformers import SentenceTransformer
 
-from docvector.core import get_logger, settings
+from docvector.core import DocVectorException, get_logger, settings
 
+from ._normalize import l2_normalize_
 from .base import BaseEmbedder
 
 logger = get_logger(__name__)
 
+# Concurrent encode calls allowed per device. PyTorch already spreads one
+# CPU encode over every core, so parallel CPU calls only fight each other.
+CPU_ENCODE_CONCURRENCY = 1
+ACCELERATOR_ENCODE_CONCURRENCY = 4
+
+PRECISION_DTYPES = {"float32": np.float32, "float16": np.float16}
+BACKENDS = ("torch", "onnx", "openvino")
+
+# Batch sizes probed by embedding_autotune, on this many chunk-length texts
+AUTOTUNE_BATCH_SIZES = (16, 32, 64, 128)
+AUTOTUNE_SAMPLE_SIZE = 128
+
+# Process-wide embedders keyed on (model_name, device, precision, backend)
+_shared_embedders: Dict[Tuple[str, str, str, str], "LocalEmbedder"] = {}
+
 
 class LocalEmbedder(BaseEmbedder):
     """Local embedding generator using sentence-transformers."""
@@ -21,6 +41,8 @@ class LocalEmbedder(BaseEmbedder):
         model_name: Optional[str] = None,
         device: Optional[str] = None,
         batch_size: Optional[int] = None,
+        precision: Optional[str] = None,
+        backend: Optional[str] = None,
     ):
         """
         Initialize local embedder.
@@ -29,33 +51,81 @@ class LocalEmbedder(BaseEmbedder):
             model_name: Name of the sentence-transformers model
             device: Device to use (cpu, cuda, mps)
             batch_size: Batch size for encoding
+            precision: Output precision (float16 or float32)
+            backend: Inference backend (torch, onnx, openvino)
         """
         self.model_name = model_name or settings.embedding_model
         self.device = device or settings.embedding_device
         self.batch_size = batch_size or settings.embedding_batch_size
+        self._autotune = settings.embedding_autotune and batch_size is None
+        self.precision = precision or settings.embedding_precision
+        if self.precision not in PRECISION_DTYPES:
+            raise DocVectorException(
+                code="INVALID_CONFIG",
+                message=f"Unsupported embedding precision: {self.precision}",
+                details={"supported": list(PRECISION_DTYPES)},
+            )
+        self._dtype = PRECISION_DTYPES[self.precision]
+        self.backend = backend or settings.embedding_backend
+        if self.backend not in BACKENDS:
+            raise DocVectorException(
+                code="INVALID_CONFIG",
+                message=f"Unsupported embedding backend: {self.backend}",
+                details={"supported": list(BACKENDS)},
+            )
         self.model: Optional[SentenceTransformer] = None
         self._dimension: Optional[int] = None
+        self._embed_sem: Optional[asyncio.Semaphore] = None
+        self._embed_pool: Optional[ThreadPoolExecutor] = None
+        self._mp_pool: Optional[Dict[str, Any]] = None
+        self._init_lock = asyncio.Lock()
+        self._shared = False
 
     async def initialize(self) -> None:
         """Load the sentence-transformers model."""
-        if self.model is not None:
+        if self._embed_sem is not None:
             return
 
+        async with self._init_lock:
+            if self._embed_sem is None:
+                await self._load()
+
+    async def _load(self) -> None:
+        """Load the model, start encode pools and run a warm-up batch."""
         logger.info(
             "Loading sentence-transformers model",
             model=self.model_name,
             device=self.device,
+            backend=self.backend,
         )
 
         # Load model in executor to avoid blocking
         loop = asyncio.get_event_loop()
 
         def load_model():
+            if self.backend != "torch":
+                # ONNX Runtime / OpenVINO run fused (optionally quantized) kernels
+                model_kwargs = (
+                    {"file_name": settings.embedding_model_file}
+                    if settings.embedding_model_file
+                    else None
+                )
+                return SentenceTransformer(
+                    self.model_name,
+                    device=self.device,
+                    backend=self.backend,
+                    model_kwargs=model_kwargs,
+                )
+
             # Load model without device parameter first to avoid meta tensor issues
             model = SentenceTransformer(self.model_name)
             # Then move to device if needed
             if self.device and self.device != "cpu":
                 model = model.to(self.device)
+                # Half-precision weights halve memory traffic on GPUs; CPUs
+                # have no fast fp16 matmul, so they keep fp32 weights
+                if self.precision == "float16":
+                    model = model.half()
             return model
 
         self.model = await loop.run_in_executor(None, load_model)
@@ -63,46 +133,148 @@ class LocalEmbedder(BaseEmbedder):
         # Get embedding dimension
         self._dimension = self.model.get_sentence_embedding_dimension()
 
+        # Slow (pure-Python) tokenizers can cost as much as the encode itself
+        tokenizer = getattr(self.model, "tokenizer", None)
+        if tokenizer is not None and not getattr(tokenizer, "is_fast", True):
+            logger.warning(
+                "Model has no fast tokenizer; install `tokenizers` or use a model that ships tokenizer.json",
+                model=self.model_name,
+            )
+
+        # Dedicated encode pool, sized so concurrent callers queue instead of
+        # oversubscribing the CPU
+        if self.device == "cpu":
+            import torch
+
+            torch.set_num_threads(os.cpu_count() or 1)
+            concurrency = CPU_ENCODE_CONCURRENCY
+        else:
+            concurrency = ACCELERATOR_ENCODE_CONCURRENCY
+        self._embed_pool = ThreadPoolExecutor(
+            max_workers=concurrency, thread_name_prefix="embed"
+        )
+
+        # Bulk batches fan out over every GPU (or embedding_workers processes)
+        target_devices = self._multi_process_devices()
+        if target_devices:
+            self._mp_pool = await loop.run_in_executor(
+                None,
+                partial(self.model.start_multi_process_pool, target_devices=target_devices),
+            )
+
+        # First encode pays for CUDA kernel setup and tokenizer caches; take
+        # that hit here rather than on the first real request
+        await loop.run_in_executor(
+            self._embed_pool,
+            partial(self.model.encode, ["warmup"], show_progress_bar=False),
+        )
+
+        if self._autotune:
+            self.batch_size = await loop.run_in_executor(self._embed_pool, self._autotune_batch_size)
+
+        # Set last: initialize() treats the semaphore as the ready flag
+        self._embed_sem = asyncio.Semaphore(concurrency)
+
         logger.info(
             "Model loaded successfully",
             model=self.model_name,
             dimension=self._dimension,
+            encode_processes=len(target_devices) if target_devices else 0,
         )
 
-    async def embed(self, texts: List[str]) -> List[List[float]]:
+    def _autotune_batch_size(self) -> int:
+        """Time encode at each candidate batch size and return the fastest."""
+        # Texts at the configured chunk length, the size ingestion embeds
+        words = "lorem ipsum dolor sit amet consectetur adipiscing elit "
+        text = (words * (settings.chunk_size // len(words) + 1))[: settings.chunk_size]
+        sample = [text] * AUTOTUNE_SAMPLE_SIZE
+
+        timings: Dict[int, float] = {}
+        for batch_size in AUTOTUNE_BATCH_SIZES:
+            start = time.perf_counter()
+            self.model.encode(sample, batch_size=batch_size, show_progress_bar=False)
+            timings[batch_size] = time.perf_counter() - start
+
+        best = min(timings, key=timings.__getitem__)
+        logger.info(
+            "Embedding batch size tuned",
+            model=self.model_name,
+            batch_size=best,
+            timings={size: round(seconds, 3) for size, seconds in timings.items()},
+        )
+        return best
+
+    def _multi_process_devices(self) -> Optional[List[str]]:
+        """Devices for the multi-process encode pool, or None for single-device only."""
+        if self.backend != "torch":
+            return None
+
+        if self.device == "cuda":
+            import torch
+
+            gpu_count = torch.cuda.device_count()
+            if gpu_count > 1:
+                return [f"cuda:{i}" for i in range(gpu_count)]
+
+        if settings.embedding_workers > 1:
+            return [self.device] * settings.embedding_workers
+
+        return None
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings for multiple texts."""
         await self.initialize()
 
         if not texts:
-            return []
+            return np.empty((0, self.get_dimension()), dtype=self._dtype)
 
         logger.debug("Generating embeddings", count=len(texts))
 
-        # Encode in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(
-            None,
-            partial(
+        # Sort by length so each mini-batch pads to similar-sized inputs
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+
+        sorted_texts = [texts[i] for i in order]
+
+        if (
+            self._mp_pool is not None
+            and len(texts) >= settings.embedding_multi_process_min_texts
+        ):
+            encode = partial(
+                self.model.encode_multi_process,
+                sorted_texts,
+                self._mp_pool,
+                batch_size=self.batch_size,
+            )
+        else:
+            encode = partial(
                 self.model.encode,
-                texts,
+                sorted_texts,
                 batch_size=self.batch_size,
                 show_progress_bar=False,
                 convert_to_numpy=True,
-                normalize_embeddings=True,  # Normalize for cosine similarity
-            ),
-        )
+                normalize_embeddings=False,
+            )
+
+        # Encode in the dedicated pool to avoid blocking
+        loop = asyncio.get_event_loop()
+        async with self._embed_sem:
+            sorted_embeddings = await loop.run_in_executor(self._embed_pool, encode)
 
-        # Convert to list of lists
-        result = embeddings.tolist()
+        # Normalize for cosine similarity before any down-cast to float16
+        l2_normalize_(sorted_embeddings)
 
-        logger.debug("Embeddings generated", count=len(result))
+        # Scatter back into input order
+        embeddings = np.empty(sorted_embeddings.shape, dtype=self._dtype)
+        embeddings[order] = sorted_embeddings
 
-        return result
+        logger.debug("Embeddings generated", count=len(embeddings))
 
-    async def embed_query(self, text: str) -> List[float]:
+        return embeddings
+
+    async def embed_query(self, text: str) -> np.ndarray:
         """Generate embedding for a single query text."""
         result = await self.embed([text])
-        return result[0] if result else []
+        return result[0]
 
     def get_dimension(self) -> int:
         """Get embedding dimension."""
@@ -111,6 +283,57 @@ class LocalEmbedder(BaseEmbedder):
         return self._dimension
 
     async def close(self) -> None:
-        """Cleanup resources."""
+        """Cleanup resources (shared embedders stay loaded until close_local_embedders)."""
+        if self._shared:
+            return
+        await self._release()
+
+    async def _release(self) -> None:
+        """Stop encode pools and drop the model."""
+        if self._mp_pool is not None:
+            SentenceTransformer.stop_multi_process_pool(self._mp_pool)
+            self._mp_pool = None
         self.model = None
+        if self._embed_pool is not None:
+            self._embed_pool.shutdown(wait=False)
+            self._embed_pool = None
+            self._embed_sem = None
         logger.info("Local embedder closed")
+
+
+def get_local_embedder(
+    model_name: Optional[str] = None,
+    device: Optional[str] = None,
+    precision: Optional[str] = None,
+    backend: Optional[str] = None,
+) -> LocalEmbedder:
+    """
+    Get the process-wide embedder for a model configuration.
+
+    The model stays loaded across requests and services; close() on the
+    returned embedder is a no-op. Call close_local_embedders() at shutdown.
+
+    Returns:
+        Shared LocalEmbedder instance (initialize() before use)
+    """
+    key = (
+        model_name or settings.embedding_model,
+        device or settings.embedding_device,
+        precision or settings.embedding_precision,
+        backend or settings.embedding_backend,
+    )
+    embedder = _shared_embedders.get(key)
+    if embedder is None:
+        embedder = LocalEmbedder(
+            model_name=key[0], device=key[1], precision=key[2], backend=key[3]
+        )
+        embedder._shared = True
+        _shared_embedders[key] = embedder
+    return embedder
+
+
+async def close_local_embedders() -> None:
+    """Unload all shared embedders."""
+    while _shared_embedders:
+        _, embedder = _shared_embedders.popitem()
+        await embedder._release()
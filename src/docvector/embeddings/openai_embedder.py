@@ -1,10 +1,15 @@
 """OpenAI embedding generation."""
 
+import asyncio
+import base64
 from typing import List, Optional
 
 import httpx
+import numpy as np
+import orjson
 
 from docvector.core import DocVectorException, get_logger, settings
+from docvector.utils.http_client import get_http_client
 
 from .base import BaseEmbedder
 
@@ -14,6 +19,8 @@ logger = get_logger(__name__)
 class OpenAIEmbedder(BaseEmbedder):
     """OpenAI embedding generator using their API."""
 
+    API_URL = "https://api.openai.com/v1/embeddings"
+
     # Model dimensions
     MODEL_DIMENSIONS = {
         "text-embedding-ada-002": 1536,
@@ -26,6 +33,7 @@ class OpenAIEmbedder(BaseEmbedder):
         api_key: Optional[str] = None,
         model: str = "text-embedding-3-small",
         batch_size: int = 100,
+        concurrency: Optional[int] = None,
     ):
         """
         Initialize OpenAI embedder.
@@ -34,6 +42,7 @@ class OpenAIEmbedder(BaseEmbedder):
             api_key: OpenAI API key
             model: OpenAI embedding model name
             batch_size: Batch size for API calls
+            concurrency: Max batch requests in flight at once
         """
         self.api_key = api_key or settings.openai_api_key
         if not self.api_key:
@@ -45,60 +54,71 @@ class OpenAIEmbedder(BaseEmbedder):
 
         self.model = model
         self.batch_size = batch_size
+        self.concurrency = concurrency or settings.openai_embedding_concurrency
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
         self.client: Optional[httpx.AsyncClient] = None
 
     async def initialize(self) -> None:
-        """Initialize HTTP client."""
+        """Attach to the shared keep-alive HTTP client."""
         if self.client is not None:
             return
 
-        self.client = httpx.AsyncClient(
-            base_url="https://api.openai.com/v1",
-            headers={
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json",
-            },
-            timeout=30.0,
-        )
+        self.client = get_http_client()
 
         logger.info("OpenAI embedder initialized", model=self.model)
 
-    async def embed(self, texts: List[str]) -> List[List[float]]:
+    async def embed(self, texts: List[str]) -> np.ndarray:
         """Generate embeddings using OpenAI API."""
         await self.initialize()
 
         if not texts:
-            return []
+            return np.empty((0, self.get_dimension()), dtype=np.float32)
 
         logger.debug("Generating OpenAI embeddings", count=len(texts))
 
-        # Process in batches
-        all_embeddings = []
-        for i in range(0, len(texts), self.batch_size):
-            batch = texts[i : i + self.batch_size]
-            batch_embeddings = await self._embed_batch(batch)
-            all_embeddings.extend(batch_embeddings)
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+
+        if len(batches) == 1:
+            all_embeddings = await self._embed_batch(batches[0])
+        else:
+            # Keep several batches in flight on the shared pool instead of
+            # paying one round trip per batch back to back
+            sem = asyncio.Semaphore(self.concurrency)
+
+            async def embed_one(batch: List[str]) -> np.ndarray:
+                async with sem:
+                    return await self._embed_batch(batch)
+
+            results = await asyncio.gather(*(embed_one(batch) for batch in batches))
+            all_embeddings = np.concatenate(results)
 
         logger.debug("OpenAI embeddings generated", count=len(all_embeddings))
 
         return all_embeddings
 
-    async def _embed_batch(self, texts: List[str]) -> List[List[float]]:
+    async def _embed_batch(self, texts: List[str]) -> np.ndarray:
         """Embed a single batch."""
         try:
             response = await self.client.post(
-                "/embeddings",
+                self.API_URL,
+                headers=self.headers,
                 json={
                     "input": texts,
                     "model": self.model,
+                    # Raw little-endian float32 instead of decimal JSON floats:
+                    # ~4x smaller body and no per-float parsing
+                    "encoding_format": "base64",
                 },
             )
             response.raise_for_status()
 
-            data = response.json()
-            embeddings = [item["embedding"] for item in data["data"]]
+            data = orjson.loads(response.content)["data"]
+            raw = b"".join(base64.b64decode(item["embedding"]) for item in data)
 
-            return embeddings
+            return np.frombuffer(raw, dtype="<f4").reshape(len(data), -1)
 
         except httpx.HTTPStatusError as e:
             logger.error("OpenAI API error", status=e.response.status_code, error=str(e))
@@ -119,18 +139,17 @@ class OpenAIEmbedder(BaseEmbedder):
                 details={"error": str(e)},
             ) from e
 
-    async def embed_query(self, text: str) -> List[float]:
+    async def embed_query(self, text: str) -> np.ndarray:
         """Generate embedding for a single query text."""
         result = await self.embed([text])
-        return result[0] if result else []
+        return result[0]
 
     def get_dimension(self) -> int:
         """Get embedding dimension for the model."""
         return self.MODEL_DIMENSIONS.get(self.model, 1536)
 
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Release the HTTP client (the shared pool stays open for other users)."""
         if self.client:
-            await self.client.aclose()
             self.client = None
             logger.info("OpenAI embedder closed")
@@ -1,11 +1,15 @@
 """Base interface for document fetchers."""
 
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import AsyncIterator, Dict, List, Optional
 
+# __slots__ dataclasses need Python 3.10+
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class FetchedDocument:
     """A document fetched from a source."""
 
@@ -17,7 +21,7 @@ class FetchedDocument:
 
     def __post_init__(self):
         if self.metadata is None:
-            self.metadata = {}
+            object.__setattr__(self, "metadata", {})
 
 
 class BaseFetcher(ABC):
@@ -36,6 +40,22 @@ class BaseFetcher(ABC):
         """
         pass
 
+    async def fetch_stream(self, config: Dict) -> AsyncIterator[FetchedDocument]:
+        """
+        Yield documents from a source as they are fetched.
+
+        Fetchers that can hand pages over before the whole crawl finishes
+        override this; the default yields the result of fetch().
+
+        Args:
+            config: Source configuration
+
+        Yields:
+            Fetched documents
+        """
+        for document in await self.fetch(config):
+            yield document
+
     @abstractmethod
     async def fetch_single(self, url: str, config: Optional[Dict] = None) -> FetchedDocument:
         """
@@ -1,8 +1,10 @@
 """Crawl4AI-based web crawler for fast, AI-optimized document fetching."""
 
 import asyncio
-from typing import Dict, List, Optional, Set
-from urllib.parse import urlparse, urljoin
+import re
+from functools import lru_cache
+from typing import AbstractSet, AsyncIterator, Dict, List, Optional, Set
+from urllib.parse import quote, unquote, urljoin, urlparse, urlunparse
 from urllib.robotparser import RobotFileParser
 
 from crawl4ai import AsyncWebCrawler, BrowserConfig, CrawlerRunConfig, CacheMode
@@ -15,11 +17,90 @@ except ImportError:
     HAS_URL_SEEDER = False
 
 from docvector.core import DocVectorException, get_logger, settings
+from docvector.utils.http_client import get_http_client
 
 from .base import BaseFetcher, FetchedDocument
 
 logger = get_logger(__name__)
 
+# The same URLs are parsed by normalization, filtering and robots checks
+_parse = lru_cache(maxsize=100_000)(urlparse)
+
+# Common non-content extensions, matched against the URL path
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+
+_SKIP_RE = re.compile(r"\.(?:pdf|png|jpe?g|gif|svg|css|js|ico|woff2?|ttf|eot)$", re.IGNORECASE)
+
+
+def _domain_allowed(netloc: str, allowed_domains: AbstractSet[str]) -> bool:
+    """Check whether netloc or one of its parent domains is allowed.
+
+    One set lookup per domain label instead of a suffix compare per
+    allowed domain; only whole labels match, so "notexample.com" is not
+    accepted for "example.com".
+    """
+    while True:
+        if netloc in allowed_domains:
+            return True
+        dot = netloc.find(".")
+        if dot == -1:
+            return False
+        netloc = netloc[dot + 1 :]
+
+
+class _RobotsRules:
+    """
+    robots.txt decisions for one host, precompiled for our user agent.
+
+    RobotFileParser.can_fetch re-checks every entry's user agents and walks
+    the matching rule list on each call. Here the entry is picked once and
+    its rules become a single regex alternation. Alternation tries branches
+    in order, so the first matching rule still wins, as in robots.txt.
+    """
+
+    __slots__ = ("_verdict", "_pattern")
+
+    def __init__(self, rp: RobotFileParser, user_agent: str):
+        self._verdict: Optional[bool] = None
+        self._pattern: Optional[re.Pattern] = None
+
+        if rp.disallow_all:
+            self._verdict = False
+        elif rp.allow_all:
+            self._verdict = True
+        elif not rp.last_checked:
+            self._verdict = False  # Never loaded; can_fetch refuses too
+        else:
+            entry = next(
+                (e for e in rp.entries if e.applies_to(user_agent)),
+                rp.default_entry,
+            )
+            if entry is None or not entry.rulelines:
+                self._verdict = True
+            else:
+                self._pattern = re.compile(
+                    "|".join(
+                        f"(?P<{'a' if line.allowance else 'd'}{i}>{self._rule_regex(line.path)})"
+                        for i, line in enumerate(entry.rulelines)
+                    )
+                )
+
+    @staticmethod
+    def _rule_regex(path: str) -> str:
+        """Prefix pattern for a rule path; RuleLine.applies_to treats "*" as match-all."""
+        return "" if path == "*" else re.escape(path)
+
+    def can_fetch(self, url: str) -> bool:
+        """Check a URL against the compiled rules."""
+        if self._verdict is not None:
+            return self._verdict
+
+        # Same path form RobotFileParser.can_fetch matches against
+        parsed = urlparse(unquote(url))
+        path = quote(urlunparse(("", "", parsed.path, parsed.params, parsed.query, parsed.fragment)))
+        match = self._pattern.match(path or "/")
+        return match is None or match.lastgroup[0] == "a"
+
 
 class Crawl4AICrawler(BaseFetcher):
     """
@@ -57,7 +138,8 @@ class Crawl4AICrawler(BaseFetcher):
         self.respect_robots = respect_robots
         self.headless = headless
         self._crawler: Optional[AsyncWebCrawler] = None
-        self._robots_cache: Dict[str, RobotFileParser] = {}
+        self._robots_cache: Dict[str, _RobotsRules] = {}
+        self._robots_allowed: Dict[str, bool] = {}
 
     async def _get_crawler(self) -> AsyncWebCrawler:
         """Get or create the crawler instance."""
@@ -80,6 +162,17 @@ class Crawl4AICrawler(BaseFetcher):
         """
         Fetch documents from a website using Crawl4AI with BFS crawling.
 
+        See fetch_stream for the config format.
+        """
+        return [doc async for doc in self.fetch_stream(config)]
+
+    async def fetch_stream(self, config: Dict) -> AsyncIterator[FetchedDocument]:
+        """
+        Yield documents from a website as soon as each page is fetched.
+
+        Lets callers process and embed early pages while the rest of the
+        crawl is still running.
+
         Config format:
         {
             "start_url": "https://docs.example.com",
@@ -103,7 +196,7 @@ class Crawl4AICrawler(BaseFetcher):
 
         # Auto-detect allowed domain from start URL if not specified
         if not allowed_domains:
-            parsed = urlparse(start_url)
+            parsed = _parse(self._normalize_url(start_url))
             allowed_domains = [parsed.netloc]
 
         logger.info(
@@ -117,26 +210,36 @@ class Crawl4AICrawler(BaseFetcher):
         try:
             crawler = await self._get_crawler()
 
-            # Load robots.txt if respecting it
+            # robots.txt and sitemap discovery are independent requests to the
+            # same host, so run them concurrently
+            startup = []
             if respect_robots:
-                await self._load_robots_txt(start_url)
+                startup.append(self._load_robots_txt(start_url))
 
             # Try sitemap-based discovery first (more efficient)
             urls_to_fetch = None
             use_sitemap = config.get("use_sitemap", True)
 
             if use_sitemap and HAS_URL_SEEDER:
-                urls_to_fetch = await self._discover_from_sitemap(
-                    start_url=start_url,
-                    max_pages=max_pages,
-                    url_pattern=config.get("url_pattern"),
-                    respect_robots=respect_robots,
+                startup.append(
+                    self._discover_from_sitemap(
+                        start_url=start_url,
+                        max_pages=max_pages,
+                        url_pattern=config.get("url_pattern"),
+                    )
                 )
 
+            if startup:
+                urls_to_fetch = (await asyncio.gather(*startup))[-1]
+
+            # Filter by robots.txt now that it has loaded
+            if urls_to_fetch and respect_robots:
+                urls_to_fetch = [url for url in urls_to_fetch if self._can_fetch(url)]
+
             # If sitemap discovery found URLs, fetch them
             if urls_to_fetch:
                 logger.info("Using sitemap-based crawling", urls=len(urls_to_fetch))
-                documents = await self._fetch_urls_batch(
+                documents = self._fetch_urls_stream(
                     crawler=crawler,
                     urls=urls_to_fetch,
                     respect_robots=respect_robots,
@@ -144,7 +247,7 @@ class Crawl4AICrawler(BaseFetcher):
             else:
                 # Fall back to BFS crawling
                 logger.info("Using BFS-based crawling")
-                documents = await self._crawl_bfs(
+                documents = self._crawl_bfs(
                     crawler=crawler,
                     start_url=start_url,
                     max_pages=max_pages,
@@ -153,8 +256,12 @@ class Crawl4AICrawler(BaseFetcher):
                     respect_robots=respect_robots,
                 )
 
-            logger.info("Crawl4AI crawl completed", documents=len(documents))
-            return documents
+            count = 0
+            async for doc in documents:
+                count += 1
+                yield doc
+
+            logger.info("Crawl4AI crawl completed", documents=count)
 
         except Exception as e:
             logger.error("Crawl4AI crawl failed", error=str(e))
@@ -162,7 +269,7 @@ class Crawl4AICrawler(BaseFetcher):
 
     async def _load_robots_txt(self, url: str) -> None:
         """Load and cache robots.txt for the domain."""
-        parsed = urlparse(url)
+        parsed = _parse(self._normalize_url(url))
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
         if base_url in self._robots_cache:
@@ -173,42 +280,56 @@ class Crawl4AICrawler(BaseFetcher):
         rp.set_url(robots_url)
 
         try:
-            # Fetch robots.txt
-            loop = asyncio.get_running_loop()
-            await loop.run_in_executor(None, rp.read)
-            self._robots_cache[base_url] = rp
+            # Fetch on the shared async client instead of blocking an executor
+            # thread on RobotFileParser.read(); status handling mirrors read()
+            response = await get_http_client().get(
+                robots_url,
+                headers={"User-Agent": settings.crawler_user_agent},
+                follow_redirects=True,
+            )
+            if response.status_code in (401, 403):
+                rp.disallow_all = True
+            elif 400 <= response.status_code < 500:
+                rp.allow_all = True
+            else:
+                response.raise_for_status()
+                rp.parse(response.text.splitlines())
+            self._robots_cache[base_url] = _RobotsRules(rp, settings.crawler_user_agent)
             logger.debug("Loaded robots.txt", url=robots_url)
         except Exception as e:
             logger.warning("Failed to load robots.txt", url=robots_url, error=str(e))
-            # Create permissive parser on failure
-            self._robots_cache[base_url] = rp
+            # An unread parser refuses every URL, same as RobotFileParser
+            self._robots_cache[base_url] = _RobotsRules(rp, settings.crawler_user_agent)
 
     def _can_fetch(self, url: str) -> bool:
         """Check if URL is allowed by robots.txt."""
         if not self.respect_robots:
             return True
 
-        parsed = urlparse(url)
+        parsed = _parse(url)
         base_url = f"{parsed.scheme}://{parsed.netloc}"
 
-        rp = self._robots_cache.get(base_url)
-        if not rp:
+        rules = self._robots_cache.get(base_url)
+        if not rules:
             return True  # Allow if robots.txt not loaded
 
-        return rp.can_fetch(settings.crawler_user_agent, url)
+        allowed = self._robots_allowed.get(url)
+        if allowed is None:
+            allowed = rules.can_fetch(url)
+            self._robots_allowed[url] = allowed
+        return allowed
 
     async def _discover_from_sitemap(
         self,
         start_url: str,
         max_pages: int,
         url_pattern: Optional[str] = None,
-        respect_robots: bool = True,
     ) -> Optional[List[str]]:
         """Discover URLs from sitemap.xml using Crawl4AI's AsyncUrlSeeder."""
         if not HAS_URL_SEEDER:
             return None
 
-        parsed = urlparse(start_url)
+        parsed = _parse(start_url)
         domain = parsed.netloc
 
         try:
@@ -226,10 +347,6 @@ class Crawl4AICrawler(BaseFetcher):
                     logger.debug("No URLs found in sitemap", domain=domain)
                     return None
 
-                # Filter by robots.txt if needed
-                if respect_robots:
-                    urls = [url for url in urls if self._can_fetch(url)]
-
                 logger.info("Discovered URLs from sitemap", count=len(urls), domain=domain)
                 return urls[:max_pages]
 
@@ -237,15 +354,14 @@ class Crawl4AICrawler(BaseFetcher):
             logger.warning("Sitemap discovery failed, will use BFS", error=str(e))
             return None
 
-    async def _fetch_urls_batch(
+    async def _fetch_urls_stream(
         self,
         crawler: AsyncWebCrawler,
         urls: List[str],
         respect_robots: bool = True,
-    ) -> List[FetchedDocument]:
-        """Fetch multiple URLs concurrently in batches."""
+    ) -> AsyncIterator[FetchedDocument]:
+        """Fetch multiple URLs concurrently, yielding documents as they complete."""
         semaphore = asyncio.Semaphore(self.concurrent_requests)
-        documents: List[FetchedDocument] = []
 
         async def fetch_one(url: str) -> Optional[FetchedDocument]:
             if respect_robots and not self._can_fetch(url):
@@ -283,14 +399,20 @@ class Crawl4AICrawler(BaseFetcher):
                     return None
 
         # Fetch all URLs concurrently
-        tasks = [fetch_one(url) for url in urls]
-        results = await asyncio.gather(*tasks)
-
-        # Filter out None results
-        documents = [doc for doc in results if doc is not None]
-
-        logger.info("Batch fetch completed", fetched=len(documents), total=len(urls))
-        return documents
+        tasks = [asyncio.ensure_future(fetch_one(url)) for url in urls]
+        fetched = 0
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                doc = await next_done
+                if doc is not None:
+                    fetched += 1
+                    yield doc
+        finally:
+            # Stop outstanding fetches if the consumer stops early
+            for task in tasks:
+                task.cancel()
+
+        logger.info("Batch fetch completed", fetched=fetched, total=len(urls))
 
     async def fetch_single(self, url: str, config: Optional[Dict] = None) -> FetchedDocument:
         """Fetch a single URL using Crawl4AI."""
@@ -340,116 +462,150 @@ class Crawl4AICrawler(BaseFetcher):
         max_depth: int,
         allowed_domains: List[str],
         respect_robots: bool,
-    ) -> List[FetchedDocument]:
+    ) -> AsyncIterator[FetchedDocument]:
         """
-        Crawl website using BFS (breadth-first search).
+        Crawl website breadth-first with a pool of persistent workers.
 
-        Returns documents as they are fetched.
+        Each worker pulls the next URL from a shared FIFO queue and pushes
+        discovered links back, so one slow page never holds up the rest of
+        its depth level. Documents are yielded as they are fetched; the
+        bounded output queue pauses workers when the consumer falls behind.
         """
-        visited: Set[str] = set()
-        documents: List[FetchedDocument] = []
+        fetched = 0
+        allowed = frozenset(domain.lower() for domain in allowed_domains)
+        output: "asyncio.Queue[Optional[FetchedDocument]]" = asyncio.Queue(
+            maxsize=self.concurrent_requests * 2
+        )
 
-        # Queue: (url, depth)
-        queue: List[tuple[str, int]] = [(self._normalize_url(start_url), 0)]
+        # URLs are marked visited when queued so each is fetched once
+        start = self._normalize_url(start_url)
+        visited: Set[str] = {start}
 
-        semaphore = asyncio.Semaphore(self.concurrent_requests)
+        # Queue: (url, depth)
+        queue: "asyncio.Queue[tuple[str, int]]" = asyncio.Queue()
+        queue.put_nowait((start, 0))
+
+        async def fetch_and_extract(url: str, depth: int) -> Optional[tuple[FetchedDocument, List[str]]]:
+            try:
+                run_config = CrawlerRunConfig(
+                    cache_mode=CacheMode.BYPASS,
+                    process_iframes=False,
+                    remove_overlay_elements=True,
+                )
 
-        while queue and len(documents) < max_pages:
-            # Get batch of URLs at same depth level
-            batch: List[tuple[str, int]] = []
-            current_depth = queue[0][1] if queue else 0
-
-            while queue and queue[0][1] == current_depth and len(batch) < self.concurrent_requests:
-                url, depth = queue.pop(0)
-                if url not in visited:
-                    visited.add(url)
-                    batch.append((url, depth))
-
-            if not batch:
-                continue
-
-            logger.debug("Crawling batch", depth=current_depth, urls=len(batch))
-
-            # Fetch batch concurrently
-            async def fetch_and_extract(url: str, depth: int) -> Optional[tuple[FetchedDocument, List[str]]]:
-                async with semaphore:
-                    try:
-                        run_config = CrawlerRunConfig(
-                            cache_mode=CacheMode.BYPASS,
-                            process_iframes=False,
-                            remove_overlay_elements=True,
-                        )
+                result = await crawler.arun(url=url, config=run_config)
 
-                        result = await crawler.arun(url=url, config=run_config)
+                if not result.success:
+                    logger.warning("Failed to fetch", url=url)
+                    return None
 
-                        if not result.success:
-                            logger.warning("Failed to fetch", url=url)
-                            return None
+                content = result.markdown.raw_markdown if result.markdown else ""
+
+                doc = FetchedDocument(
+                    url=url,
+                    content=content.encode("utf-8"),
+                    mime_type="text/markdown",
+                    title=result.metadata.get("title") if result.metadata else None,
+                    metadata={
+                        "status_code": result.status_code,
+                        "crawl4ai": True,
+                        "depth": depth,
+                    },
+                )
 
-                        content = result.markdown.raw_markdown if result.markdown else ""
+                # Extract links for next level
+                new_links = []
+                if depth < max_depth and result.links:
+                    internal_links = result.links.get("internal", [])
+                    for link_info in internal_links:
+                        link_url = link_info.get("href", "") if isinstance(link_info, dict) else str(link_info)
+                        # Resolve relative hrefs against the page they came from
+                        normalized = self._normalize_url(urljoin(url, link_url))
+                        if normalized and self._should_crawl(normalized, allowed, respect_robots):
+                            if normalized not in visited:
+                                new_links.append(normalized)
+
+                return (doc, new_links)
+
+            except Exception as e:
+                logger.warning("Failed to fetch URL", url=url, error=str(e))
+                return None
 
-                        doc = FetchedDocument(
-                            url=url,
-                            content=content.encode("utf-8"),
-                            mime_type="text/markdown",
-                            title=result.metadata.get("title") if result.metadata else None,
-                            metadata={
-                                "status_code": result.status_code,
-                                "crawl4ai": True,
-                                "depth": depth,
-                            },
+        async def worker() -> None:
+            nonlocal fetched
+            while True:
+                url, depth = await queue.get()
+                try:
+                    # Drain remaining URLs without fetching once the limit is hit
+                    if fetched >= max_pages:
+                        continue
+
+                    result = await fetch_and_extract(url, depth)
+                    if result is None or fetched >= max_pages:
+                        continue
+
+                    doc, new_links = result
+                    fetched += 1
+
+                    # Add new links to queue, bounded by the pages still to fetch.
+                    # Failed URLs stay in visited only for dedup; they no longer
+                    # count against max_pages once they leave the queue
+                    for link in new_links:
+                        if fetched + queue.qsize() >= max_pages:
+                            break
+                        if link not in visited:
+                            visited.add(link)
+                            queue.put_nowait((link, depth + 1))
+
+                    if fetched % 50 == 0:
+                        logger.info(
+                            "Crawl progress",
+                            fetched=fetched,
+                            visited=len(visited),
+                            queue=queue.qsize(),
                         )
 
-                        # Extract links for next level
-                        new_links = []
-                        if depth < max_depth and result.links:
-                            internal_links = result.links.get("internal", [])
-                            for link_info in internal_links:
-                                link_url = link_info.get("href", "") if isinstance(link_info, dict) else str(link_info)
-                                normalized = self._normalize_url(link_url)
-                                if normalized and self._should_crawl(normalized, allowed_domains, respect_robots):
-                                    if normalized not in visited:
-                                        new_links.append(normalized)
-
-                        return (doc, new_links)
-
-                    except Exception as e:
-                        logger.warning("Failed to fetch URL", url=url, error=str(e))
-                        return None
-
-            # Fetch all URLs in batch
-            tasks = [fetch_and_extract(url, depth) for url, depth in batch]
-            results = await asyncio.gather(*tasks)
-
-            # Process results
-            for result in results:
-                if result is None:
-                    continue
-
-                doc, new_links = result
-                documents.append(doc)
-
-                # Add new links to queue
-                for link in new_links:
-                    if link not in visited and len(visited) + len(queue) < max_pages * 2:
-                        queue.append((link, doc.metadata.get("depth", 0) + 1))
-
-                if len(documents) >= max_pages:
+                    # Queue links before handing off so other workers keep going
+                    await output.put(doc)
+                finally:
+                    queue.task_done()
+
+        async def run_workers() -> None:
+            workers = [asyncio.create_task(worker()) for _ in range(self.concurrent_requests)]
+            try:
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            await output.put(None)
+
+        runner = asyncio.create_task(run_workers())
+        try:
+            while True:
+                doc = await output.get()
+                if doc is None:
                     break
-
-            logger.info("Crawl progress", fetched=len(documents), visited=len(visited), queue=len(queue))
-
-        return documents
+                yield doc
+        finally:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
 
     def _normalize_url(self, url: str) -> str:
-        """Normalize URL by removing fragments and trailing slashes."""
+        """Normalize URL: lowercase host, drop default port, fragment and trailing slash."""
         if not url:
             return ""
 
-        parsed = urlparse(url)
+        parsed = _parse(url)
+
+        # Hosts are case-insensitive and :80/:443 are implied by the scheme
+        netloc = parsed.netloc.lower()
+        default_port = _DEFAULT_PORTS.get(parsed.scheme)
+        if default_port and netloc.endswith(default_port):
+            netloc = netloc[: -len(default_port)]
 
         # Remove fragment
-        normalized = f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+        normalized = f"{parsed.scheme}://{netloc}{parsed.path}"
 
         # Remove trailing slash (except for root)
         if normalized.endswith("/") and parsed.path != "/":
@@ -461,25 +617,26 @@ class Crawl4AICrawler(BaseFetcher):
 
         return normalized
 
-    def _should_crawl(self, url: str, allowed_domains: List[str], respect_robots: bool = True) -> bool:
+    def _should_crawl(
+        self, url: str, allowed_domains: AbstractSet[str], respect_robots: bool = True
+    ) -> bool:
         """Check if URL should be crawled."""
         if not url:
             return False
 
-        parsed = urlparse(url)
+        parsed = _parse(url)
 
         # Skip non-http(s) URLs
         if parsed.scheme not in ("http", "https"):
             return False
 
         # Skip common non-content extensions
-        skip_extensions = {".pdf", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".css", ".js", ".ico", ".woff", ".woff2", ".ttf", ".eot"}
-        if any(parsed.path.lower().endswith(ext) for ext in skip_extensions):
+        if _SKIP_RE.search(parsed.path):
             return False
 
         # Check allowed domains
         if allowed_domains:
-            if not any(parsed.netloc.endswith(domain) for domain in allowed_domains):
+            if not _domain_allowed(parsed.netloc, allowed_domains):
                 return False
 
         # Check robots.txt
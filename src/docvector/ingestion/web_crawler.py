@@ -1,11 +1,22 @@
 """Web crawler for fetching documentation from websites."""
 
 import asyncio
-from typing import Dict, List, Optional, Set
-from urllib.parse import urljoin, urlparse
+import html
+import re
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlsplit, urlunsplit
 
 import aiohttp
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+
+# c-ares DNS resolution when installed (optional on Windows)
+try:
+    import aiodns  # noqa: F401
+
+    HAS_AIODNS = True
+except ImportError:
+    HAS_AIODNS = False
 
 from docvector.core import DocVectorException, get_logger, settings
 
@@ -13,6 +24,60 @@ from .base import BaseFetcher, FetchedDocument
 
 logger = get_logger(__name__)
 
+# <title> sits in <head>, so the first few KB almost always contain it
+_TITLE_RE = re.compile(rb"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+_TITLE_SCAN_BYTES = 8192
+
+
+# Implied by the scheme, so "host:443" and "host" are the same origin
+_DEFAULT_PORTS = {"http": ":80", "https": ":443"}
+# Click-tracking parameters that never change page content (plus any utm_*)
+_TRACKING_PARAMS = {"gclid", "fbclid", "msclkid"}
+
+
+def _canonicalize_url(url: str) -> str:
+    """
+    Canonical form of a URL, used to deduplicate the crawl frontier.
+
+    Lowercases scheme and host, drops the default port, the fragment, a
+    trailing slash and tracking query parameters. The remaining query is
+    kept (pagination etc.) and only re-encoded if something was removed.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+
+    netloc = parts.netloc.lower()
+    default_port = _DEFAULT_PORTS.get(scheme)
+    if default_port and netloc.endswith(default_port):
+        netloc = netloc[: -len(default_port)]
+
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path[:-1]
+
+    query = parts.query
+    if query:
+        params = parse_qsl(query, keep_blank_values=True)
+        kept = [
+            (key, value)
+            for key, value in params
+            if not key.lower().startswith("utm_") and key.lower() not in _TRACKING_PARAMS
+        ]
+        if len(kept) != len(params):
+            query = urlencode(kept)
+
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def _extract_title(content: bytes) -> Optional[str]:
+    """Extract the HTML <title>, falling back to a full parse if the regex misses."""
+    match = _TITLE_RE.search(content, 0, _TITLE_SCAN_BYTES)
+    if match:
+        title = html.unescape(match.group(1).decode("utf-8", errors="ignore")).strip()
+    else:
+        title = lxml_html.fromstring(content).findtext(".//title")
+    return title or None
+
 
 class WebCrawler(BaseFetcher):
     """
@@ -23,6 +88,10 @@ class WebCrawler(BaseFetcher):
     - Configurable depth and page limits
     - Concurrent fetching
     - Sitemap support
+
+    The HTTP session (and its keep-alive connection pool) is opened on first
+    use and reused across fetch() calls until close(); use the crawler as an
+    async context manager or keep one instance for the application lifetime.
     """
 
     def __init__(
@@ -52,6 +121,15 @@ class WebCrawler(BaseFetcher):
         self.visited_urls: Set[str] = set()
         self.session: Optional[aiohttp.ClientSession] = None
 
+    async def __aenter__(self) -> "WebCrawler":
+        """Open the HTTP session."""
+        await self._init_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the HTTP session."""
+        await self.close()
+
     async def fetch(self, config: Dict) -> List[FetchedDocument]:
         """
         Fetch documents from a website.
@@ -71,6 +149,7 @@ class WebCrawler(BaseFetcher):
                 code="INVALID_CONFIG",
                 message="start_url is required in config",
             )
+        start_url = _canonicalize_url(start_url)
 
         max_depth = config.get("max_depth", self.max_depth)
         max_pages = config.get("max_pages", self.max_pages)
@@ -83,49 +162,56 @@ class WebCrawler(BaseFetcher):
             max_pages=max_pages,
         )
 
-        # Initialize session
+        # Reuse the open session (connections stay warm between crawls)
         await self._init_session()
+        self.visited_urls.clear()
+
+        # Check for sitemap first
+        sitemap_urls = await self._fetch_sitemap(start_url)
+
+        if sitemap_urls:
+            logger.info("Found sitemap", urls=len(sitemap_urls))
+            documents = await self._fetch_urls(list(sitemap_urls)[:max_pages])
+        else:
+            # Crawl recursively; crawled pages come back as documents, so only
+            # URLs discovered but never crawled still need a request
+            documents, pending_urls = await self._crawl_recursive(
+                start_url=start_url,
+                max_depth=max_depth,
+                max_pages=max_pages,
+                allowed_domains=allowed_domains,
+            )
+            documents.extend(await self._fetch_urls(pending_urls))
 
-        try:
-            # Check for sitemap first
-            sitemap_urls = await self._fetch_sitemap(start_url)
-
-            if sitemap_urls:
-                logger.info("Found sitemap", urls=len(sitemap_urls))
-                urls_to_fetch = list(sitemap_urls)[:max_pages]
-            else:
-                # Crawl recursively
-                urls_to_fetch = await self._crawl_recursive(
-                    start_url=start_url,
-                    max_depth=max_depth,
-                    max_pages=max_pages,
-                    allowed_domains=allowed_domains,
-                )
-
-            # Fetch all discovered URLs
-            documents = await self._fetch_urls(urls_to_fetch)
-
-            logger.info("Web crawl completed", documents=len(documents))
-
-            return documents
+        logger.info("Web crawl completed", documents=len(documents))
 
-        finally:
-            await self._close_session()
+        return documents
 
     async def fetch_single(self, url: str, config: Optional[Dict] = None) -> FetchedDocument:
         """Fetch a single URL."""
         await self._init_session()
-
-        try:
-            return await self._fetch_url(url)
-        finally:
-            await self._close_session()
+        return await self._fetch_url(url)
 
     async def _init_session(self) -> None:
         """Initialize aiohttp session."""
-        if self.session is None:
+        if self.session is None or self.session.closed:
             timeout = aiohttp.ClientTimeout(total=30)
+            # Bounded pool that keeps connections to the docs host warm. DNS
+            # goes through c-ares (aiodns) when installed, else getaddrinfo on
+            # a thread pool; passed explicitly because older aiohttp releases
+            # never pick aiodns by default
+            connector = aiohttp.TCPConnector(
+                resolver=aiohttp.AsyncResolver() if HAS_AIODNS else None,
+                limit=settings.crawler_max_connections or self.concurrent_requests * 4,
+                limit_per_host=settings.crawler_max_connections_per_host or self.concurrent_requests,
+                ttl_dns_cache=settings.crawler_dns_cache_ttl,
+                keepalive_timeout=settings.crawler_keepalive_timeout,
+            )
+            # No explicit Accept-Encoding: aiohttp's default already asks for
+            # gzip/deflate, plus br only when a Brotli decoder is importable,
+            # and decompresses transparently
             self.session = aiohttp.ClientSession(
+                connector=connector,
                 timeout=timeout,
                 headers={"User-Agent": self.user_agent},
             )
@@ -150,15 +236,21 @@ class WebCrawler(BaseFetcher):
         try:
             async with self.session.get(sitemap_url) as response:
                 if response.status == 200:
-                    content = await response.text()
-                    soup = BeautifulSoup(content, "xml")
-
-                    # Extract URLs from sitemap
-                    urls = set()
-                    for loc in soup.find_all("loc"):
-                        url = loc.text.strip()
-                        if url:
-                            urls.add(url)
+                    # Parse incrementally as chunks arrive so memory stays flat
+                    # for sitemaps with 100k+ entries. Matches <loc> in both
+                    # urlsets and sitemap indexes
+                    parser = etree.XMLPullParser(
+                        events=("end",),
+                        tag="{*}loc",
+                        resolve_entities=False,
+                        no_network=True,
+                    )
+                    urls: Set[str] = set()
+                    async for chunk in response.content.iter_chunked(65536):
+                        parser.feed(chunk)
+                        self._collect_sitemap_locs(parser, urls)
+                    parser.close()
+                    self._collect_sitemap_locs(parser, urls)
 
                     return urls
         except Exception as e:
@@ -166,45 +258,74 @@ class WebCrawler(BaseFetcher):
 
         return set()
 
+    @staticmethod
+    def _collect_sitemap_locs(parser: etree.XMLPullParser, urls: Set[str]) -> None:
+        """Drain parsed <loc> elements into urls, freeing finished entries."""
+        for _, loc in parser.read_events():
+            url = (loc.text or "").strip()
+            if url:
+                urls.add(_canonicalize_url(url))
+
+            # Drop the element and the <url>/<sitemap> entries before it so
+            # the tree never holds more than the current entry
+            loc.clear(keep_tail=True)
+            entry = loc.getparent()
+            if entry is not None:
+                while entry.getprevious() is not None:
+                    del entry.getparent()[0]
+
     async def _crawl_recursive(
         self,
         start_url: str,
         max_depth: int,
         max_pages: int,
-        allowed_domains: List[str],
-    ) -> List[str]:
-        """Recursively crawl URLs."""
-        to_visit = [(start_url, 0)]  # (url, depth)
-        discovered = {start_url}
-
-        while to_visit and len(discovered) < max_pages:
-            url, depth = to_visit.pop(0)
-
-            if url in self.visited_urls:
-                continue
+        allowed_domains: Sequence[str],
+    ) -> Tuple[List[FetchedDocument], List[str]]:
+        """
+        Crawl outward from start_url to discover URLs.
 
-            if depth > max_depth:
-                continue
+        Link discovery fans out over concurrent_requests workers sharing one
+        queue. URLs are marked discovered when enqueued; the check-and-add
+        has no await in between, so workers never enqueue the same URL twice.
 
-            self.visited_urls.add(url)
+        Returns:
+            Documents built from the pages fetched during the crawl, and the
+            discovered URLs that were never fetched (beyond max_depth or cut
+            off by max_pages)
+        """
+        queue: "asyncio.Queue[Tuple[str, int]]" = asyncio.Queue()  # (url, depth)
+        queue.put_nowait((start_url, 0))
+        discovered = {start_url}
+        documents: List[FetchedDocument] = []
+        allowed_domains = tuple(allowed_domains)
 
+        async def crawl_page(url: str, depth: int) -> None:
             # Fetch and parse page to find links
             try:
                 async with self.session.get(url) as response:
                     if response.status != 200:
-                        continue
+                        return
+
+                    body = await self._read_body(url, response)
 
                     content_type = response.headers.get("Content-Type", "")
                     if "text/html" not in content_type:
-                        continue
+                        documents.append(self._build_document(url, response, body))
+                        return
 
-                    html = await response.text()
-                    soup = BeautifulSoup(html, "html.parser")
+                    # Query lxml's C tree directly instead of building bs4
+                    # wrapper objects for every tag
+                    doc = lxml_html.fromstring(body)
+                    documents.append(
+                        self._build_document(url, response, body, doc.findtext(".//title"))
+                    )
 
                     # Extract links
-                    for link in soup.find_all("a", href=True):
-                        href = link["href"]
-                        absolute_url = urljoin(url, href)
+                    for href in doc.xpath("//a/@href"):
+                        if len(discovered) >= max_pages:
+                            break
+
+                        absolute_url = _canonicalize_url(urljoin(url, str(href)))
 
                         # Filter URLs
                         if not self._should_crawl(absolute_url, allowed_domains):
@@ -212,20 +333,43 @@ class WebCrawler(BaseFetcher):
 
                         if absolute_url not in discovered:
                             discovered.add(absolute_url)
-                            to_visit.append((absolute_url, depth + 1))
-
-                            if len(discovered) >= max_pages:
-                                break
+                            queue.put_nowait((absolute_url, depth + 1))
 
             except Exception as e:
                 logger.warning("Failed to crawl URL", url=url, error=str(e))
-                continue
 
-        return list(discovered)
+        async def worker() -> None:
+            while True:
+                url, depth = await queue.get()
+                try:
+                    if (
+                        len(discovered) < max_pages
+                        and url not in self.visited_urls
+                        and depth <= max_depth
+                    ):
+                        self.visited_urls.add(url)
+                        await crawl_page(url, depth)
+                finally:
+                    queue.task_done()
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.concurrent_requests)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        return documents, [url for url in discovered if url not in self.visited_urls]
+
+    def _should_crawl(self, url: str, allowed_domains: Sequence[str]) -> bool:
+        """
+        Check if URL should be crawled.
 
-    def _should_crawl(self, url: str, allowed_domains: List[str]) -> bool:
-        """Check if URL should be crawled."""
-        parsed = urlparse(url)
+        Pass allowed_domains as a tuple on hot paths; str.endswith then
+        matches every suffix in one C-level call.
+        """
+        parsed = urlsplit(url)
 
         # Skip non-http(s) URLs
         if parsed.scheme not in ("http", "https"):
@@ -237,7 +381,7 @@ class WebCrawler(BaseFetcher):
 
         # Check allowed domains
         if allowed_domains:
-            if not any(parsed.netloc.endswith(domain) for domain in allowed_domains):
+            if not parsed.netloc.endswith(tuple(allowed_domains)):
                 return False
 
         return True
@@ -267,30 +411,64 @@ class WebCrawler(BaseFetcher):
         async with self.session.get(url) as response:
             response.raise_for_status()
 
-            content = await response.read()
-            content_type = response.headers.get("Content-Type", "text/html")
-
-            # Parse content type
-            mime_type = content_type.split(";")[0].strip()
+            content = await self._read_body(url, response)
 
             # Extract title from HTML
             title = None
-            if "text/html" in mime_type:
+            if "text/html" in response.headers.get("Content-Type", "text/html"):
                 try:
-                    html = content.decode("utf-8", errors="ignore")
-                    soup = BeautifulSoup(html, "html.parser")
-                    if soup.title:
-                        title = soup.title.string
+                    title = _extract_title(content)
                 except Exception:
                     pass
 
-            return FetchedDocument(
-                url=url,
-                content=content,
-                mime_type=mime_type,
-                title=title,
-                metadata={
-                    "status_code": response.status,
-                    "headers": dict(response.headers),
-                },
-            )
+            return self._build_document(url, response, content, title)
+
+    async def _read_body(self, url: str, response: aiohttp.ClientResponse) -> bytes:
+        """
+        Read a response body, rejecting it once it exceeds max_response_bytes.
+
+        Declared oversize bodies are refused before any read; otherwise the
+        body is streamed so an undeclared huge response is cut off early.
+        """
+        max_bytes = settings.crawler_max_response_bytes
+        if not max_bytes:
+            return await response.read()
+
+        if response.content_length is None or response.content_length <= max_bytes:
+            body = bytearray()
+            async for chunk in response.content.iter_chunked(65536):
+                body.extend(chunk)
+                if len(body) > max_bytes:
+                    break
+            else:
+                return bytes(body)
+
+        raise DocVectorException(
+            code="RESPONSE_TOO_LARGE",
+            message=f"Response from {url} exceeds {max_bytes} bytes",
+            details={"url": url, "max_bytes": max_bytes},
+        )
+
+    def _build_document(
+        self,
+        url: str,
+        response: aiohttp.ClientResponse,
+        content: bytes,
+        title: Optional[str] = None,
+    ) -> FetchedDocument:
+        """Build a FetchedDocument from a fetched response body."""
+        content_type = response.headers.get("Content-Type", "text/html")
+
+        # Parse content type
+        mime_type = content_type.split(";")[0].strip()
+
+        return FetchedDocument(
+            url=url,
+            content=content,
+            mime_type=mime_type,
+            title=title,
+            metadata={
+                "status_code": response.status,
+                "headers": dict(response.headers),
+            },
+        )
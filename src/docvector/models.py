@@ -1,6 +1,8 @@
 """SQLAlchemy database models."""
 
-from uuid import uuid4
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
 
 from sqlalchemy import (
     Boolean,
@@ -9,6 +11,7 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Integer,
+    LargeBinary,
     String,
     Table,
     Text,
@@ -17,14 +20,20 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects.postgresql import ARRAY as PG_ARRAY, JSONB
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
-from sqlalchemy.orm import DeclarativeBase, relationship
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.types import JSON, TypeDecorator
 
+from docvector.utils import uuid7
+
 
 class Base(DeclarativeBase):
     """Base class for all database models."""
 
-    pass
+    # Fetch server-generated columns via RETURNING during flush, so
+    # repositories never need a follow-up SELECT (session.refresh).
+    # "auto" never falls back to a per-row SELECT on backends without
+    # RETURNING; none of the models have server-side onupdate values.
+    __mapper_args__ = {"eager_defaults": "auto"}
 
 
 class Library(Base):
@@ -32,19 +41,27 @@ class Library(Base):
 
     __tablename__ = "libraries"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    library_id = Column(String(255), nullable=False, unique=True)  # e.g., "mongodb/docs", "vercel/next.js"
-    name = Column(String(255), nullable=False)  # Human-readable name
-    description = Column(Text, nullable=True)
-    homepage_url = Column(String(2048), nullable=True)
-    repository_url = Column(String(2048), nullable=True)
-    aliases = Column(PG_ARRAY(String), nullable=False, server_default="{}")  # Alternative names
-    metadata_ = Column("metadata", JSONB, nullable=False, server_default="{}")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    library_id: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)  # e.g., "mongodb/docs", "vercel/next.js"
+    name: Mapped[str] = mapped_column(String(255), nullable=False)  # Human-readable name
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    homepage_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    repository_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    aliases: Mapped[List[str]] = mapped_column(
+        PG_ARRAY(String), nullable=False, server_default="{}"
+    )  # Alternative names
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    sources = relationship("Source", back_populates="library")
+    sources: Mapped[List["Source"]] = relationship("Source", back_populates="library")
 
     def __repr__(self) -> str:
         return f"<Library(id={self.id}, library_id={self.library_id}, name={self.name})>"
@@ -55,24 +72,32 @@ class Source(Base):
 
     __tablename__ = "sources"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name = Column(String(255), nullable=False, unique=True)
-    type = Column(String(50), nullable=False)
-    library_id = Column(
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    name: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    type: Mapped[str] = mapped_column(String(50), nullable=False)
+    library_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("libraries.id", ondelete="SET NULL"), nullable=True
     )
-    version = Column(String(50), nullable=True)  # Library version (e.g., "3.11", "18.2.0")
-    config = Column(JSONB, nullable=False, server_default="{}")
-    status = Column(String(50), nullable=False, server_default="active")
-    sync_frequency = Column(String(50), nullable=True)
-    last_synced_at = Column(DateTime(timezone=True), nullable=True)
-    error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    version: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # Library version (e.g., "3.11", "18.2.0")
+    config: Mapped[Dict[str, Any]] = mapped_column(JSONB, nullable=False, server_default="{}")
+    status: Mapped[str] = mapped_column(String(50), nullable=False, server_default="active")
+    sync_frequency: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    library = relationship("Library", back_populates="sources")
-    documents = relationship("Document", back_populates="source", cascade="all, delete-orphan")
+    library: Mapped[Optional["Library"]] = relationship("Library", back_populates="sources")
+    documents: Mapped[List["Document"]] = relationship(
+        "Document", back_populates="source", cascade="all, delete-orphan"
+    )
 
     def __repr__(self) -> str:
         return f"<Source(id={self.id}, name={self.name}, type={self.type}, version={self.version})>"
@@ -83,34 +108,42 @@ class Document(Base):
 
     __tablename__ = "documents"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    source_id = Column(
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    source_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("sources.id", ondelete="CASCADE"), nullable=False
     )
-    url = Column(String(2048), nullable=True)
-    path = Column(String(1024), nullable=True)
-    content_hash = Column(String(64), nullable=False)
-    title = Column(String(512), nullable=True)
-    content = Column(Text, nullable=True)
-    content_length = Column(Integer, nullable=True)
-    metadata_ = Column("metadata", JSONB, nullable=False, server_default="{}")
-    language = Column(String(10), nullable=False, server_default="en")
-    format = Column(String(50), nullable=True)
-    status = Column(String(50), nullable=False, server_default="pending")
-    error_message = Column(Text, nullable=True)
-    chunk_count = Column(Integer, server_default="0")
-    chunking_strategy = Column(String(50), server_default="semantic")
-    fetched_at = Column(DateTime(timezone=True), nullable=True)
-    processed_at = Column(DateTime(timezone=True), nullable=True)
-    author = Column(String(255), nullable=True)
-    published_at = Column(DateTime(timezone=True), nullable=True)
-    modified_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    path: Mapped[Optional[str]] = mapped_column(String(1024), nullable=True)
+    content_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)  # Raw SHA256 digest
+    title: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    content_length: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+    language: Mapped[str] = mapped_column(String(10), nullable=False, server_default="en")
+    format: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
+    status: Mapped[str] = mapped_column(String(50), nullable=False, server_default="pending")
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    chunk_count: Mapped[Optional[int]] = mapped_column(Integer, server_default="0")
+    chunking_strategy: Mapped[Optional[str]] = mapped_column(String(50), server_default="semantic")
+    fetched_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    author: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    published_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    modified_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    source = relationship("Source", back_populates="documents")
-    chunks = relationship("Chunk", back_populates="document", cascade="all, delete-orphan")
+    source: Mapped["Source"] = relationship("Source", back_populates="documents")
+    chunks: Mapped[List["Chunk"]] = relationship(
+        "Chunk", back_populates="document", cascade="all, delete-orphan"
+    )
 
     def __repr__(self) -> str:
         return f"<Document(id={self.id}, title={self.title}, status={self.status})>"
@@ -121,38 +154,44 @@ class Chunk(Base):
 
     __tablename__ = "chunks"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    document_id = Column(
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    document_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True), ForeignKey("documents.id", ondelete="CASCADE"), nullable=False
     )
-    index = Column(Integer, nullable=False)
-    content = Column(Text, nullable=False)
-    content_length = Column(Integer, nullable=False)
-    start_char = Column(Integer, nullable=True)
-    end_char = Column(Integer, nullable=True)
+    index: Mapped[int] = mapped_column(Integer, nullable=False)
+    content: Mapped[str] = mapped_column(Text, nullable=False)
+    content_length: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_char: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    end_char: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
     # Context7-style features
-    is_code_snippet = Column(Integer, nullable=False, server_default="0")  # Boolean (0/1)
-    code_language = Column(String(50), nullable=True)  # Programming language
-    topics = Column(PG_ARRAY(String), nullable=False, server_default="{}")  # Topic tags
-    enrichment = Column(Text, nullable=True)  # LLM-generated explanation
+    is_code_snippet: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")  # Boolean (0/1)
+    code_language: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # Programming language
+    topics: Mapped[List[str]] = mapped_column(PG_ARRAY(String), nullable=False, server_default="{}")  # Topic tags
+    enrichment: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # LLM-generated explanation
 
     # Quality scores (0-1 range)
-    relevance_score = Column(Float, nullable=True)  # Question relevance
-    code_quality_score = Column(Float, nullable=True)  # Code quality
-    formatting_score = Column(Float, nullable=True)  # Formatting quality
-    metadata_score = Column(Float, nullable=True)  # Metadata richness
-    initialization_score = Column(Float, nullable=True)  # Initialization guidance
-
-    metadata_ = Column("metadata", JSONB, nullable=False, server_default="{}")
-    embedding_id = Column(String(255), nullable=True)
-    embedding_model = Column(String(255), nullable=True)
-    embedded_at = Column(DateTime(timezone=True), nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    relevance_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Question relevance
+    code_quality_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Code quality
+    formatting_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Formatting quality
+    metadata_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Metadata richness
+    initialization_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)  # Initialization guidance
+
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+    embedding_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    embedding_model: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    embedded_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    document = relationship("Document", back_populates="chunks")
+    document: Mapped["Document"] = relationship("Document", back_populates="chunks")
 
     def __repr__(self) -> str:
         return f"<Chunk(id={self.id}, document_id={self.document_id}, index={self.index})>"
@@ -199,16 +238,22 @@ class Tag(Base):
 
     __tablename__ = "tags"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    name = Column(String(100), nullable=False, unique=True)
-    description = Column(Text, nullable=True)
-    category = Column(String(50), nullable=True)  # framework, language, topic, etc.
-    usage_count = Column(Integer, nullable=False, server_default="0")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    name: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
+    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    category: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # framework, language, topic, etc.
+    usage_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    questions = relationship("Question", secondary=question_tags, back_populates="tags")
-    issues = relationship("Issue", secondary=issue_tags, back_populates="tags")
+    questions: Mapped[List["Question"]] = relationship(
+        "Question", secondary=question_tags, back_populates="tags"
+    )
+    issues: Mapped[List["Issue"]] = relationship(
+        "Issue", secondary=issue_tags, back_populates="tags"
+    )
 
     def __repr__(self) -> str:
         return f"<Tag(id={self.id}, name={self.name})>"
@@ -219,45 +264,51 @@ class Question(Base):
 
     __tablename__ = "questions"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    title = Column(String(500), nullable=False)
-    body = Column(Text, nullable=False)
-    body_html = Column(Text, nullable=True)  # Rendered markdown
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    body_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # Rendered markdown
 
     # External source tracking (StackOverflow, GitHub, Discourse, etc.)
-    source = Column(String(50), nullable=False, server_default="internal")  # stackoverflow, github, discourse, internal
-    source_id = Column(String(255), nullable=True)  # Original ID from external source
-    source_url = Column(String(2048), nullable=True)  # Link to original
+    source: Mapped[str] = mapped_column(String(50), nullable=False, server_default="internal")  # stackoverflow, github, discourse, internal
+    source_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Original ID from external source
+    source_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)  # Link to original
 
     # Library association
-    library_id = Column(
+    library_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("libraries.id", ondelete="SET NULL"),
         nullable=True,
     )
-    library_name = Column(String(255), nullable=True)  # Denormalized for search
-    library_version = Column(String(50), nullable=True)
+    library_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Denormalized for search
+    library_version: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Author info (placeholder for future auth - using string identifier for now)
-    author_id = Column(String(255), nullable=False)  # Agent ID or user ID
-    author_type = Column(String(50), nullable=False, server_default="agent")  # agent, user, external
+    author_id: Mapped[str] = mapped_column(String(255), nullable=False)  # Agent ID or user ID
+    author_type: Mapped[str] = mapped_column(String(50), nullable=False, server_default="agent")  # agent, user, external
 
     # Status and scoring
-    status = Column(String(50), nullable=False, server_default="open")  # open, answered, closed, duplicate
-    is_answered = Column(Boolean, nullable=False, server_default="false")
-    vote_score = Column(Integer, nullable=False, server_default="0")
-    view_count = Column(Integer, nullable=False, server_default="0")
-    answer_count = Column(Integer, nullable=False, server_default="0")
-    accepted_answer_id = Column(PG_UUID(as_uuid=True), nullable=True)
+    status: Mapped[str] = mapped_column(String(50), nullable=False, server_default="open")  # open, answered, closed, duplicate
+    is_answered: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
+    vote_score: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    view_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    answer_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    accepted_answer_id: Mapped[Optional[UUID]] = mapped_column(PG_UUID(as_uuid=True), nullable=True)
 
     # Embedding for semantic search
-    embedding_id = Column(String(255), nullable=True)
+    embedding_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Metadata
-    metadata_ = Column("metadata", JSONB, nullable=False, server_default="{}")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    answered_at = Column(DateTime(timezone=True), nullable=True)
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    answered_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     # Unique constraint for external sources
     __table_args__ = (
@@ -265,10 +316,19 @@ class Question(Base):
     )
 
     # Relationships
-    library = relationship("Library", backref="questions")
-    answers = relationship("Answer", back_populates="question", cascade="all, delete-orphan")
-    comments = relationship("Comment", back_populates="question", cascade="all, delete-orphan", foreign_keys="Comment.question_id")
-    tags = relationship("Tag", secondary=question_tags, back_populates="questions")
+    library: Mapped[Optional["Library"]] = relationship("Library", backref="questions")
+    answers: Mapped[List["Answer"]] = relationship(
+        "Answer", back_populates="question", cascade="all, delete-orphan"
+    )
+    comments: Mapped[List["Comment"]] = relationship(
+        "Comment",
+        back_populates="question",
+        cascade="all, delete-orphan",
+        foreign_keys="Comment.question_id",
+    )
+    tags: Mapped[List["Tag"]] = relationship(
+        "Tag", secondary=question_tags, back_populates="questions"
+    )
 
     def __repr__(self) -> str:
         return f"<Question(id={self.id}, title={self.title[:50]}, status={self.status})>"
@@ -279,46 +339,59 @@ class Answer(Base):
 
     __tablename__ = "answers"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    question_id = Column(
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    question_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("questions.id", ondelete="CASCADE"),
         nullable=False,
     )
-    body = Column(Text, nullable=False)
-    body_html = Column(Text, nullable=True)
-    code_snippets = Column(JSONB, nullable=True, server_default="[]")  # Extracted code blocks
+    body: Mapped[str] = mapped_column(Text, nullable=False)
+    body_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    code_snippets: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(
+        JSONB, nullable=True, server_default="[]"
+    )  # Extracted code blocks
 
     # External source tracking
-    source = Column(String(50), nullable=False, server_default="internal")
-    source_id = Column(String(255), nullable=True)
-    source_url = Column(String(2048), nullable=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False, server_default="internal")
+    source_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    source_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
 
     # Author info
-    author_id = Column(String(255), nullable=False)
-    author_type = Column(String(50), nullable=False, server_default="agent")
+    author_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    author_type: Mapped[str] = mapped_column(String(50), nullable=False, server_default="agent")
 
     # Status and scoring
-    is_accepted = Column(Boolean, nullable=False, server_default="false")
-    is_verified = Column(Boolean, nullable=False, server_default="false")  # Verified by author/community
-    vote_score = Column(Integer, nullable=False, server_default="0")
+    is_accepted: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
+    is_verified: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")  # Verified by author/community
+    vote_score: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     # Code validation (for AI-submitted answers)
-    validation_status = Column(String(50), nullable=True)  # pending, validated, failed
-    validation_details = Column(JSONB, nullable=True)
-    verification_proof = Column(JSONB, nullable=True)  # How it was verified
+    validation_status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # pending, validated, failed
+    validation_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    verification_proof: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # How it was verified
 
     # Embedding for semantic search
-    embedding_id = Column(String(255), nullable=True)
+    embedding_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Metadata
-    metadata_ = Column("metadata", JSONB, nullable=False, server_default="{}")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    question = relationship("Question", back_populates="answers")
-    comments = relationship("Comment", back_populates="answer", cascade="all, delete-orphan", foreign_keys="Comment.answer_id")
+    question: Mapped["Question"] = relationship("Question", back_populates="answers")
+    comments: Mapped[List["Comment"]] = relationship(
+        "Comment",
+        back_populates="answer",
+        cascade="all, delete-orphan",
+        foreign_keys="Comment.answer_id",
+    )
 
     def __repr__(self) -> str:
         return f"<Answer(id={self.id}, question_id={self.question_id}, is_accepted={self.is_accepted})>"
@@ -329,46 +402,54 @@ class Comment(Base):
 
     __tablename__ = "comments"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
 
     # Parent (can be question, answer, or another comment)
-    question_id = Column(
+    question_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("questions.id", ondelete="CASCADE"),
         nullable=True,
     )
-    answer_id = Column(
+    answer_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("answers.id", ondelete="CASCADE"),
         nullable=True,
     )
-    parent_comment_id = Column(
+    parent_comment_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("comments.id", ondelete="CASCADE"),
         nullable=True,
     )
 
     # External source tracking
-    source = Column(String(50), nullable=False, server_default="internal")
-    source_id = Column(String(255), nullable=True)
+    source: Mapped[str] = mapped_column(String(50), nullable=False, server_default="internal")
+    source_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Content
-    body = Column(Text, nullable=False)
+    body: Mapped[str] = mapped_column(Text, nullable=False)
 
     # Metrics
-    vote_score = Column(Integer, nullable=False, server_default="0")
+    vote_score: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     # Author info
-    author_id = Column(String(255), nullable=False)
-    author_type = Column(String(50), nullable=False, server_default="agent")
+    author_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    author_type: Mapped[str] = mapped_column(String(50), nullable=False, server_default="agent")
 
     # Timestamps
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    question = relationship("Question", back_populates="comments", foreign_keys=[question_id])
-    answer = relationship("Answer", back_populates="comments", foreign_keys=[answer_id])
-    parent = relationship("Comment", remote_side=[id], backref="replies")
+    question: Mapped[Optional["Question"]] = relationship(
+        "Question", back_populates="comments", foreign_keys=[question_id]
+    )
+    answer: Mapped[Optional["Answer"]] = relationship(
+        "Answer", back_populates="comments", foreign_keys=[answer_id]
+    )
+    parent: Mapped[Optional["Comment"]] = relationship(
+        "Comment", remote_side=[id], backref="replies"
+    )
 
     def __repr__(self) -> str:
         return f"<Comment(id={self.id}, author_id={self.author_id})>"
@@ -379,61 +460,71 @@ class Issue(Base):
 
     __tablename__ = "issues"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    title = Column(String(500), nullable=False)
-    description = Column(Text, nullable=False)
-    description_html = Column(Text, nullable=True)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    description_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Library association
-    library_id = Column(
+    library_id: Mapped[Optional[UUID]] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("libraries.id", ondelete="SET NULL"),
         nullable=True,
     )
-    library_version = Column(String(50), nullable=True)
+    library_version: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)
 
     # Reproduction details
-    steps_to_reproduce = Column(Text, nullable=True)
-    expected_behavior = Column(Text, nullable=True)
-    actual_behavior = Column(Text, nullable=True)
-    code_snippet = Column(Text, nullable=True)
-    error_message = Column(Text, nullable=True)
+    steps_to_reproduce: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    expected_behavior: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    actual_behavior: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    code_snippet: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Environment info
-    environment = Column(JSONB, nullable=True)  # OS, runtime, dependencies
+    environment: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)  # OS, runtime, dependencies
 
     # Author info
-    author_id = Column(String(255), nullable=False)
-    author_type = Column(String(50), nullable=False, server_default="agent")
+    author_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    author_type: Mapped[str] = mapped_column(String(50), nullable=False, server_default="agent")
 
     # Status and scoring
-    status = Column(String(50), nullable=False, server_default="open")  # open, confirmed, resolved, closed, duplicate
-    severity = Column(String(50), nullable=True)  # critical, major, minor, trivial
-    vote_score = Column(Integer, nullable=False, server_default="0")
-    view_count = Column(Integer, nullable=False, server_default="0")
-    solution_count = Column(Integer, nullable=False, server_default="0")
-    accepted_solution_id = Column(PG_UUID(as_uuid=True), nullable=True)
+    status: Mapped[str] = mapped_column(String(50), nullable=False, server_default="open")  # open, confirmed, resolved, closed, duplicate
+    severity: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # critical, major, minor, trivial
+    vote_score: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    view_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    solution_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    accepted_solution_id: Mapped[Optional[UUID]] = mapped_column(
+        PG_UUID(as_uuid=True), nullable=True
+    )
 
     # Reproducibility validation
-    is_reproducible = Column(Boolean, nullable=True)
-    reproduction_count = Column(Integer, nullable=False, server_default="0")
+    is_reproducible: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    reproduction_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     # Embedding for semantic search
-    embedding_id = Column(String(255), nullable=True)
+    embedding_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # External references (GitHub issue, etc.)
-    external_url = Column(String(2048), nullable=True)
-    external_id = Column(String(255), nullable=True)
+    external_url: Mapped[Optional[str]] = mapped_column(String(2048), nullable=True)
+    external_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Metadata
-    metadata_ = Column("metadata", JSONB, nullable=False, server_default="{}")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    library = relationship("Library", backref="issues")
-    solutions = relationship("Solution", back_populates="issue", cascade="all, delete-orphan")
-    tags = relationship("Tag", secondary=issue_tags, back_populates="issues")
+    library: Mapped[Optional["Library"]] = relationship("Library", backref="issues")
+    solutions: Mapped[List["Solution"]] = relationship(
+        "Solution", back_populates="issue", cascade="all, delete-orphan"
+    )
+    tags: Mapped[List["Tag"]] = relationship("Tag", secondary=issue_tags, back_populates="issues")
 
     def __repr__(self) -> str:
         return f"<Issue(id={self.id}, title={self.title[:50]}, status={self.status})>"
@@ -444,40 +535,46 @@ class Solution(Base):
 
     __tablename__ = "solutions"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    issue_id = Column(
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    issue_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("issues.id", ondelete="CASCADE"),
         nullable=False,
     )
-    description = Column(Text, nullable=False)
-    description_html = Column(Text, nullable=True)
-    code_snippet = Column(Text, nullable=True)
+    description: Mapped[str] = mapped_column(Text, nullable=False)
+    description_html: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    code_snippet: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Author info
-    author_id = Column(String(255), nullable=False)
-    author_type = Column(String(50), nullable=False, server_default="agent")
+    author_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    author_type: Mapped[str] = mapped_column(String(50), nullable=False, server_default="agent")
 
     # Status and scoring
-    is_accepted = Column(Boolean, nullable=False, server_default="false")
-    vote_score = Column(Integer, nullable=False, server_default="0")
+    is_accepted: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
+    vote_score: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     # Validation (did this actually fix the issue?)
-    validation_status = Column(String(50), nullable=True)  # pending, validated, failed
-    validation_details = Column(JSONB, nullable=True)
-    works_count = Column(Integer, nullable=False, server_default="0")  # "This worked for me"
-    doesnt_work_count = Column(Integer, nullable=False, server_default="0")
+    validation_status: Mapped[Optional[str]] = mapped_column(String(50), nullable=True)  # pending, validated, failed
+    validation_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    works_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")  # "This worked for me"
+    doesnt_work_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
 
     # Embedding for semantic search
-    embedding_id = Column(String(255), nullable=True)
+    embedding_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Metadata
-    metadata_ = Column("metadata", JSONB, nullable=False, server_default="{}")
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    metadata_: Mapped[Dict[str, Any]] = mapped_column(
+        "metadata", JSONB, nullable=False, server_default="{}"
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     # Relationships
-    issue = relationship("Issue", back_populates="solutions")
+    issue: Mapped["Issue"] = relationship("Issue", back_populates="solutions")
 
     def __repr__(self) -> str:
         return f"<Solution(id={self.id}, issue_id={self.issue_id}, is_accepted={self.is_accepted})>"
@@ -491,25 +588,27 @@ class Vote(Base):
         UniqueConstraint("voter_id", "target_type", "target_id", name="uq_votes_voter_target"),
     )
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
 
     # What is being voted on (polymorphic)
-    target_type = Column(String(50), nullable=False)  # question, answer, issue, solution, comment
-    target_id = Column(PG_UUID(as_uuid=True), nullable=False)
+    target_type: Mapped[str] = mapped_column(String(50), nullable=False)  # question, answer, issue, solution, comment
+    target_id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), nullable=False)
 
     # Who voted
-    voter_id = Column(String(255), nullable=False)
-    voter_type = Column(String(50), nullable=False, server_default="agent")
+    voter_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    voter_type: Mapped[str] = mapped_column(String(50), nullable=False, server_default="agent")
 
     # Vote value
-    value = Column(Integer, nullable=False)  # +1 (upvote) or -1 (downvote)
+    value: Mapped[int] = mapped_column(Integer, nullable=False)  # +1 (upvote) or -1 (downvote)
 
     # Proof of work (anti-spam for agent votes)
-    pow_nonce = Column(String(64), nullable=True)
-    pow_hash = Column(String(64), nullable=True)
-    pow_difficulty = Column(Integer, nullable=True)
+    pow_nonce: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    pow_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
+    pow_difficulty: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
 
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
 
     def __repr__(self) -> str:
         return f"<Vote(id={self.id}, target={self.target_type}:{self.target_id}, value={self.value})>"
@@ -520,16 +619,18 @@ class ProofOfWorkChallenge(Base):
 
     __tablename__ = "pow_challenges"
 
-    id = Column(PG_UUID(as_uuid=True), primary_key=True, default=uuid4)
-    challenge = Column(String(255), nullable=False, unique=True)
-    action = Column(String(50), nullable=False)  # question, answer, comment, vote
-    target_id = Column(String(255), nullable=True)  # Optional target ID
-    agent_id = Column(String(255), nullable=False)
-    difficulty = Column(Integer, nullable=False)
-    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    expires_at = Column(DateTime(timezone=True), nullable=False)
-    used = Column(Boolean, nullable=False, server_default="false")
-    used_at = Column(DateTime(timezone=True), nullable=True)
+    id: Mapped[UUID] = mapped_column(PG_UUID(as_uuid=True), primary_key=True, default=uuid7)
+    challenge: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    action: Mapped[str] = mapped_column(String(50), nullable=False)  # question, answer, comment, vote
+    target_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)  # Optional target ID
+    agent_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    difficulty: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    used: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="false")
+    used_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
     def __repr__(self) -> str:
         return f"<ProofOfWorkChallenge(id={self.id}, action={self.action}, used={self.used})>"
@@ -3,9 +3,8 @@
 import json
 from typing import List, Optional
 
-import httpx
-
 from docvector.core import get_logger, settings
+from docvector.utils.http_client import get_http_client
 
 logger = get_logger(__name__)
 
@@ -60,45 +59,45 @@ class ContentEnricher:
         prompt = "\n".join(prompt_parts)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": (
-                                    "You are a code documentation assistant. "
-                                    "Provide concise explanations and topic tags. "
-                                    "Respond in JSON format with keys: explanation, topics."
-                                ),
-                            },
-                            {"role": "user", "content": prompt},
-                        ],
-                        "temperature": 0.3,
-                        "response_format": {"type": "json_object"},
-                    },
+            client = get_http_client()
+            response = await client.post(
+                self.api_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": (
+                                "You are a code documentation assistant. "
+                                "Provide concise explanations and topic tags. "
+                                "Respond in JSON format with keys: explanation, topics."
+                            ),
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    "temperature": 0.3,
+                    "response_format": {"type": "json_object"},
+                },
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    f"OpenAI API error: {response.status_code} - {response.text}",
                 )
+                return {"explanation": None, "topics": []}
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"OpenAI API error: {response.status_code} - {response.text}",
-                    )
-                    return {"explanation": None, "topics": []}
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                result = json.loads(content)
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+            result = json.loads(content)
 
-                return {
-                    "explanation": result.get("explanation", ""),
-                    "topics": result.get("topics", []),
-                }
+            return {
+                "explanation": result.get("explanation", ""),
+                "topics": result.get("topics", []),
+            }
 
         except Exception as e:
             logger.error(f"Error enriching code snippet: {e}")
@@ -133,42 +132,42 @@ class ContentEnricher:
         prompt = "\n".join(prompt_parts)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(
-                    self.api_url,
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "model": self.model,
-                        "messages": [
-                            {
-                                "role": "system",
-                                "content": (
-                                    "You are a documentation assistant. "
-                                    "Extract topic tags from technical documentation. "
-                                    "Respond in JSON format with key: topics (array)."
-                                ),
-                            },
-                            {"role": "user", "content": prompt},
-                        ],
-                        "temperature": 0.3,
-                        "response_format": {"type": "json_object"},
-                    },
+            client = get_http_client()
+            response = await client.post(
+                self.api_url,
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "messages": [
+                        {
+                            "role": "system",
+                            "content": (
+                                "You are a documentation assistant. "
+                                "Extract topic tags from technical documentation. "
+                                "Respond in JSON format with key: topics (array)."
+                            ),
+                        },
+                        {"role": "user", "content": prompt},
+                    ],
+                    "temperature": 0.3,
+                    "response_format": {"type": "json_object"},
+                },
+            )
+
+            if response.status_code != 200:
+                logger.error(
+                    f"OpenAI API error: {response.status_code} - {response.text}",
                 )
+                return {"topics": []}
 
-                if response.status_code != 200:
-                    logger.error(
-                        f"OpenAI API error: {response.status_code} - {response.text}",
-                    )
-                    return {"topics": []}
-
-                data = response.json()
-                content = data["choices"][0]["message"]["content"]
-                result = json.loads(content)
+            data = response.json()
+            content = data["choices"][0]["message"]["content"]
+            result = json.loads(content)
 
-                return {"topics": result.get("topics", [])}
+            return {"topics": result.get("topics", [])}
 
         except Exception as e:
             logger.error(f"Error enriching text chunk: {e}")
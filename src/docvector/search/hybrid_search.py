@@ -1,5 +1,6 @@
 """Hybrid search combining vector and keyword search."""
 
+import logging
 from typing import Dict, List, Optional
 
 from docvector.core import get_logger, settings
@@ -59,7 +60,8 @@ class HybridSearch:
         Returns:
             List of search results
         """
-        logger.debug("Hybrid search", query=query[:100], limit=limit)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Hybrid search", query=query[:100], limit=limit)
 
         # For now, we primarily use vector search
         # In a full implementation, we would also:
@@ -74,16 +76,49 @@ class HybridSearch:
             score_threshold=score_threshold,
         )
 
-        # Apply hybrid weighting
+        results = self._combine(vector_results, limit)
+
+        logger.debug("Hybrid search completed", results=len(results))
+
+        return results
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        limits: List[int],
+        filters: List[Optional[Dict]],
+        score_thresholds: List[Optional[float]],
+    ) -> List[List[SearchResultItem]]:
+        """
+        Perform hybrid search for several queries in one batch.
+
+        Args:
+            queries: Search queries
+            limits: Maximum results per query
+            filters: Optional filters per query
+            score_thresholds: Minimum score threshold per query
+
+        Returns:
+            One result list per query, in order
+        """
+        batch_results = await self.vector_search.search_batch(
+            queries=queries,
+            limits=[limit * 2 for limit in limits],  # Get more to account for reranking
+            filters=filters,
+            score_thresholds=score_thresholds,
+        )
+
+        return [
+            self._combine(vector_results, limit)
+            for vector_results, limit in zip(batch_results, limits)
+        ]
+
+    def _combine(self, vector_results: List[SearchResultItem], limit: int) -> List[SearchResultItem]:
+        """Apply hybrid weighting, sort by score and limit."""
         for result in vector_results:
             # In full implementation, combine with keyword score
             # For now, just weight the vector score
             result.score = result.score * self.vector_weight
 
-        # Sort by score and limit
         vector_results.sort(key=lambda x: x.score, reverse=True)
-        results = vector_results[:limit]
-
-        logger.debug("Hybrid search completed", results=len(results))
-
-        return results
+        return vector_results[:limit]
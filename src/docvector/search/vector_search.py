@@ -1,11 +1,18 @@
 """Vector similarity search."""
 
+import asyncio
+import hashlib
+import logging
 from dataclasses import dataclass
 from typing import Dict, List, Optional
 
+import numpy as np
+
+from docvector.cache import RedisCache
 from docvector.core import get_logger, settings
 from docvector.embeddings import BaseEmbedder
 from docvector.vectordb import BaseVectorDB
+from docvector.vectordb.base import SearchResult
 
 logger = get_logger(__name__)
 
@@ -35,6 +42,7 @@ class VectorSearch:
         vectordb: BaseVectorDB,
         embedder: BaseEmbedder,
         collection_name: Optional[str] = None,
+        embedding_cache: Optional[RedisCache] = None,
     ):
         """
         Initialize vector search.
@@ -43,10 +51,12 @@ class VectorSearch:
             vectordb: Vector database client
             embedder: Embedding generator
             collection_name: Name of collection to search
+            embedding_cache: Optional Redis cache for query vectors
         """
         self.vectordb = vectordb
         self.embedder = embedder
         self.collection_name = collection_name or settings.qdrant_collection
+        self.embedding_cache = embedding_cache
 
     async def search(
         self,
@@ -67,15 +77,16 @@ class VectorSearch:
         Returns:
             List of search results
         """
-        logger.debug(
-            "Vector search",
-            query=query[:100],
-            limit=limit,
-            has_filters=filters is not None,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Vector search",
+                query=query[:100],
+                limit=limit,
+                has_filters=filters is not None,
+            )
 
         # Generate query embedding
-        query_vector = await self.embedder.embed_query(query)
+        query_vector = await self._embed_query(query)
 
         # Apply score threshold from settings if not provided
         if score_threshold is None:
@@ -91,19 +102,124 @@ class VectorSearch:
         )
 
         # Convert to SearchResultItem
-        search_results = []
-        for result in results:
-            item = SearchResultItem(
-                chunk_id=result.payload.get("chunk_id", result.id),
-                document_id=result.payload.get("document_id", ""),
-                score=result.score,
-                content=result.payload.get("content", ""),
-                title=result.payload.get("title"),
-                url=result.payload.get("url"),
-                metadata=result.payload,
-            )
-            search_results.append(item)
+        search_results = [self._to_item(result) for result in results]
 
         logger.debug("Vector search completed", results=len(search_results))
 
         return search_results
+
+    async def search_batch(
+        self,
+        queries: List[str],
+        limits: List[int],
+        filters: List[Optional[Dict]],
+        score_thresholds: List[Optional[float]],
+    ) -> List[List[SearchResultItem]]:
+        """
+        Search for several queries with one embedding call and one vector DB call.
+
+        Args:
+            queries: Search query texts
+            limits: Maximum number of results per query
+            filters: Optional filters per query
+            score_thresholds: Minimum similarity score per query
+
+        Returns:
+            One result list per query, in order
+        """
+        if not queries:
+            return []
+
+        logger.debug("Vector batch search", queries=len(queries))
+
+        query_vectors = await self._embed_queries(queries)
+
+        batch_results = await self.vectordb.search_batch(
+            collection_name=self.collection_name,
+            query_vectors=query_vectors,
+            limits=limits,
+            filters=filters,
+            score_thresholds=[
+                settings.search_min_score if threshold is None else threshold
+                for threshold in score_thresholds
+            ],
+        )
+
+        return [[self._to_item(result) for result in results] for results in batch_results]
+
+    def _embedding_key(self, query: str) -> str:
+        """Build the cache key for a query vector (model-scoped)."""
+        model = f"{settings.embedding_provider}:{settings.embedding_model}"
+        digest = hashlib.blake2b(f"{model}\x00{query}".encode(), digest_size=16).hexdigest()
+        return f"emb:{digest}"
+
+    @staticmethod
+    def _decode_vector(raw: bytes) -> np.ndarray:
+        """Decode a float16 vector stored in the cache."""
+        return np.frombuffer(raw, dtype=np.float16).astype(np.float32)
+
+    @staticmethod
+    def _encode_vector(vector: np.ndarray) -> bytes:
+        """Encode a vector as float16 bytes for the cache."""
+        return np.asarray(vector, dtype=np.float16).tobytes()
+
+    async def _embed_query(self, query: str) -> np.ndarray:
+        """Embed a query, reusing a cached vector when available."""
+        if self.embedding_cache is None:
+            return await self.embedder.embed_query(query)
+
+        key = self._embedding_key(query)
+        raw = await self.embedding_cache.get_bytes(key)
+        if raw:
+            return self._decode_vector(raw)
+
+        query_vector = await self.embedder.embed_query(query)
+        await self.embedding_cache.set_bytes(
+            key,
+            self._encode_vector(query_vector),
+            ttl=settings.query_embedding_cache_ttl,
+        )
+        return query_vector
+
+    async def _embed_queries(self, queries: List[str]) -> List[np.ndarray]:
+        """Embed several queries, only sending cache misses to the embedder."""
+        if self.embedding_cache is None:
+            return list(await self.embedder.embed(queries))
+
+        keys = [self._embedding_key(query) for query in queries]
+        cached = await asyncio.gather(*(self.embedding_cache.get_bytes(key) for key in keys))
+
+        vectors: List[Optional[np.ndarray]] = [
+            self._decode_vector(raw) if raw else None for raw in cached
+        ]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if missing:
+            embedded = await self.embedder.embed([queries[i] for i in missing])
+            for i, vector in zip(missing, embedded):
+                vectors[i] = vector
+            await asyncio.gather(
+                *(
+                    self.embedding_cache.set_bytes(
+                        keys[i],
+                        self._encode_vector(vectors[i]),
+                        ttl=settings.query_embedding_cache_ttl,
+                    )
+                    for i in missing
+                )
+            )
+
+        return vectors
+
+    @staticmethod
+    def _to_item(result: SearchResult) -> SearchResultItem:
+        """Convert a vector DB result to a SearchResultItem."""
+        return SearchResultItem(
+            chunk_id=result.payload.get("chunk_id", result.id),
+            document_id=result.payload.get("document_id", ""),
+            score=result.score,
+            content=result.payload.get("content", ""),
+            title=result.payload.get("title"),
+            url=result.payload.get("url"),
+            metadata=result.payload,
+        )
@@ -1,22 +1,34 @@
 """Ingestion service - orchestrates document ingestion."""
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.core import DocVectorException, get_logger, settings
 from docvector.db.repositories import ChunkRepository, DocumentRepository
-from docvector.embeddings import BaseEmbedder, EmbeddingCache, LocalEmbedder, OpenAIEmbedder
+from docvector.embeddings import BaseEmbedder, EmbeddingCache, OpenAIEmbedder, get_local_embedder
 from docvector.ingestion import Crawl4AICrawler
 from docvector.models import Chunk, Document, Source
 from docvector.processing import ProcessingPipeline
-from docvector.utils import compute_text_hash
+from docvector.utils import compute_text_digest
 from docvector.vectordb import QdrantVectorDB
 
 logger = get_logger(__name__)
 
 
+@dataclass
+class PendingEmbedding:
+    """A stored chunk waiting to be embedded and upserted into the vector DB."""
+
+    chunk: Chunk
+    document_id: str
+    source_id: str
+    text: str
+    payload: Dict
+
+
 class IngestionService:
     """
     Ingestion service - orchestrates the complete document ingestion pipeline.
@@ -24,15 +36,28 @@ class IngestionService:
     Flow:
     1. Fetch documents from source (web, git, etc.)
     2. Process documents (parse, chunk)
-    3. Generate embeddings
+    3. Generate embeddings (batched across documents)
     4. Store in vector DB and PostgreSQL
     """
 
-    def __init__(self, session: AsyncSession):
-        """Initialize ingestion service."""
+    def __init__(self, session: AsyncSession, embedding_batch_size: Optional[int] = None):
+        """
+        Initialize ingestion service.
+
+        Args:
+            session: Database session
+            embedding_batch_size: Number of chunks to accumulate before embedding
+                them in a single provider call
+        """
         self.session = session
         self.document_repo = DocumentRepository(session)
         self.chunk_repo = ChunkRepository(session)
+        self.embedding_batch_size = embedding_batch_size or settings.embedding_ingest_batch_size
+
+        # Chunks stored in PostgreSQL but not yet embedded / upserted, and the
+        # documents they belong to (marked completed once their flush succeeds)
+        self._pending: List[PendingEmbedding] = []
+        self._pending_documents: Dict[str, Document] = {}
 
         # Initialize components (lazy)
         self.crawler: Optional[Crawl4AICrawler] = None
@@ -58,7 +83,8 @@ class IngestionService:
         if settings.embedding_provider == "openai":
             self.embedder = OpenAIEmbedder()
         else:
-            self.embedder = LocalEmbedder()
+            # Shared across services so the model loads once per process
+            self.embedder = get_local_embedder()
 
         await self.embedder.initialize()
 
@@ -122,17 +148,20 @@ class IngestionService:
                         code="SERVICE_NOT_INITIALIZED",
                         message="Crawler not initialized",
                     )
-                fetched_docs = await self.crawler.fetch(source.config)
+                # Process pages while the crawl is still running; embedding
+                # batches flush as chunks accumulate
+                fetched_docs = self.crawler.fetch_stream(source.config)
             else:
                 raise DocVectorException(
                     code="UNSUPPORTED_SOURCE_TYPE",
                     message=f"Source type '{source.type}' not yet implemented",
                 )
 
-            stats["fetched"] = len(fetched_docs)
-
-            # Process each document
-            for fetched_doc in fetched_docs:
+            # Process each document, committing after each one so no
+            # transaction (or pooled connection) sits idle while the crawl
+            # waits on the network
+            async for fetched_doc in fetched_docs:
+                stats["fetched"] += 1
                 try:
                     await self._process_document(
                         source=source,
@@ -147,6 +176,10 @@ class IngestionService:
                         error=str(e),
                     )
                     stats["errors"] += 1
+                await self.session.commit()
+
+            # Embed and store whatever is left over from the last documents
+            await self.flush_embedding_batch()
 
             # Update source sync time
             source.last_synced_at = datetime.utcnow()
@@ -200,6 +233,7 @@ class IngestionService:
             fetched_doc=fetched_doc,
             access_level=access_level,
         )
+        await self.flush_embedding_batch()
 
         # Update source sync time
         source.last_synced_at = datetime.utcnow()
@@ -217,16 +251,23 @@ class IngestionService:
     ) -> Document:
         """Process a fetched document through the pipeline."""
         # Check if document already exists
-        content_hash = compute_text_hash(fetched_doc.content.decode("utf-8", errors="ignore"))
+        content_hash = compute_text_digest(fetched_doc.content.decode("utf-8", errors="ignore"))
         existing = await self.document_repo.get_by_content_hash(source.id, content_hash)
 
-        if existing and existing.status == "completed":
+        if existing and (
+            existing.status == "completed" or str(existing.id) in self._pending_documents
+        ):
             logger.debug("Document already exists", url=fetched_doc.url)
             return existing
 
         # Create or update document record
         if existing:
+            # Left failed or processing by an earlier run; its stored chunks
+            # never got vectors and are replaced below
             document = existing
+            document.status = "processing"
+            document.error_message = None
+            await self.chunk_repo.delete_by_document(document.id)
         else:
             document = Document(
                 source_id=source.id,
@@ -270,9 +311,11 @@ class IngestionService:
             # Generate embeddings and store chunks
             await self._process_chunks(document, chunks, access_level)
 
-            # Update document status
-            document.status = "completed"
-            await self.session.flush()
+            # A document with chunks still queued is completed by the flush
+            # that embeds them, never before its vectors exist
+            if str(document.id) not in self._pending_documents:
+                document.status = "completed"
+                await self.session.flush()
 
             logger.info(
                 "Document processed",
@@ -294,24 +337,111 @@ class IngestionService:
         text_chunks,
         access_level: str,
     ) -> None:
-        """Generate embeddings and store chunks."""
+        """Store chunks and queue them for batched embedding."""
         if not text_chunks:
             return
 
-        # Prepare chunk texts for embedding
-        chunk_texts = [chunk.content for chunk in text_chunks]
+        # Create chunk records
+        chunk_models = [
+            Chunk(
+                document_id=document.id,
+                index=text_chunk.index,
+                content=text_chunk.content,
+                content_length=text_chunk.length,
+                start_char=text_chunk.start_char,
+                end_char=text_chunk.end_char,
+                metadata=text_chunk.metadata,
+                embedding_model=settings.embedding_model,
+                embedded_at=datetime.utcnow(),
+            )
+            for text_chunk in text_chunks
+        ]
+
+        # Save chunks to database (COPY on PostgreSQL for large batches)
+        chunks = await self.chunk_repo.copy_many(chunk_models)
+
+        # Queue chunks for embedding
+        self._pending_documents[str(document.id)] = document
+        for chunk in chunks:
+            self._pending.append(
+                PendingEmbedding(
+                    chunk=chunk,
+                    document_id=str(document.id),
+                    source_id=str(document.source_id),
+                    text=chunk.content,
+                    payload={
+                        "chunk_id": str(chunk.id),
+                        "document_id": str(document.id),
+                        "source_id": str(document.source_id),
+                        "content": chunk.content,
+                        "title": document.title,
+                        "url": document.url,
+                        "access_level": access_level,  # Store access level for filtering
+                        "metadata": chunk.metadata,
+                    },
+                )
+            )
+
+        if len(self._pending) >= self.embedding_batch_size:
+            await self.flush_embedding_batch()
+
+    async def flush_embedding_batch(self) -> int:
+        """
+        Embed all pending chunks in one provider call and upsert them.
+
+        Documents whose chunks were in the batch are marked completed on
+        success. If embedding or the upsert fails, every one of them is
+        marked failed (so a re-ingest processes it again) and the error is
+        re-raised.
+
+        Returns:
+            Number of vectors stored
+        """
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, []
+        documents, self._pending_documents = self._pending_documents, {}
+
+        try:
+            stored = await self._embed_and_store(pending)
+        except Exception as e:
+            for document in documents.values():
+                document.status = "failed"
+                document.error_message = str(e)
+            await self.session.flush()
+            logger.error(
+                "Embedding batch failed",
+                documents=len(documents),
+                chunks=len(pending),
+                error=str(e),
+            )
+            raise
+
+        for document in documents.values():
+            document.status = "completed"
+        await self.session.flush()
+
+        return stored
+
+    async def _embed_and_store(self, pending: List[PendingEmbedding]) -> int:
+        """Embed a batch of pending chunks and upsert them into the vector DB."""
+
+        # Identical chunks (boilerplate, nav blocks) only need embedding once
+        texts = list(dict.fromkeys(p.text for p in pending))
 
         # Check cache for embeddings
         cached_embeddings = {}
         if self.embedding_cache:
             cached_embeddings = await self.embedding_cache.get_many(
-                texts=chunk_texts,
+                texts=texts,
                 model=settings.embedding_model,
             )
 
         # Generate embeddings for uncached chunks
-        texts_to_embed = [text for text in chunk_texts if text not in cached_embeddings]
+        texts_to_embed = [text for text in texts if text not in cached_embeddings]
 
+        new_embeddings = {}
         if texts_to_embed:
             logger.debug("Generating embeddings", count=len(texts_to_embed))
             if self.embedder is None:
@@ -320,8 +450,6 @@ class IngestionService:
                     message="Embedder not initialized",
                 )
             new_embeddings_list = await self.embedder.embed(texts_to_embed)
-
-            # Create embedding map
             new_embeddings = dict(zip(texts_to_embed, new_embeddings_list))
 
             # Cache new embeddings
@@ -331,61 +459,26 @@ class IngestionService:
                     model=settings.embedding_model,
                     embeddings=new_embeddings_list,
                 )
-        else:
-            new_embeddings = {}
 
         # Combine cached and new embeddings
         all_embeddings = {**cached_embeddings, **new_embeddings}
 
-        # Create chunk records and store in vector DB
-        chunk_models = []
+        # Prepare vector DB data
+        embedded_ids = []
         vector_ids = []
         vectors = []
         payloads = []
 
-        for _i, text_chunk in enumerate(text_chunks):
-            # Create chunk record
-            chunk = Chunk(
-                document_id=document.id,
-                index=text_chunk.index,
-                content=text_chunk.content,
-                content_length=text_chunk.length,
-                start_char=text_chunk.start_char,
-                end_char=text_chunk.end_char,
-                metadata=text_chunk.metadata,
-                embedding_model=settings.embedding_model,
-                embedded_at=datetime.utcnow(),
-            )
-            chunk_models.append(chunk)
-
-        # Save chunks to database
-        chunks = await self.chunk_repo.create_many(chunk_models)
-        await self.session.flush()
-
-        # Prepare vector DB data
-        for chunk in chunks:
-            embedding = all_embeddings.get(chunk.content)
-            if not embedding:
-                logger.warning("Missing embedding for chunk", chunk_id=str(chunk.id))
+        for item in pending:
+            embedding = all_embeddings.get(item.text)
+            if embedding is None or len(embedding) == 0:
+                logger.warning("Missing embedding for chunk", chunk_id=str(item.chunk.id))
                 continue
 
-            # Store embedding ID in chunk
-            chunk.embedding_id = str(chunk.id)
-
-            vector_ids.append(str(chunk.id))
+            embedded_ids.append(item.chunk.id)
+            vector_ids.append(str(item.chunk.id))
             vectors.append(embedding)
-            payloads.append(
-                {
-                    "chunk_id": str(chunk.id),
-                    "document_id": str(document.id),
-                    "source_id": str(document.source_id),
-                    "content": chunk.content,
-                    "title": document.title,
-                    "url": document.url,
-                    "access_level": access_level,  # Store access level for filtering
-                    "metadata": chunk.metadata,
-                }
-            )
+            payloads.append(item.payload)
 
         # Store in vector database
         if vector_ids:
@@ -401,12 +494,17 @@ class IngestionService:
                 payloads=payloads,
             )
 
+            # Record embedding IDs in one UPDATE (copied chunks are not session-tracked)
+            await self.chunk_repo.mark_embedded(embedded_ids)
+
             logger.debug(
                 "Chunks stored in vector DB",
                 count=len(vector_ids),
-                document_id=str(document.id),
+                documents=len({p.document_id for p in pending}),
             )
 
+        return len(vector_ids)
+
     async def close(self) -> None:
         """Close connections."""
         if self.embedder:
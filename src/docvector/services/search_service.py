@@ -1,11 +1,15 @@
 """Search service."""
 
-from typing import Dict, List, Optional
+import asyncio
+import logging
+from typing import Dict, List, Optional, Tuple
 
+from docvector.cache import QueryCache, RedisCache
 from docvector.core import DocVectorException, get_logger, settings
-from docvector.embeddings import BaseEmbedder, LocalEmbedder, OpenAIEmbedder
+from docvector.embeddings import BaseEmbedder, OpenAIEmbedder, get_local_embedder
 from docvector.search import HybridSearch, VectorSearch
 from docvector.search.reranker import MultiStageReranker
+from docvector.search.vector_search import SearchResultItem
 from docvector.utils.token_utils import TokenLimiter
 from docvector.vectordb import BaseVectorDB, QdrantVectorDB
 
@@ -17,8 +21,14 @@ class SearchService:
     Search service - orchestrates search operations.
     """
 
-    def __init__(self):
-        """Initialize search service."""
+    def __init__(self, redis_cache: Optional[RedisCache] = None):
+        """
+        Initialize search service.
+
+        Args:
+            redis_cache: Optional Redis cache used to store query embeddings
+        """
+        self.redis_cache = redis_cache
         self.vectordb: Optional[BaseVectorDB] = None
         self.embedder: Optional[BaseEmbedder] = None
         self.vector_search: Optional[VectorSearch] = None
@@ -26,6 +36,9 @@ class SearchService:
         self.reranker: MultiStageReranker = MultiStageReranker()
         self.token_limiter: TokenLimiter = TokenLimiter()
 
+        # Searches currently running, keyed like the query cache (single-flight)
+        self._inflight: Dict[Tuple, "asyncio.Task[List[Dict]]"] = {}
+
     async def initialize(self) -> None:
         """Initialize search components."""
         if self.vector_search is not None:
@@ -41,7 +54,8 @@ class SearchService:
         if settings.embedding_provider == "openai":
             self.embedder = OpenAIEmbedder()
         else:
-            self.embedder = LocalEmbedder()
+            # Shared across services so the model loads once per process
+            self.embedder = get_local_embedder()
 
         await self.embedder.initialize()
 
@@ -49,6 +63,7 @@ class SearchService:
         self.vector_search = VectorSearch(
             vectordb=self.vectordb,
             embedder=self.embedder,
+            embedding_cache=self.redis_cache,
         )
 
         self.hybrid_search = HybridSearch(
@@ -81,7 +96,56 @@ class SearchService:
 
         Returns:
             List of search results as dicts
+
+        Concurrent calls with identical parameters share one backend search.
         """
+        key = QueryCache.make_key(
+            query=query,
+            limit=limit,
+            search_type=search_type,
+            filters=filters,
+            score_threshold=score_threshold,
+            use_reranking=use_reranking,
+            max_tokens=max_tokens,
+        )
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._search(
+                    query=query,
+                    limit=limit,
+                    search_type=search_type,
+                    filters=dict(filters) if filters else None,
+                    score_threshold=score_threshold,
+                    use_reranking=use_reranking,
+                    max_tokens=max_tokens,
+                )
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._release_inflight(key, done))
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Joining in-flight search", query=query[:50])
+
+        # Shield so one cancelled caller doesn't cancel the search for the others
+        return await asyncio.shield(task)
+
+    def _release_inflight(self, key: Tuple, task: "asyncio.Task[List[Dict]]") -> None:
+        """Drop a finished search from the in-flight map."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _search(
+        self,
+        query: str,
+        limit: int,
+        search_type: str,
+        filters: Optional[Dict],
+        score_threshold: Optional[float],
+        use_reranking: bool,
+        max_tokens: Optional[int],
+    ) -> List[Dict]:
+        """Run a search against the backend (see search())."""
         await self.initialize()
 
         logger.info("Performing search", query=query[:50], type=search_type)
@@ -120,6 +184,103 @@ class SearchService:
                 score_threshold=score_threshold,
             )
 
+        return self._postprocess(
+            query=query,
+            results=results,
+            limit=limit,
+            topic_filter=topic_filter,
+            use_reranking=use_reranking,
+            max_tokens=max_tokens,
+        )
+
+    async def search_batch(self, queries: List[Dict]) -> List[List[Dict]]:
+        """
+        Perform several searches with one embedding call and one vector DB
+        call per search type.
+
+        Args:
+            queries: Keyword arguments for search() (query, limit, search_type,
+                filters, score_threshold, use_reranking, max_tokens) per query
+
+        Returns:
+            One result list per query, in order
+        """
+        await self.initialize()
+
+        if not queries:
+            return []
+
+        logger.info("Performing batch search", queries=len(queries))
+
+        # Normalize parameters and pull out topic filters (applied after retrieval)
+        prepared = []
+        for q in queries:
+            filters = dict(q["filters"]) if q.get("filters") else None
+            topic_filter = filters.pop("topics", None) if filters else None
+            limit = q.get("limit", 10)
+            use_reranking = q.get("use_reranking", True)
+            prepared.append(
+                {
+                    "query": q["query"],
+                    "limit": limit,
+                    "fetch_limit": limit * 3 if (use_reranking or topic_filter) else limit,
+                    "search_type": q.get("search_type", "hybrid"),
+                    "filters": filters or None,
+                    "topic_filter": topic_filter,
+                    "score_threshold": q.get("score_threshold"),
+                    "use_reranking": use_reranking,
+                    "max_tokens": q.get("max_tokens"),
+                }
+            )
+
+        all_results: List[List[Dict]] = [[] for _ in prepared]
+
+        for is_vector in (True, False):
+            indexes = [
+                i for i, p in enumerate(prepared) if (p["search_type"] == "vector") == is_vector
+            ]
+            if not indexes:
+                continue
+
+            backend = self.vector_search if is_vector else self.hybrid_search
+            if backend is None:
+                raise DocVectorException(
+                    code="SERVICE_NOT_INITIALIZED",
+                    message="Search not initialized",
+                )
+
+            group = [prepared[i] for i in indexes]
+            batch_results = await backend.search_batch(
+                queries=[p["query"] for p in group],
+                limits=[p["fetch_limit"] for p in group],
+                filters=[p["filters"] for p in group],
+                score_thresholds=[p["score_threshold"] for p in group],
+            )
+
+            for i, p, results in zip(indexes, group, batch_results):
+                all_results[i] = self._postprocess(
+                    query=p["query"],
+                    results=results,
+                    limit=p["limit"],
+                    topic_filter=p["topic_filter"],
+                    use_reranking=p["use_reranking"],
+                    max_tokens=p["max_tokens"],
+                )
+
+        logger.info("Batch search completed", queries=len(prepared))
+
+        return all_results
+
+    def _postprocess(
+        self,
+        query: str,
+        results: List[SearchResultItem],
+        limit: int,
+        topic_filter: Optional[str],
+        use_reranking: bool,
+        max_tokens: Optional[int],
+    ) -> List[Dict]:
+        """Convert raw results to dicts and apply topic filter, reranking and token limits."""
         # Convert to dict
         results_dict = [
             {
@@ -1,16 +1,19 @@
 """Source management service."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from docvector.core import DocVectorException, get_logger
-from docvector.db.repositories import SourceRepository
+from docvector.db.repositories import DocumentRepository, SourceRepository
 from docvector.models import Source
 
 logger = get_logger(__name__)
 
+# Documents deleted per transaction when removing a source
+DELETE_BATCH_SIZE = 1000
+
 
 class SourceService:
     """Source management service."""
@@ -87,6 +90,15 @@ class SourceService:
         """List all sources."""
         return await self.repo.list_all(limit=limit, offset=offset)
 
+    async def list_source_rows(
+        self,
+        columns: List[str],
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict]:
+        """List sources as plain dicts (read-only, no ORM objects)."""
+        return await self.repo.list_all_rows(columns=columns, limit=limit, offset=offset)
+
     async def update_source(
         self,
         source_id: UUID,
@@ -118,6 +130,12 @@ class SourceService:
         """Delete source."""
         logger.info("Deleting source", source_id=str(source_id))
 
+        # Drop documents (and their chunks) in bounded transactions first so a
+        # large source isn't removed in one long-running cascade
+        await DocumentRepository(self.session).delete_by_source(
+            source_id, batch_size=DELETE_BATCH_SIZE
+        )
+
         success = await self.repo.delete(source_id)
         if success:
             await self.session.commit()
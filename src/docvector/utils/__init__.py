@@ -1,6 +1,7 @@
 """Utility functions and helpers."""
 
-from .hash_utils import compute_hash, compute_text_hash
+from .hash_utils import compute_hash, compute_text_digest, compute_text_hash
+from .id_utils import uuid7
 from .text_utils import (
     clean_text,
     count_tokens_approximate,
@@ -12,9 +13,11 @@ from .text_utils import (
 __all__ = [
     "compute_hash",
     "compute_text_hash",
+    "compute_text_digest",
     "clean_text",
     "normalize_whitespace",
     "remove_html_tags",
     "truncate_text",
     "count_tokens_approximate",
+    "uuid7",
 ]
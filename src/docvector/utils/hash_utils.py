@@ -37,3 +37,19 @@ def compute_text_hash(text: str) -> str:
         SHA256 hex digest
     """
     return compute_hash(text, algorithm="sha256")
+
+
+def compute_text_digest(text: str) -> bytes:
+    """
+    Compute the raw SHA256 digest of text content.
+
+    Same hash as compute_text_hash, but as 32 bytes instead of 64 hex
+    characters; this is what Document.content_hash stores.
+
+    Args:
+        text: Text content
+
+    Returns:
+        SHA256 digest bytes
+    """
+    return hashlib.sha256(text.encode("utf-8")).digest()
@@ -0,0 +1,48 @@
+"""Shared HTTP client for outbound API calls."""
+
+from typing import Optional
+
+import httpx
+
+from docvector.core import get_logger, settings
+
+logger = get_logger(__name__)
+
+# Global client instance (keep-alive pool shared by embedders and enrichers)
+_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get or create the shared HTTP client.
+
+    Reusing one pooled client amortizes TCP/TLS handshakes across requests,
+    and HTTP/2 multiplexes concurrent calls to the same host on one socket.
+
+    Returns:
+        httpx.AsyncClient instance
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_connections=settings.http_max_connections,
+                max_keepalive_connections=settings.http_max_keepalive_connections,
+            ),
+        )
+        logger.debug("Shared HTTP client created")
+
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+        logger.debug("Shared HTTP client closed")
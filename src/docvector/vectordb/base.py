@@ -96,6 +96,43 @@ class BaseVectorDB(ABC):
         """
         pass
 
+    async def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limits: List[int],
+        filters: List[Optional[Dict]],
+        score_thresholds: List[Optional[float]],
+    ) -> List[List[SearchResult]]:
+        """
+        Run several searches at once.
+
+        Backends with a native batch API should override this; the default
+        runs the searches one after another.
+
+        Args:
+            collection_name: Name of the collection
+            query_vectors: One query embedding per search
+            limits: Maximum number of results per search
+            filters: Filter conditions per search
+            score_thresholds: Minimum similarity score per search
+
+        Returns:
+            One result list per query vector, in order
+        """
+        return [
+            await self.search(
+                collection_name=collection_name,
+                query_vector=vector,
+                limit=limit,
+                filter=filter_,
+                score_threshold=threshold,
+            )
+            for vector, limit, filter_, threshold in zip(
+                query_vectors, limits, filters, score_thresholds
+            )
+        ]
+
     @abstractmethod
     async def delete(
         self,
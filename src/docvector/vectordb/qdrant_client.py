@@ -108,14 +108,23 @@ class QdrantVectorDB(BaseVectorDB):
             distance=distance,
         )
 
+        # Binary quantization keeps 1-bit codes in RAM (32x smaller than float32);
+        # full vectors stay on disk and are only read to rescore top candidates
+        quantization_config = None
+        if settings.qdrant_binary_quantization:
+            quantization_config = models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=True),
+            )
+
         try:
             await self.client.create_collection(
                 collection_name=collection_name,
                 vectors_config=models.VectorParams(
                     size=vector_size,
                     distance=distance_metric,
+                    # Without quantization every search reads the full vectors
+                    on_disk=settings.qdrant_binary_quantization and settings.qdrant_on_disk_vectors,
                 ),
-                # Enable on-disk storage for large collections
                 # Lower indexing threshold to enable HNSW for smaller collections
                 optimizers_config=models.OptimizersConfigDiff(
                     indexing_threshold=100,  # Build HNSW index after 100 vectors
@@ -123,8 +132,9 @@ class QdrantVectorDB(BaseVectorDB):
                 # HNSW index configuration
                 hnsw_config=models.HnswConfigDiff(
                     m=16,  # Number of edges per node
-                    ef_construct=100,  # Construction time/accuracy trade-off
+                    ef_construct=settings.qdrant_hnsw_ef_construct,  # Construction time/accuracy trade-off
                 ),
+                quantization_config=quantization_config,
             )
             logger.info("Collection created successfully", collection=collection_name)
         except UnexpectedResponse as e:
@@ -219,6 +229,7 @@ class QdrantVectorDB(BaseVectorDB):
             limit=limit,
             query_filter=qdrant_filter,
             score_threshold=score_threshold,
+            search_params=self._search_params(),
             with_payload=True,
             with_vectors=False,
         )
@@ -241,6 +252,59 @@ class QdrantVectorDB(BaseVectorDB):
 
         return search_results
 
+    async def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limits: List[int],
+        filters: List[Optional[Dict]],
+        score_thresholds: List[Optional[float]],
+    ) -> List[List[SearchResult]]:
+        """Run several searches in one query_batch_points round-trip."""
+        await self.initialize()
+
+        if not query_vectors:
+            return []
+
+        logger.debug(
+            "Batch searching vectors",
+            collection=collection_name,
+            queries=len(query_vectors),
+        )
+
+        search_params = self._search_params()
+        requests = [
+            models.QueryRequest(
+                query=vector,
+                limit=limit,
+                filter=self._build_filter(filter_) if filter_ else None,
+                score_threshold=threshold,
+                params=search_params,
+                with_payload=True,
+                with_vector=False,
+            )
+            for vector, limit, filter_, threshold in zip(
+                query_vectors, limits, filters, score_thresholds
+            )
+        ]
+
+        responses = await self.client.query_batch_points(
+            collection_name=collection_name,
+            requests=requests,
+        )
+
+        return [
+            [
+                SearchResult(
+                    id=str(result.id),
+                    score=result.score,
+                    payload=result.payload or {},
+                )
+                for result in response.points
+            ]
+            for response in responses
+        ]
+
     async def delete(
         self,
         collection_name: str,
@@ -346,6 +410,18 @@ class QdrantVectorDB(BaseVectorDB):
             self.client = None
             logger.info("Qdrant client closed")
 
+    def _search_params(self) -> Optional[models.SearchParams]:
+        """Search params that rescore quantized candidates with full vectors."""
+        if not settings.qdrant_binary_quantization:
+            return None
+
+        return models.SearchParams(
+            quantization=models.QuantizationSearchParams(
+                rescore=True,
+                oversampling=settings.qdrant_search_oversampling,
+            ),
+        )
+
     def _build_filter(self, filter_dict: Dict) -> models.Filter:
         """
         Build Qdrant filter from dictionary.
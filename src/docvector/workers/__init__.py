@@ -0,0 +1,15 @@
+"""Background workers."""
+
+from .ingest_worker import (
+    WorkerSettings,
+    ingest_source_job,
+    purge_pow_challenges_periodically,
+    run_source_ingestion,
+)
+
+__all__ = [
+    "WorkerSettings",
+    "ingest_source_job",
+    "purge_pow_challenges_periodically",
+    "run_source_ingestion",
+]
@@ -0,0 +1,137 @@
+"""
+arq worker for source ingestion and periodic maintenance.
+
+Run separately from the API so crawling, parsing and embedding never share
+the request event loop. The API only queues jobs when ingest_use_worker is
+enabled:
+
+    arq docvector.workers.ingest_worker.WorkerSettings
+"""
+
+import asyncio
+from typing import Dict, Optional
+from uuid import UUID
+
+from arq import cron
+from arq.connections import RedisSettings
+
+from docvector.cache import SEARCH_CACHE_VERSION_KEY, RedisCache
+from docvector.core import DocVectorException, get_logger, settings, setup_logging
+from docvector.db import close_db, get_db_session
+from docvector.db.repositories import ProofOfWorkRepository, SourceRepository
+from docvector.embeddings import close_local_embedders
+from docvector.services import IngestionService
+from docvector.utils.http_client import close_http_client
+
+logger = get_logger(__name__)
+
+
+async def run_source_ingestion(
+    source_id: UUID,
+    access_level: str = "private",
+    batch_size: Optional[int] = None,
+) -> Dict:
+    """
+    Ingest a source using a dedicated database session.
+
+    The request-scoped session is closed once the response is sent, so
+    background ingestion must never reuse it.
+
+    Args:
+        source_id: Source ID to ingest
+        access_level: 'public' or 'private'
+        batch_size: Chunks to embed per provider call
+
+    Returns:
+        Ingestion statistics
+    """
+    async with get_db_session() as session:
+        source_repo = SourceRepository(session)
+        source = await source_repo.get_by_id(source_id)
+
+        if not source:
+            raise DocVectorException(
+                code="NOT_FOUND",
+                message="Source not found",
+                details={"source_id": str(source_id)},
+            )
+
+        ingestion_service = IngestionService(session, embedding_batch_size=batch_size)
+        try:
+            return await ingestion_service.ingest_source(
+                source=source,
+                access_level=access_level,
+            )
+        finally:
+            await ingestion_service.close()
+
+
+async def ingest_source_job(
+    ctx: Dict,
+    source_id: str,
+    access_level: str = "private",
+    batch_size: Optional[int] = None,
+) -> Dict:
+    """arq job: ingest all documents from a source."""
+    logger.info("Ingestion job started", job_id=ctx.get("job_id"), source_id=source_id)
+    try:
+        return await run_source_ingestion(
+            source_id=UUID(source_id),
+            access_level=access_level,
+            batch_size=batch_size,
+        )
+    finally:
+        # Documents are committed as they are ingested, so even a failed job
+        # changes search results; bump the generation the API caches check
+        await ctx["redis_cache"].incr(SEARCH_CACHE_VERSION_KEY)
+
+
+async def purge_pow_challenges_job(ctx: Dict) -> int:
+    """arq cron job: delete proof-of-work challenges expired over a day ago."""
+    async with get_db_session() as session:
+        deleted = await ProofOfWorkRepository(session).purge_expired()
+
+    if deleted:
+        logger.info("Purged expired PoW challenges", count=deleted)
+    return deleted
+
+
+async def purge_pow_challenges_periodically(interval: float = 3600) -> None:
+    """Run purge_pow_challenges_job every interval seconds until cancelled.
+
+    Used by the API in place of the worker's cron when no worker runs.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await purge_pow_challenges_job({})
+        except Exception as e:
+            logger.warning("PoW challenge purge failed", error=str(e))
+
+
+async def startup(ctx: Dict) -> None:
+    """Configure logging when the worker starts (the API does so in its lifespan)."""
+    setup_logging()
+    redis_cache = RedisCache()
+    await redis_cache.initialize()
+    ctx["redis_cache"] = redis_cache
+
+
+async def shutdown(ctx: Dict) -> None:
+    """Release pooled connections and loaded models when the worker exits."""
+    await ctx["redis_cache"].close()
+    await close_local_embedders()
+    await close_http_client()
+    await close_db()
+
+
+class WorkerSettings:
+    """arq worker configuration."""
+
+    functions = [ingest_source_job]
+    cron_jobs = [cron(purge_pow_challenges_job, minute=0)]  # Hourly
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = RedisSettings.from_dsn(settings.redis_url)
+    max_jobs = settings.ingest_worker_max_jobs
+    job_timeout = settings.ingest_job_timeout
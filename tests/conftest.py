@@ -3,13 +3,23 @@
 import asyncio
 from typing import AsyncGenerator, Generator
 
+import numpy as np
 import pytest
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker
 
 from docvector.models import Base
 
 
+# Render PostgreSQL-only column types as JSON so the schema builds on SQLite
+@compiles(ARRAY, "sqlite")
+@compiles(JSONB, "sqlite")
+def _compile_json_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
 # Event loop fixture for async tests
 @pytest.fixture(scope="session")
 def event_loop() -> Generator:
@@ -169,8 +179,12 @@ def mock_qdrant_client(mocker):
 def mock_embedder(mocker):
     """Mock embedder."""
     mock = mocker.AsyncMock()
-    mock.embed = mocker.AsyncMock(return_value=[[0.1, 0.2, 0.3, 0.4] * 96])
-    mock.embed_query = mocker.AsyncMock(return_value=[0.1, 0.2, 0.3, 0.4] * 96)
+    mock.embed = mocker.AsyncMock(
+        return_value=np.array([[0.1, 0.2, 0.3, 0.4] * 96], dtype=np.float32)
+    )
+    mock.embed_query = mocker.AsyncMock(
+        return_value=np.array([0.1, 0.2, 0.3, 0.4] * 96, dtype=np.float32)
+    )
     mock.get_dimension = mocker.Mock(return_value=384)
     mock.initialize = mocker.AsyncMock()
     mock.close = mocker.AsyncMock()
@@ -0,0 +1,87 @@
+"""Tests for core configuration and logging helpers."""
+
+import logging
+
+import pytest
+from pydantic import ValidationError
+
+from docvector import core
+from docvector.core import (
+    DocVectorException,
+    get_billing_settings,
+    get_logger,
+    get_settings,
+    settings,
+)
+
+
+class TestSettings:
+    """Test settings loading."""
+
+    def test_get_settings_returns_global_instance(self):
+        """Test settings are parsed once and shared."""
+        assert get_settings() is settings
+        assert get_settings() is get_settings()
+
+    def test_settings_are_frozen(self):
+        """Test settings can't be reassigned, so cached values stay valid."""
+        assert settings.is_production is settings.is_production
+
+        with pytest.raises(ValidationError):
+            settings.environment = "production"
+
+    def test_billing_settings_are_separate(self, monkeypatch):
+        """Test billing fields load lazily from their own settings group."""
+        monkeypatch.setenv("DOCVECTOR_PADDLE_ENVIRONMENT", "production")
+        get_billing_settings.cache_clear()
+
+        try:
+            assert get_billing_settings().paddle_environment == "production"
+            assert not hasattr(settings, "paddle_environment")
+        finally:
+            get_billing_settings.cache_clear()
+
+
+class TestLogging:
+    """Test structured logger helpers."""
+
+    def test_get_logger_is_cached(self):
+        """Test the same wrapper is returned for a logger name."""
+        assert get_logger("docvector.test") is get_logger("docvector.test")
+        assert get_logger("docvector.test") is not get_logger("docvector.other")
+
+    def test_setup_logging_is_idempotent(self, monkeypatch, mocker):
+        """Test handlers are only installed on the first call."""
+        basic_config = mocker.patch.object(logging, "basicConfig")
+        monkeypatch.setattr(core, "_logging_configured", False)
+
+        core.setup_logging()
+        core.setup_logging("DEBUG")
+
+        basic_config.assert_called_once()
+
+    def test_disabled_level_skips_formatting(self, mocker):
+        """Test messages below the logger level are not formatted."""
+        log = get_logger("docvector.test.levels")
+        mocker.patch.object(log._logger, "isEnabledFor", return_value=False)
+        format_message = mocker.spy(log, "_format_message")
+
+        log.debug("not emitted", value=1)
+
+        format_message.assert_not_called()
+
+
+class TestDocVectorException:
+    """Test the base exception."""
+
+    def test_to_dict(self):
+        """Test the serialized error shape and that it is reused."""
+        exc = DocVectorException(code="NOT_FOUND", message="Missing", details={"id": "1"})
+
+        assert exc.to_dict() == {
+            "error": "NOT_FOUND",
+            "message": "Missing",
+            "details": {"id": "1"},
+        }
+        assert exc.to_dict() is exc.to_dict()
+        assert DocVectorException().to_dict()["error"] == "UNKNOWN_ERROR"
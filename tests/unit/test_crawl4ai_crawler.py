@@ -0,0 +1,103 @@
+"""Tests for Crawl4AI crawler helpers."""
+
+from types import SimpleNamespace
+from urllib.robotparser import RobotFileParser
+
+import pytest
+
+from docvector.ingestion.crawl4ai_crawler import Crawl4AICrawler, _RobotsRules
+
+USER_AGENT = "DocVector"
+
+URLS = [
+    "https://example.com/",
+    "https://example.com/docs/intro",
+    "https://example.com/docs/private/keys",
+    "https://example.com/admin",
+    "https://example.com/admin/users?page=2",
+    "https://example.com/search?q=a%20b",
+    "https://example.com/*",
+    "https://example.com/%7Euser/page",
+]
+
+ROBOTS_FILES = [
+    "User-agent: *\nDisallow: /admin\n",
+    "User-agent: *\nDisallow: *\n",
+    "User-agent: *\nDisallow: /\n",
+    "User-agent: *\nDisallow:\n",
+    "User-agent: *\nAllow: /docs/private/public\nDisallow: /docs/private\nDisallow: /search\n",
+    "User-agent: DocVector\nDisallow: /docs\n\nUser-agent: *\nDisallow: /admin\n",
+    "User-agent: OtherBot\nDisallow: /\n",
+    "User-agent: *\nDisallow: /~user\n",
+]
+
+
+@pytest.mark.parametrize("robots_txt", ROBOTS_FILES)
+def test_robots_rules_match_robotfileparser(robots_txt):
+    """Test that compiled rules give the same verdicts as RobotFileParser."""
+    parser = RobotFileParser()
+    parser.parse(robots_txt.splitlines())
+    rules = _RobotsRules(parser, USER_AGENT)
+
+    for url in URLS:
+        assert rules.can_fetch(url) == parser.can_fetch(USER_AGENT, url), url
+
+
+def test_robots_rules_star_path_matches_all():
+    """Test that a literal "*" rule path blocks everything, as RuleLine.applies_to does."""
+    parser = RobotFileParser()
+    parser.parse(["User-agent: *", "Disallow: /admin"])
+    # parse() percent-quotes paths, so set the raw "*" that applies_to special-cases
+    parser.default_entry.rulelines[0].path = "*"
+    rules = _RobotsRules(parser, USER_AGENT)
+
+    for url in URLS:
+        assert rules.can_fetch(url) == parser.can_fetch(USER_AGENT, url) is False, url
+
+
+class FakeSiteCrawler:
+    """Stand-in for AsyncWebCrawler serving a site of numbered pages."""
+
+    def __init__(self, pages: int, failing: set):
+        self.pages = pages
+        self.failing = failing
+
+    async def arun(self, url, config):
+        path = url.rsplit("/", 1)[1]
+        if path in self.failing:
+            return SimpleNamespace(success=False)
+
+        # The home page links to every page, each page to the next five
+        first = int(path[1:]) + 1 if path else 0
+        last = self.pages if not path else min(first + 5, self.pages)
+        return SimpleNamespace(
+            success=True,
+            markdown=SimpleNamespace(raw_markdown=f"page {path}"),
+            metadata={"title": path},
+            status_code=200,
+            links={"internal": [{"href": f"/p{i}"} for i in range(first, last)]},
+        )
+
+
+@pytest.mark.asyncio
+async def test_crawl_bfs_failed_pages_do_not_use_budget(mocker):
+    """Test that failed fetches leave room in max_pages for other pages."""
+    mocker.patch("docvector.ingestion.crawl4ai_crawler.CrawlerRunConfig")
+    mocker.patch("docvector.ingestion.crawl4ai_crawler.CacheMode")
+    crawler = Crawl4AICrawler(concurrent_requests=1, respect_robots=False)
+    site = FakeSiteCrawler(pages=40, failing={f"p{i}" for i in range(5)})
+
+    documents = [
+        doc
+        async for doc in crawler._crawl_bfs(
+            crawler=site,
+            start_url="https://example.com/",
+            max_pages=10,
+            max_depth=3,
+            allowed_domains=["example.com"],
+            respect_robots=False,
+        )
+    ]
+
+    assert len(documents) == 10
+    assert len({doc.url for doc in documents}) == 10
@@ -0,0 +1,89 @@
+"""Tests for the Redis-backed embedding cache."""
+
+import numpy as np
+import pytest
+
+from docvector.embeddings import EmbeddingCache
+from docvector.embeddings.cache import _local_embeddings, _LocalEmbeddingLRU
+
+
+class TestEmbeddingCache:
+    """Test EmbeddingCache serialization and local LRU."""
+
+    @pytest.fixture(autouse=True)
+    def clear_local(self):
+        """Start every test with an empty process-wide LRU."""
+        _local_embeddings.clear()
+        yield
+        _local_embeddings.clear()
+
+    @pytest.fixture
+    def cache(self, mocker):
+        """Create an embedding cache with a mocked Redis client."""
+        cache = EmbeddingCache()
+        cache.client = mocker.AsyncMock()
+        return cache
+
+    def test_serialize_roundtrip(self):
+        """Test embeddings survive the float32 byte encoding."""
+        data = EmbeddingCache._serialize([0.5, -1.0, 0.25])
+
+        assert len(data) == 12
+        assert EmbeddingCache._deserialize(data) == [0.5, -1.0, 0.25]
+
+    @pytest.mark.asyncio
+    async def test_get_many_reads_redis_once(self, cache):
+        """Test repeated lookups are served from the in-process LRU."""
+        cache.client.mget.return_value = [EmbeddingCache._serialize([1.0, 2.0]), None]
+
+        first = await cache.get_many(["a", "b"], "model")
+        second = await cache.get_many(["a"], "model")
+
+        assert first == {"a": [1.0, 2.0]}
+        assert second == {"a": [1.0, 2.0]}
+        cache.client.mget.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_set_populates_local_cache(self, cache):
+        """Test a cached embedding is readable without a Redis round trip."""
+        await cache.set("text", "model", [0.5, 0.5])
+
+        assert await cache.get("text", "model") == [0.5, 0.5]
+        cache.client.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_set_many_stores_decoded_copies(self, cache, mocker):
+        """Test local hits return lists, not views into the caller's batch."""
+        cache.client.pipeline = mocker.Mock()
+        batch = np.array([[0.5, 1.0], [2.0, -1.0]], dtype=np.float16)
+
+        await cache.set_many(["a", "b"], "model", batch)
+        batch[:] = 0
+
+        assert await cache.get_many(["a", "b"], "model") == {
+            "a": [0.5, 1.0],
+            "b": [2.0, -1.0],
+        }
+        cache.client.mget.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_local_cache_shared_across_instances(self, cache, mocker):
+        """Test embeddings cached by one instance are local hits for the next."""
+        await cache.set("text", "model", [0.5, 0.5])
+        other = EmbeddingCache()
+        other.client = mocker.AsyncMock()
+
+        assert await other.get_many(["text"], "model") == {"text": [0.5, 0.5]}
+        other.client.mget.assert_not_called()
+
+    def test_local_lru_stores_packed_bytes_and_evicts(self):
+        """Test the LRU keeps float32 payloads and drops the oldest entry."""
+        lru = _LocalEmbeddingLRU(max_size=2)
+        lru.set("a", EmbeddingCache._serialize([1.0]))
+        lru.set("b", EmbeddingCache._serialize([2.0]))
+        lru.get("a")  # "b" becomes least recently used
+        lru.set("c", EmbeddingCache._serialize([3.0]))
+
+        assert lru.get("b") is None
+        assert lru.get("a") == np.float32(1.0).tobytes()
+        assert lru.get("c") is not None
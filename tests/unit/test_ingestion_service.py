@@ -0,0 +1,185 @@
+"""Tests for ingestion service embedding batches."""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from docvector.ingestion.base import FetchedDocument
+from docvector.models import Document
+from docvector.services.ingestion_service import IngestionService
+
+
+def _assign_ids(chunks):
+    """Stand-in for copy_many: give chunks ids as the database would."""
+    for chunk in chunks:
+        chunk.id = uuid4()
+    return chunks
+
+
+def _text_chunks(count):
+    return [
+        SimpleNamespace(
+            index=i,
+            content=f"chunk {i}",
+            length=7,
+            start_char=0,
+            end_char=7,
+            metadata={},
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def mock_session():
+    """Create a mock async session."""
+    return AsyncMock()
+
+
+@pytest.fixture
+def ingestion_service(mock_session, mock_embedder):
+    """Create an IngestionService with mocked components."""
+    service = IngestionService(mock_session, embedding_batch_size=100)
+    service.embedder = mock_embedder
+    service.vectordb = AsyncMock()
+    service.chunk_repo.copy_many = AsyncMock(side_effect=_assign_ids)
+    service.chunk_repo.mark_embedded = AsyncMock()
+    return service
+
+
+def _document():
+    return Document(id=uuid4(), source_id=uuid4(), url="https://example.com", status="processing")
+
+
+class TestEmbeddingBatch:
+    """Tests for deferred document completion."""
+
+    @pytest.mark.asyncio
+    async def test_flush_completes_documents(self, ingestion_service, mock_embedder):
+        """Test that a successful flush marks its documents completed."""
+        documents = [_document(), _document()]
+        for document in documents:
+            await ingestion_service._process_chunks(document, _text_chunks(2), "private")
+        mock_embedder.embed.return_value = np.ones((4, 4), dtype=np.float32)
+
+        stored = await ingestion_service.flush_embedding_batch()
+
+        assert stored == 4
+        assert [d.status for d in documents] == ["completed", "completed"]
+        ingestion_service.vectordb.upsert.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_fails_every_document(self, ingestion_service, mock_embedder):
+        """Test that a failed flush fails all documents in the batch."""
+        documents = [_document(), _document()]
+        for document in documents:
+            await ingestion_service._process_chunks(document, _text_chunks(2), "private")
+        mock_embedder.embed.side_effect = RuntimeError("provider down")
+
+        with pytest.raises(RuntimeError):
+            await ingestion_service.flush_embedding_batch()
+
+        assert [d.status for d in documents] == ["failed", "failed"]
+        assert all(d.error_message == "provider down" for d in documents)
+        ingestion_service.vectordb.upsert.assert_not_awaited()
+        assert await ingestion_service.flush_embedding_batch() == 0
+
+    @pytest.mark.asyncio
+    async def test_document_not_completed_before_flush(self, ingestion_service):
+        """Test that a processed document waits for its chunks' flush."""
+        source = SimpleNamespace(id=uuid4(), name="Test Source")
+        fetched = FetchedDocument(
+            url="https://example.com/page",
+            content=b"<html><body>Page</body></html>",
+            mime_type="text/html",
+        )
+        parsed = SimpleNamespace(title="Page", content="Page", metadata={}, language="en")
+        ingestion_service.pipeline = AsyncMock()
+        ingestion_service.pipeline.process.return_value = (parsed, _text_chunks(1))
+
+        with patch.object(
+            ingestion_service.document_repo, "get_by_content_hash", new_callable=AsyncMock
+        ) as mock_get, patch.object(
+            ingestion_service.document_repo, "create", new_callable=AsyncMock
+        ) as mock_create:
+            mock_get.return_value = None
+            mock_create.side_effect = lambda document: _assign_ids([document])[0]
+
+            document = await ingestion_service._process_document(
+                source=source, fetched_doc=fetched, access_level="private"
+            )
+
+        assert document.status == "processing"
+
+        await ingestion_service.flush_embedding_batch()
+
+        assert document.status == "completed"
+
+    @pytest.mark.asyncio
+    async def test_reprocessed_failed_document_clears_error(self, ingestion_service):
+        """Test that a previously failed document loses its old error once reprocessed."""
+        source = SimpleNamespace(id=uuid4(), name="Test Source")
+        fetched = FetchedDocument(
+            url="https://example.com/page",
+            content=b"<html><body>Page</body></html>",
+            mime_type="text/html",
+        )
+        parsed = SimpleNamespace(title="Page", content="Page", metadata={}, language="en")
+        ingestion_service.pipeline = AsyncMock()
+        ingestion_service.pipeline.process.return_value = (parsed, _text_chunks(1))
+        ingestion_service.chunk_repo.delete_by_document = AsyncMock()
+        failed = _document()
+        failed.status = "failed"
+        failed.error_message = "provider down"
+
+        with patch.object(
+            ingestion_service.document_repo, "get_by_content_hash", new_callable=AsyncMock
+        ) as mock_get:
+            mock_get.return_value = failed
+
+            document = await ingestion_service._process_document(
+                source=source, fetched_doc=fetched, access_level="private"
+            )
+
+        assert document is failed
+        assert document.status == "processing"
+        assert document.error_message is None
+        ingestion_service.chunk_repo.delete_by_document.assert_awaited_once_with(failed.id)
+
+        await ingestion_service.flush_embedding_batch()
+
+        assert document.status == "completed"
+        assert document.error_message is None
+
+
+class TestIngestSource:
+    """Tests for streamed source ingestion."""
+
+    @pytest.mark.asyncio
+    async def test_commits_after_each_document(self, ingestion_service, mock_session):
+        """Test that no transaction stays open across the crawl."""
+        pages = [
+            FetchedDocument(url=f"https://example.com/{i}", content=b"page", mime_type="text/html")
+            for i in range(3)
+        ]
+
+        async def fetch_stream(config):
+            for page in pages:
+                # Each page must arrive with the previous one committed
+                assert mock_session.commit.await_count == pages.index(page)
+                yield page
+
+        ingestion_service.crawler = SimpleNamespace(fetch_stream=fetch_stream)
+        ingestion_service._process_document = AsyncMock(
+            side_effect=[None, RuntimeError("parse error"), None]
+        )
+        source = SimpleNamespace(id=uuid4(), name="Test Source", type="web", config={})
+
+        stats = await ingestion_service.ingest_source(source)
+
+        assert stats["processed"] == 2
+        assert stats["errors"] == 1
+        assert mock_session.commit.await_count == 4
@@ -0,0 +1,35 @@
+"""Tests for in-place embedding normalization."""
+
+import numpy as np
+
+from docvector.embeddings._normalize import l2_normalize_
+
+
+class TestL2Normalize:
+    """Test l2_normalize_."""
+
+    def test_rows_have_unit_norm(self):
+        """Test every row is scaled to length 1 in place."""
+        x = np.array([[3.0, 4.0], [1.0, 0.0]], dtype=np.float32)
+
+        result = l2_normalize_(x)
+
+        assert result is x
+        np.testing.assert_allclose(x, [[0.6, 0.8], [1.0, 0.0]], rtol=1e-6)
+
+    def test_float16_does_not_overflow(self):
+        """Test large float16 values are normalized without inf/nan."""
+        x = np.full((1, 384), 100.0, dtype=np.float16)
+
+        l2_normalize_(x)
+
+        assert np.isfinite(x).all()
+        np.testing.assert_allclose(np.linalg.norm(x.astype(np.float32)), 1.0, rtol=1e-3)
+
+    def test_zero_row_left_unchanged(self):
+        """Test all-zero rows don't produce nan."""
+        x = np.zeros((2, 3), dtype=np.float32)
+
+        l2_normalize_(x)
+
+        assert not x.any()
@@ -0,0 +1,94 @@
+"""Tests for the in-process search query cache."""
+
+import pytest
+
+from docvector.cache import QueryCache
+
+
+class FakeRedisCache:
+    """Minimal stand-in for RedisCache's counter operations."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+
+class TestQueryCache:
+    """Test QueryCache LRU + TTL behaviour."""
+
+    @pytest.mark.asyncio
+    async def test_get_miss_then_hit(self):
+        """Test a stored value is returned on subsequent lookups."""
+        cache = QueryCache(max_size=4, default_ttl=60)
+
+        assert await cache.get("q") is None
+        await cache.set("q", [{"chunk_id": "1"}])
+        assert await cache.get("q") == [{"chunk_id": "1"}]
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_is_dropped(self):
+        """Test entries past their TTL are treated as misses."""
+        cache = QueryCache(max_size=4, default_ttl=60)
+
+        await cache.set("q", "value", ttl=-1)
+        assert await cache.get("q") is None
+        assert cache.stats()["size"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """Test least recently used entry is evicted when full."""
+        cache = QueryCache(max_size=2, default_ttl=60)
+
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")  # "b" becomes least recently used
+        await cache.set("c", 3)
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == 1
+        assert await cache.get("c") == 3
+
+    @pytest.mark.asyncio
+    async def test_invalidate(self):
+        """Test invalidating a single key and the whole cache."""
+        cache = QueryCache()
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+
+        assert await cache.invalidate("a") == 1
+        assert await cache.invalidate("missing") == 0
+        assert await cache.invalidate() == 1
+        assert cache.stats()["size"] == 0
+
+    def test_make_key_is_order_independent(self):
+        """Test filter key ordering does not change the cache key."""
+        key1 = QueryCache.make_key("q", 10, "hybrid", {"a": 1, "b": [1, 2]}, None, False, None)
+        key2 = QueryCache.make_key("q", 10, "hybrid", {"b": [1, 2], "a": 1}, None, False, None)
+
+        assert key1 == key2
+        assert hash(key1) == hash(key2)
+
+    @pytest.mark.asyncio
+    async def test_invalidate_is_shared_through_redis(self):
+        """Test that clearing one process's cache invalidates the others."""
+        redis_cache = FakeRedisCache()
+        cache = QueryCache(redis_cache=redis_cache)
+        other = QueryCache(redis_cache=redis_cache)
+        await cache.set("q", 1)
+        await other.set("q", 2)
+
+        await other.invalidate()
+
+        assert await cache.get("q") is None
+        await cache.set("q", 3)
+        assert await cache.get("q") == 3
@@ -0,0 +1,169 @@
+"""Tests for database repositories."""
+
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+
+from docvector.db.repositories import (
+    ChunkRepository,
+    DocumentRepository,
+    ProofOfWorkRepository,
+)
+from docvector.db.repositories.chunk_repo import COPY_THRESHOLD
+from docvector.models import Chunk, Document, ProofOfWorkChallenge, Source
+
+
+def _challenge(expires_in: timedelta) -> ProofOfWorkChallenge:
+    return ProofOfWorkChallenge(
+        challenge=uuid4().hex,
+        action="question",
+        agent_id="agent-1",
+        difficulty=4,
+        expires_at=datetime.now(timezone.utc) + expires_in,
+        used=False,
+    )
+
+
+async def _document(db_session, source=None) -> Document:
+    if source is None:
+        source = Source(name=f"source-{uuid4().hex}", type="web", config={})
+        db_session.add(source)
+    document = Document(source=source, url="https://example.com", content_hash=uuid4().bytes * 2)
+    db_session.add(document)
+    await db_session.flush()
+    return document
+
+
+def _chunks(document: Document, count: int) -> list:
+    return [
+        Chunk(document_id=document.id, index=i, content=f"chunk {i}", content_length=7)
+        for i in range(count)
+    ]
+
+
+class TestChunkRepository:
+    """Tests for chunk bulk insert and delete."""
+
+    @pytest.mark.asyncio
+    async def test_copy_many_empty(self, db_session, mocker):
+        """Test that an empty batch never touches the database."""
+        repo = ChunkRepository(db_session)
+        create_many = mocker.spy(repo, "create_many")
+
+        assert await repo.copy_many([]) == []
+        create_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_copy_many_below_threshold_uses_create_many(self, db_session, mocker):
+        """Test that small batches fall back to a batched INSERT."""
+        document = await _document(db_session)
+        repo = ChunkRepository(db_session)
+        create_many = mocker.spy(repo, "create_many")
+        chunks = _chunks(document, COPY_THRESHOLD - 1)
+
+        created = await repo.copy_many(chunks)
+
+        create_many.assert_awaited_once_with(chunks)
+        assert all(chunk.id is not None for chunk in created)
+        assert len(await repo.list_by_document(document.id)) == COPY_THRESHOLD - 1
+
+    @pytest.mark.asyncio
+    async def test_copy_many_falls_back_off_postgres(self, db_session, mocker):
+        """Test that COPY is only attempted on PostgreSQL."""
+        document = await _document(db_session)
+        repo = ChunkRepository(db_session)
+        create_many = mocker.spy(repo, "create_many")
+
+        await repo.copy_many(_chunks(document, COPY_THRESHOLD))
+
+        create_many.assert_awaited_once()
+        assert len(await repo.list_by_document(document.id)) == COPY_THRESHOLD
+
+    @pytest.mark.asyncio
+    async def test_delete_by_document(self, db_session, mocker):
+        """Test that an unbatched delete stays in the caller's transaction."""
+        document = await _document(db_session)
+        repo = ChunkRepository(db_session)
+        await repo.create_many(_chunks(document, 3))
+        commit = mocker.spy(db_session, "commit")
+
+        assert await repo.delete_by_document(document.id) == 3
+        commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("count,batch_size,batches", [(5, 2, 3), (4, 2, 3), (0, 2, 1)])
+    async def test_delete_by_document_batched(self, db_session, mocker, count, batch_size, batches):
+        """Test that the batched delete stops once a batch comes up short."""
+        document = await _document(db_session)
+        repo = ChunkRepository(db_session)
+        await repo.create_many(_chunks(document, count))
+        commit = mocker.spy(db_session, "commit")
+
+        assert await repo.delete_by_document(document.id, batch_size=batch_size) == count
+        assert commit.await_count == batches
+        assert await repo.list_by_document(document.id) == []
+
+
+class TestDocumentRepository:
+    """Tests for document bulk delete."""
+
+    @pytest.mark.asyncio
+    async def test_delete_by_source_batched(self, db_session, mocker):
+        """Test that the batched delete removes every document of the source."""
+        first = await _document(db_session)
+        for _ in range(4):
+            await _document(db_session, source=first.source)
+        other = await _document(db_session)
+        repo = DocumentRepository(db_session)
+        commit = mocker.spy(db_session, "commit")
+
+        assert await repo.delete_by_source(first.source_id, batch_size=2) == 5
+        assert commit.await_count == 3
+        assert await repo.get_by_id(other.id) is not None
+
+
+class TestProofOfWorkRepository:
+    """Tests for proof-of-work challenge claims."""
+
+    @pytest.mark.asyncio
+    async def test_claim_challenge_once(self, db_session):
+        """Test that a challenge can only be claimed a single time."""
+        challenge = _challenge(timedelta(minutes=5))
+        db_session.add(challenge)
+        await db_session.flush()
+        repo = ProofOfWorkRepository(db_session)
+
+        assert await repo.claim_challenge(challenge.challenge) is True
+        assert await repo.claim_challenge(challenge.challenge) is False
+
+    @pytest.mark.asyncio
+    async def test_claim_challenge_rejects_expired(self, db_session):
+        """Test that an expired challenge cannot be claimed."""
+        challenge = _challenge(timedelta(minutes=-5))
+        db_session.add(challenge)
+        await db_session.flush()
+        repo = ProofOfWorkRepository(db_session)
+
+        assert await repo.claim_challenge(challenge.challenge) is False
+
+    @pytest.mark.asyncio
+    async def test_claim_challenge_rejects_unknown(self, db_session):
+        """Test that an unknown challenge cannot be claimed."""
+        repo = ProofOfWorkRepository(db_session)
+
+        assert await repo.claim_challenge("unknown") is False
+
+    @pytest.mark.asyncio
+    async def test_purge_expired(self, db_session, mocker):
+        """Test that only long-expired challenges are purged, in batches."""
+        stale = [_challenge(timedelta(days=-2)) for _ in range(3)]
+        recent = _challenge(timedelta(hours=-1))
+        db_session.add_all([*stale, recent])
+        await db_session.flush()
+        repo = ProofOfWorkRepository(db_session)
+        commit = mocker.spy(db_session, "commit")
+
+        assert await repo.purge_expired(batch_size=2) == 3
+        assert commit.await_count == 2
+        assert await db_session.get(ProofOfWorkChallenge, recent.id, populate_existing=True)
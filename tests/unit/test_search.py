@@ -1,9 +1,12 @@
 """Tests for search functionality."""
 
+import asyncio
+
 import pytest
 
 from docvector.search import HybridSearch, VectorSearch
 from docvector.search.vector_search import SearchResultItem
+from docvector.services import SearchService
 
 
 class TestVectorSearch:
@@ -87,6 +90,32 @@ class TestVectorSearch:
         assert results[0].url == "https://example.com"
 
 
+    @pytest.mark.asyncio
+    async def test_query_embedding_cache(self, vector_search, mock_embedder):
+        """Test query vectors are stored once and reused from the cache."""
+        store = {}
+
+        class FakeCache:
+            async def get_bytes(self, key):
+                return store.get(key)
+
+            async def set_bytes(self, key, value, ttl=None):
+                store[key] = value
+                return True
+
+        vector_search.embedding_cache = FakeCache()
+
+        await vector_search.search(query="test query")
+        await vector_search.search(query="test query")
+
+        mock_embedder.embed_query.assert_called_once_with("test query")
+        assert len(store) == 1
+        assert next(iter(store)).startswith("emb:")
+
+        query_vector = vector_search.vectordb.search.call_args.kwargs["query_vector"]
+        assert query_vector == pytest.approx([0.1, 0.2, 0.3, 0.4] * 96, rel=1e-3)
+
+
 class TestHybridSearch:
     """Test hybrid search."""
 
@@ -192,3 +221,50 @@ class TestHybridSearch:
         # Should normalize to sum to 1
         assert hybrid.vector_weight == pytest.approx(0.4, rel=0.01)
         assert hybrid.keyword_weight == pytest.approx(0.6, rel=0.01)
+
+
+class TestSearchServiceSingleFlight:
+    """Test in-flight deduplication of identical searches."""
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_searches_share_one_call(self):
+        """Test concurrent identical queries hit the backend once."""
+        service = SearchService()
+        release = asyncio.Event()
+        calls = 0
+
+        async def fake_search(**kwargs):
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return [{"chunk_id": "chunk1"}]
+
+        service._search = fake_search
+
+        tasks = [asyncio.create_task(service.search("test query", limit=5)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert calls == 1
+        assert all(r == [{"chunk_id": "chunk1"}] for r in results)
+        assert service._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_different_queries_are_not_shared(self):
+        """Test distinct parameters run separate searches."""
+        service = SearchService()
+        calls = []
+
+        async def fake_search(**kwargs):
+            calls.append(kwargs["limit"])
+            return []
+
+        service._search = fake_search
+
+        await asyncio.gather(
+            service.search("test query", limit=5),
+            service.search("test query", limit=10),
+        )
+
+        assert sorted(calls) == [5, 10]
@@ -1,13 +1,17 @@
 """Tests for utility functions."""
 
+import time
+
 from docvector.utils import (
     clean_text,
     compute_hash,
+    compute_text_digest,
     compute_text_hash,
     count_tokens_approximate,
     normalize_whitespace,
     remove_html_tags,
     truncate_text,
+    uuid7,
 )
 
 
@@ -44,6 +48,13 @@ class TestHashUtils:
         assert isinstance(result, str)
         assert len(result) == 64
 
+    def test_compute_text_digest(self):
+        """Test raw digest matches the hex hash."""
+        result = compute_text_digest("test text")
+        assert isinstance(result, bytes)
+        assert len(result) == 32
+        assert result.hex() == compute_text_hash("test text")
+
 
 class TestTextUtils:
     """Test text processing utilities."""
@@ -147,3 +158,20 @@ class TestTextUtils:
         """Test token counting with empty text."""
         result = count_tokens_approximate("")
         assert result == 0
+
+
+class TestIdUtils:
+    """Test identifier utilities."""
+
+    def test_uuid7_version_and_variant(self):
+        """Test uuid7 produces RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_uuid7_is_time_ordered(self):
+        """Test later IDs sort after earlier ones."""
+        first = uuid7()
+        time.sleep(0.002)
+        second = uuid7()
+        assert first < second
@@ -61,6 +61,17 @@ class TestQdrantVectorDB:
 
         mock_qdrant_client.create_collection.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_create_collection_unquantized_by_default(self, vectordb, mock_qdrant_client):
+        """Test full-precision vectors stay in RAM unless quantization is enabled."""
+        await vectordb.initialize()
+        await vectordb.create_collection("test_collection", 384)
+
+        kwargs = mock_qdrant_client.create_collection.call_args.kwargs
+        assert kwargs["quantization_config"] is None
+        assert kwargs["vectors_config"].on_disk is False
+        assert vectordb._search_params() is None
+
     @pytest.mark.asyncio
     async def test_create_collection_already_exists(self, vectordb, mock_qdrant_client):
         """Test creating collection that already exists."""
@@ -158,6 +169,39 @@ class TestQdrantVectorDB:
         assert results[0].id == "result-1"
         assert results[0].score == 0.95
 
+    @pytest.mark.asyncio
+    async def test_search_batch(self, vectordb, mock_qdrant_client, mocker):
+        """Test batch search issues a single query_batch_points call."""
+        mock_result = mocker.Mock()
+        mock_result.id = "result-1"
+        mock_result.score = 0.9
+        mock_result.payload = {"content": "test"}
+
+        mock_qdrant_client.query_batch_points.return_value = [
+            mocker.Mock(points=[mock_result]),
+            mocker.Mock(points=[]),
+        ]
+
+        await vectordb.initialize()
+
+        results = await vectordb.search_batch(
+            collection_name="test",
+            query_vectors=[[0.1] * 384, [0.2] * 384],
+            limits=[5, 10],
+            filters=[{"access_level": "public"}, None],
+            score_thresholds=[None, 0.5],
+        )
+
+        mock_qdrant_client.query_batch_points.assert_called_once()
+        requests = mock_qdrant_client.query_batch_points.call_args.kwargs["requests"]
+        assert [r.limit for r in requests] == [5, 10]
+        assert requests[0].filter is not None
+        assert requests[1].filter is None
+
+        assert len(results) == 2
+        assert results[0][0].id == "result-1"
+        assert results[1] == []
+
     @pytest.mark.asyncio
     async def test_search_with_filter(self, vectordb, mock_qdrant_client):
         """Test searching with filters."""
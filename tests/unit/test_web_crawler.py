@@ -139,6 +139,29 @@ class TestWebCrawler:
             assert "headers" in doc.metadata
             assert doc.metadata["headers"]["Server"] == "TestServer"
 
+    @pytest.mark.asyncio
+    async def test_crawl_fetches_each_page_once(self, crawler):
+        """Test that crawled pages are not downloaded again."""
+        with aioresponses() as m:
+            m.get("https://example.com/sitemap.xml", status=404)
+            # Each mock answers a single request; a second fetch would fail
+            m.get(
+                "https://example.com",
+                status=200,
+                body=b'<html><head><title>Home</title></head><body><a href="/a">A</a></body></html>',
+                headers={"Content-Type": "text/html"},
+            )
+            m.get(
+                "https://example.com/a",
+                status=200,
+                body=b"<html><head><title>A</title></head><body>Page</body></html>",
+                headers={"Content-Type": "text/html"},
+            )
+
+            docs = await crawler.fetch({"start_url": "https://example.com"})
+
+            assert sorted(doc.title for doc in docs) == ["A", "Home"]
+
 
 class TestWebCrawlerInit:
     """Test web crawler initialization."""
@@ -164,3 +187,63 @@ class TestWebCrawlerInit:
         assert crawler.max_pages == 100
         assert crawler.concurrent_requests == 20
         assert crawler.user_agent == "CustomBot/1.0"
+
+    @pytest.mark.asyncio
+    async def test_session_uses_aiodns_resolver(self, mocker):
+        """Test that aiodns, when installed, backs the connector's DNS."""
+        import aiohttp
+
+        resolver = aiohttp.ThreadedResolver()
+        mocker.patch("docvector.ingestion.web_crawler.HAS_AIODNS", True)
+        mocker.patch("aiohttp.AsyncResolver", return_value=resolver)
+        crawler = WebCrawler()
+
+        await crawler._init_session()
+        try:
+            assert crawler.session.connector._resolver is resolver
+        finally:
+            await crawler.close()
+
+
+class TestExtractTitle:
+    """Test HTML title extraction."""
+
+    def test_regex_match_unescapes_entities(self):
+        """Test title found by the regex fast path."""
+        from docvector.ingestion.web_crawler import _extract_title
+
+        content = b"<html><head><TITLE lang='en'>A &amp; B\n</TITLE></head></html>"
+
+        assert _extract_title(content) == "A & B"
+
+    def test_missing_title(self):
+        """Test page without a title."""
+        from docvector.ingestion.web_crawler import _extract_title
+
+        assert _extract_title(b"<html><body>No title</body></html>") is None
+
+
+class TestCanonicalizeUrl:
+    """Test URL canonicalization for crawl deduplication."""
+
+    def test_variants_share_a_key(self):
+        """Test that equivalent URL spellings canonicalize identically."""
+        from docvector.ingestion.web_crawler import _canonicalize_url
+
+        variants = [
+            "https://Example.com/docs/",
+            "https://example.com:443/docs",
+            "https://example.com/docs#intro",
+            "https://example.com/docs?utm_source=newsletter",
+        ]
+
+        assert {_canonicalize_url(url) for url in variants} == {"https://example.com/docs"}
+
+    def test_keeps_content_query_params(self):
+        """Test that non-tracking query parameters are preserved."""
+        from docvector.ingestion.web_crawler import _canonicalize_url
+
+        assert (
+            _canonicalize_url("https://example.com/list?page=2&utm_medium=email")
+            == "https://example.com/list?page=2"
+        )